@@ -0,0 +1,103 @@
+"""
+Benchmark showing a flood of stream output in a console widget.
+
+One million lines are appended to a `ConsoleWidget` while it is executing,
+in messages of a few lines, as a kernel printing in a loop would send them.
+Messages are appended from a timer, so the event loop runs between them like
+it does when they come from the kernel. Besides the total time, the longest
+time the event loop was blocked is reported, which is how long the
+application can become unresponsive.
+
+Usage: python benchmarks/bench_stream_output.py [lines] [lines_per_message]
+"""
+
+import sys
+import time
+
+from qtpy import QtCore, QtWidgets
+
+from qtconsole.console_widget import ConsoleWidget
+
+
+class StreamFlood(QtCore.QObject):
+    """Append lines to a console widget from the event loop."""
+
+    def __init__(self, widget, lines, lines_per_message):
+        super().__init__()
+        self.widget = widget
+        self.lines = lines
+        self.lines_per_message = lines_per_message
+        self.sent = 0
+        self.flushes = 0
+        self.max_stall = 0.
+        self._last_tick = None
+
+        # Count the flushes of the pending output
+        flush = widget._flush_pending_stream
+
+        def counted_flush():
+            if widget._pending_insert_text:
+                self.flushes += 1
+            flush()
+
+        widget._flush_pending_stream = counted_flush
+
+        self._sender = QtCore.QTimer(self)
+        self._sender.setInterval(0)
+        self._sender.timeout.connect(self.send)
+
+        # Measures how long the event loop is blocked
+        self._ticker = QtCore.QTimer(self)
+        self._ticker.setInterval(5)
+        self._ticker.timeout.connect(self.tick)
+
+    def start(self):
+        self.t0 = time.perf_counter()
+        self._last_tick = self.t0
+        self._ticker.start()
+        self._sender.start()
+
+    def send(self):
+        n = min(self.lines_per_message, self.lines - self.sent)
+        self.widget._append_plain_text(''.join(
+            'Line {} of the output of a logger\n'.format(self.sent + i)
+            for i in range(n)))
+        self.sent += n
+        if self.sent >= self.lines:
+            self._sender.stop()
+            self.widget._flush_pending_stream()
+            self.elapsed = time.perf_counter() - self.t0
+            self._ticker.stop()
+            QtWidgets.QApplication.instance().quit()
+
+    def tick(self):
+        now = time.perf_counter()
+        self.max_stall = max(self.max_stall, now - self._last_tick)
+        self._last_tick = now
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    lines_per_message = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    widget = ConsoleWidget()
+    widget._control.document().setMaximumBlockCount(widget.buffer_size)
+    widget._executing = True
+    widget.resize(800, 600)
+    widget.show()
+
+    flood = StreamFlood(widget, lines, lines_per_message)
+    QtCore.QTimer.singleShot(0, flood.start)
+    app.exec_()
+
+    print("Appended {} lines in messages of {} lines (buffer size {})".format(
+        lines, lines_per_message, widget.buffer_size))
+    print("  total time: {:.2f} s, {:,.0f} lines/s".format(
+        flood.elapsed, lines / flood.elapsed))
+    print("  flushes: {}, longest stall of the event loop: {:.0f} ms".format(
+        flood.flushes, flood.max_stall * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -30,6 +30,15 @@
 from .kill_ring import QtKillRing
 
 
+# Minimum time between two flushes of the pending stream output, in ms, so
+# the widget is redrawn at most once per frame.
+FRAME_INTERVAL = 1000 // 60
+
+# Characters that need the ANSI processor to be inserted. Text without them
+# is inserted in one go.
+ANSI_OR_SPECIAL_CHARS = re.compile('[\x1b\a\b\r\f]')
+
+
 def is_letter_or_number(char):
     """ Returns whether the specified unicode character is a letter or a number.
     """
@@ -302,12 +311,15 @@ def __init__(self, parent=None, **kw):
         # choke the Qt event loop with paint events for the widget in
         # case of lots of output from kernel.
         self._pending_insert_text = []
+        # Number of newlines in the pending text, to clip it to buffer_size
+        # only when it gets much larger than that.
+        self._pending_insert_lines = 0
 
         # Timer to flush the pending stream messages. The interval is adjusted
         # later based on actual time taken for flushing a screen (buffer_size)
         # of output text.
         self._pending_text_flush_interval = QtCore.QTimer(self._control)
-        self._pending_text_flush_interval.setInterval(100)
+        self._pending_text_flush_interval.setInterval(FRAME_INTERVAL)
         self._pending_text_flush_interval.setSingleShot(True)
         self._pending_text_flush_interval.timeout.connect(
                                             self._on_flush_pending_stream_timer)
@@ -1668,16 +1680,21 @@ def _on_flush_pending_stream_timer(self):
     def _flush_pending_stream(self):
         """ Flush out pending text into the widget. """
         text = self._pending_insert_text
+        if not text:
+            # Let the next output be inserted right away
+            return
         self._pending_insert_text = []
+        self._pending_insert_lines = 0
         buffer_size = self._control.document().maximumBlockCount()
         if buffer_size > 0:
             text = self._get_last_lines_from_list(text, buffer_size)
         text = ''.join(text)
         t = time.time()
         self._insert_plain_text(self._get_end_cursor(), text, flush=True)
-        # Set the flush interval to equal the maximum time to update text.
+        # Leave at least as much time to the event loop as it took to update
+        # the text, so the widget stays responsive with lots of output.
         self._pending_text_flush_interval.setInterval(
-            int(max(100, (time.time() - t) * 1000))
+            int(max(FRAME_INTERVAL, 2 * (time.time() - t) * 1000))
         )
 
     def _format_as_columns(self, items, separator='  '):
@@ -2108,7 +2125,6 @@ def _insert_plain_text(self, cursor, text, flush=False):
         """ Inserts plain text using the specified cursor, processing ANSI codes
             if enabled.
         """
-        should_autoscroll = self._viewport_at_end()
         # maximumBlockCount() can be different from self.buffer_size in
         # case input prompt is active.
         buffer_size = self._control.document().maximumBlockCount()
@@ -2118,9 +2134,14 @@ def _insert_plain_text(self, cursor, text, flush=False):
                 cursor.position() == self._get_end_pos()):
             # Queue the text to insert in case it is being inserted at end
             self._pending_insert_text.append(text)
-            if buffer_size > 0:
+            self._pending_insert_lines += text.count('\n')
+            # Clip the pending text once it has twice as many lines as can
+            # be shown, so appending to it takes constant time on average.
+            if 0 < buffer_size < self._pending_insert_lines // 2:
                 self._pending_insert_text = self._get_last_lines_from_list(
                                         self._pending_insert_text, buffer_size)
+                self._pending_insert_lines = sum(
+                    t.count('\n') for t in self._pending_insert_text)
             return
 
         if self._executing and not self._pending_text_flush_interval.isActive():
@@ -2130,8 +2151,18 @@ def _insert_plain_text(self, cursor, text, flush=False):
         if buffer_size > 0:
             text = self._get_last_lines(text, buffer_size)
 
+        # Only check this for text that is inserted, because it needs to
+        # layout the document
+        should_autoscroll = self._viewport_at_end()
+
         cursor.beginEditBlock()
-        if self.ansi_codes:
+        if (self.ansi_codes and cursor.atEnd() and
+                not ANSI_OR_SPECIAL_CHARS.search(text)):
+            # Without escape codes, carriage returns or backspaces, the ANSI
+            # processor would only split the text by lines, which is slow for
+            # large outputs.
+            cursor.insertText(text, self._ansi_processor.get_format())
+        elif self.ansi_codes:
             for substring in self._ansi_processor.split_string(text):
                 for act in self._ansi_processor.actions:
 
@@ -371,6 +371,32 @@ def test_erase_in_line(self):
             # clear all the text
             cursor.insertText('')
 
+    def test_pending_stream(self):
+        """ Is stream output clipped and flushed at most once per frame?
+        """
+        w = ConsoleWidget()
+        doc = w._control.document()
+        doc.setMaximumBlockCount(10)
+        w._executing = True
+
+        # The first output is shown right away, the next ones are queued
+        w._append_plain_text('first\n')
+        self.assertEqual(w._control.toPlainText(), 'first\n')
+        for i in range(100):
+            w._append_plain_text('line %d\n' % i)
+        self.assertEqual(w._control.toPlainText(), 'first\n')
+        self.assertLessEqual(w._pending_insert_lines, 21)
+
+        w._flush_pending_stream()
+        self.assertEqual(doc.blockCount(), 10)
+        self.assertEqual(
+            w._control.toPlainText().splitlines(),
+            ['line %d' % i for i in range(91, 100)])
+
+        # Flushing without pending output doesn't change anything
+        w._flush_pending_stream()
+        self.assertEqual(doc.blockCount(), 10)
+
     def test_link_handling(self):
         noButton = QtCore.Qt.NoButton
         noButtons = QtCore.Qt.NoButton
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Benchmark the round trips of comm calls between a frontend and a kernel.
+
+A kernel is started in a subprocess and called through a comm, like Spyder
+does. The following is measured:
+
+- Getting arrays of 1 KB to 1 GB, with blocking calls (which stream large
+  replies in frames) and with calls that have a callback, which are sent
+  without waiting for the previous replies.
+- Getting the full view of namespaces of 10 to 100k variables.
+- Blocking calls made by the kernel to the frontend.
+
+With `--trace DIR`, the calls are also traced on both sides and the merged
+trace is saved in DIR, to be opened with chrome://tracing or
+https://ui.perfetto.dev.
+
+Usage: python benchmarks/bench_comms.py [--max-size BYTES]
+           [--max-variables N] [--calls N] [--trace DIR]
+"""
+
+import argparse
+from contextlib import contextmanager
+import os
+import pickle
+import queue
+from subprocess import Popen, PIPE
+import sys
+import time
+import uuid
+
+from jupyter_client import BlockingKernelClient
+from jupyter_core import paths
+
+from spyder_kernels.comms.commbase import CommBase
+from spyder_kernels.comms.tracer import TRACE_ENV_VAR, merge_traces
+
+
+KERNEL_CMD = "from spyder_kernels.console import start; start.main()"
+
+# Timeout (in secs) of the calls
+TIMEOUT = 120
+
+PAYLOAD_SIZES = [10 ** 3, 10 ** 6, 10 ** 8, 10 ** 9]
+NAMESPACE_SIZES = [10, 100, 1000, 10000, 100000]
+
+# Max total size of the replies of the calls with a callback that are sent
+# at once
+MAX_PIPELINED_SIZE = 10 ** 8
+
+NAMESPACE_VIEW_SETTINGS = {
+    'check_all': False,
+    'exclude_private': True,
+    'exclude_uppercase': True,
+    'exclude_capitalized': False,
+    'exclude_unsupported': False,
+    'exclude_callables_and_modules': True,
+    'excluded_names': [],
+    'minmax': False,
+    'show_callable_attributes': True,
+    'show_special_attributes': False,
+    'filter_on': True,
+}
+
+
+class ClientComm:
+    """Frontend side of a comm, sending its messages to the control channel."""
+
+    def __init__(self, target_name, kernel_client):
+        self.target_name = target_name
+        self.kernel_client = kernel_client
+        self.comm_id = uuid.uuid1().hex
+        self._msg_callback = None
+
+    def _send_msg(self, msg_type, content, data, buffers=None):
+        content['comm_id'] = self.comm_id
+        content['data'] = data
+        msg = self.kernel_client.session.msg(msg_type, content)
+        if buffers:
+            msg['buffers'] = buffers
+        self.kernel_client.control_channel.send(msg)
+
+    def open(self, data):
+        self.kernel_client.shell_channel.send(
+            self.kernel_client.session.msg('comm_open', {
+                'comm_id': self.comm_id,
+                'target_name': self.target_name,
+                'data': data,
+            }))
+
+    def send(self, data=None, buffers=None):
+        self._send_msg('comm_msg', {}, data, buffers)
+
+    def close(self):
+        self._send_msg('comm_close', {}, {})
+
+    def on_msg(self, callback):
+        self._msg_callback = callback
+
+    def on_close(self, callback):
+        pass
+
+    def handle_msg(self, msg):
+        self._msg_callback(msg)
+
+
+class BenchComm(CommBase):
+    """Comm of the frontend, waiting for replies by reading iopub messages."""
+
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+        self.register_call_handler('_comm_ready', lambda: None)
+        self.register_call_handler('echo', lambda value: value)
+        self.comm = ClientComm(self._comm_name, client)
+        self.comm.open({'pickle_highest_protocol': pickle.HIGHEST_PROTOCOL})
+        self._register_comm(self.comm)
+        self._idle_executions = set()
+
+    def execute(self, code, timeout=TIMEOUT):
+        """Execute code in the kernel while handling its comm calls."""
+        msg_id = self.client.execute(code)
+        self.wait_until(lambda: msg_id in self._idle_executions, timeout)
+        self._idle_executions.discard(msg_id)
+
+    def wait_until(self, condition, timeout):
+        """Handle iopub messages until condition is met."""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Timeout while waiting for the kernel")
+            try:
+                msg = self.client.get_iopub_msg(timeout=remaining)
+            except queue.Empty:
+                continue
+            msg_type = msg['msg_type']
+            if msg_type == 'comm_msg':
+                if msg['content']['comm_id'] == self.comm.comm_id:
+                    self.comm.handle_msg(msg)
+            elif msg_type == 'status':
+                if msg['content']['execution_state'] == 'idle':
+                    self._idle_executions.add(
+                        msg['parent_header'].get('msg_id'))
+            elif msg_type == 'error':
+                print('\n'.join(msg['content']['traceback']),
+                      file=sys.stderr)
+
+    def _wait_reply(self, comm_id, call_id, call_name, timeout):
+        self.wait_until(lambda: call_id in self._reply_inbox, timeout)
+
+    def _wait_future(self, future, timeout):
+        self.wait_until(future.done, timeout)
+
+
+@contextmanager
+def start_kernel():
+    """Start a kernel in a subprocess and yield a client connected to it."""
+    kernel = Popen([sys.executable, '-c', KERNEL_CMD],
+                   stdout=PIPE, stderr=PIPE)
+    try:
+        connection_file = os.path.join(
+            paths.jupyter_runtime_dir(), 'kernel-%i.json' % kernel.pid)
+        deadline = time.monotonic() + TIMEOUT
+        client = BlockingKernelClient(connection_file=connection_file)
+        while True:
+            if kernel.poll() is not None:
+                raise IOError(
+                    "Kernel failed to start:\n%s" % kernel.communicate()[1])
+            try:
+                client.load_connection_file()
+                break
+            except (IOError, ValueError):
+                # The file is not written yet
+                if time.monotonic() > deadline:
+                    raise IOError("Kernel failed to write connection file")
+                time.sleep(0.1)
+        client.start_channels()
+        client.wait_for_ready(timeout=TIMEOUT)
+        try:
+            yield client
+        finally:
+            client.stop_channels()
+    finally:
+        kernel.terminate()
+        kernel.wait()
+
+
+def format_size(size):
+    """Format a size in bytes."""
+    for unit in ['B', 'KB', 'MB']:
+        if size < 1000:
+            return '{:g} {}'.format(size, unit)
+        size /= 1000
+    return '{:g} GB'.format(size)
+
+
+def timed(function, repeat):
+    """Return the best time of calling function `repeat` times."""
+    times = []
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def bench_payloads(comm, max_size, calls):
+    """Get arrays with blocking calls and with calls with a callback."""
+    print("Getting arrays from the kernel")
+    print("{:>10} {:>20} {:>20}".format(
+        "size", "blocking", "callback"))
+    for size in PAYLOAD_SIZES:
+        if size > max_size:
+            break
+        comm.execute("import numpy as np; x = np.ones({}, np.uint8)".format(
+            size))
+        n = max(1, min(calls, MAX_PIPELINED_SIZE // size))
+
+        def blocking():
+            for i in range(n):
+                comm.remote_call(
+                    blocking=True, stream=True, timeout=TIMEOUT).get_value(
+                        'x')
+
+        def callback():
+            replies = []
+            for i in range(n):
+                comm.remote_call(callback=replies.append).get_value('x')
+            comm.wait_until(lambda: len(replies) == n, TIMEOUT)
+
+        results = []
+        for function in [blocking, callback]:
+            elapsed = timed(function, 3) / n
+            results.append("{:.2f} ms {:>7.1f} MB/s".format(
+                elapsed * 1000, size / elapsed / 1e6))
+        print("{:>10} {:>20} {:>20}".format(format_size(size), *results))
+        comm.execute("del x")
+
+
+def bench_namespaces(comm, max_variables):
+    """Get the full view of namespaces of increasing size."""
+    print("Getting the namespace view")
+    print("{:>10} {:>12}".format("variables", "time"))
+    comm.remote_call(blocking=True).set_namespace_view_settings(
+        NAMESPACE_VIEW_SETTINGS)
+    for size in NAMESPACE_SIZES:
+        if size > max_variables:
+            break
+        comm.execute("globals().update(('v%d' % i, i) for i in range({}))"
+                     .format(size))
+        elapsed = timed(
+            lambda: comm.remote_call(
+                blocking=True, timeout=TIMEOUT).get_namespace_view_delta(
+                    full=True),
+            3)
+        print("{:>10} {:>9.1f} ms".format(size, elapsed * 1000))
+    comm.execute("%reset -f")
+
+
+def bench_frontend_calls(comm, calls):
+    """Make blocking calls from the kernel to the frontend."""
+    comm.execute(
+        "import time as _time\n"
+        "_t0 = _time.perf_counter()\n"
+        "for _i in range({}):\n"
+        "    get_ipython().kernel.frontend_call(blocking=True).echo(_i)\n"
+        "_elapsed = _time.perf_counter() - _t0\n".format(calls))
+    elapsed = comm.remote_call(blocking=True).get_value('_elapsed')
+    print("Blocking calls to the frontend: {:.2f} ms".format(
+        elapsed / calls * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark comm calls between a frontend and a kernel.")
+    parser.add_argument('--max-size', type=float, default=1e9,
+                        help="Max size (in bytes) of the arrays")
+    parser.add_argument('--max-variables', type=int, default=100000,
+                        help="Max number of variables in the namespace")
+    parser.add_argument('--calls', type=int, default=100,
+                        help="Number of calls for small payloads")
+    parser.add_argument('--trace', metavar='DIR',
+                        help="Save a trace of the calls in DIR")
+    options = parser.parse_args()
+
+    if options.trace:
+        # Inherited by the kernel
+        os.environ[TRACE_ENV_VAR] = os.path.abspath(options.trace)
+        os.makedirs(options.trace, exist_ok=True)
+
+    with start_kernel() as client:
+        comm = BenchComm(client)
+        # Wait until the comm is ready
+        comm.remote_call(blocking=True, timeout=TIMEOUT)._get_latency_stats()
+
+        print("Python {}".format(sys.version.split()[0]))
+        bench_payloads(comm, options.max_size, options.calls)
+        bench_namespaces(comm, options.max_variables)
+        bench_frontend_calls(comm, options.calls)
+
+        if options.trace:
+            kernel_trace = comm.remote_call(blocking=True)._dump_comm_trace()
+            frontend_trace = comm.dump_trace()
+            comm.stop_tracing()
+            trace = os.path.join(options.trace, 'comm-trace.json')
+            merge_traces([frontend_trace, kernel_trace], trace)
+            print("Trace saved in {}".format(trace))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Benchmark stepping through a loop with the Spyder debugger.
+
+The debugger steps through every line of a 100k-iteration loop that calls
+library code, which is skipped because `pdb_ignore_lib` is set. The frame
+filters cached per code object are compared with the previous
+implementation of `SpyderPdb.stop_here`, which recomputed them for every
+frame.
+
+Usage: python benchmarks/bench_pdb_stepping.py [iterations]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+from textwrap import dedent
+
+from IPython.core.debugger import Pdb as ipyPdb
+
+import spyder_kernels
+from spyder_kernels.customize.spyderpdb import SpyderPdb
+from spyder_kernels.customize.utils import path_is_library
+from spyder_kernels.utils.test_utils import get_kernel
+
+
+CODE = dedent("""
+    import textwrap
+
+    def work(n):
+        total = 0
+        for i in range(n):
+            total += len(textwrap.dedent(" x"))
+        return total
+
+    work({iterations})
+    """)
+
+
+class SteppingPdb(SpyderPdb):
+    """Debugger that steps through all lines without user interaction."""
+
+    def interaction(self, frame, traceback):
+        self.stops += 1
+        self.set_step()
+
+
+class PreviousSteppingPdb(SteppingPdb):
+    """Stepping debugger with the filters computed for every frame."""
+
+    def _hidden_predicate(self, frame):
+        return ipyPdb._hidden_predicate(self, frame)
+
+    def stop_here(self, frame):
+        if self.stopframe == self.botframe and self.stoplineno == -1:
+            return False
+        if self.continue_if_has_breakpoints and self.should_continue(frame):
+            self.set_continue()
+            return False
+        if (
+            frame is not None
+            and "__tracebackhide__" in frame.f_locals
+            and frame.f_locals["__tracebackhide__"] == "__pdb_exit__"
+        ):
+            self.onecmd('exit')
+            return False
+
+        if not ipyPdb.stop_here(self, frame):
+            return False
+        if frame is self.stopframe:
+            return True
+        filename = frame.f_code.co_filename
+        if filename.startswith('<'):
+            return True
+        if self.pdb_ignore_lib and path_is_library(filename):
+            return False
+        if (
+            self.skip_hidden
+            and os.path.dirname(spyder_kernels.__file__) in filename
+        ):
+            return False
+        return True
+
+
+def run(debugger_class, code):
+    """Step through `code` and return the number of stops and the time."""
+    debugger = debugger_class()
+    debugger.stops = 0
+    debugger.stdout = io.StringIO()
+    debugger.pdb_ignore_lib = True
+    t0 = time.perf_counter()
+    debugger.run(code, {})
+    elapsed = time.perf_counter() - t0
+    return debugger.stops, elapsed
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    # The debugger needs an IPython shell
+    kernel = get_kernel()
+    kernel.shell._namespace_stack = []
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "loop.py")
+        source = CODE.format(iterations=iterations)
+        with open(filename, "w") as f:
+            f.write(source)
+        code = compile(source, filename, "exec")
+
+        print(f"Stepping through {iterations} iterations "
+              f"(Python {sys.version.split()[0]})")
+        for name, debugger_class in [
+            ("previous", PreviousSteppingPdb),
+            ("cached", SteppingPdb),
+        ]:
+            stops, elapsed = run(debugger_class, code)
+            print(f"{name:>10}: {stops} stops in {elapsed:.2f} s, "
+                  f"{stops / elapsed:,.0f} stops/s")
+
+
+if __name__ == "__main__":
+    main()
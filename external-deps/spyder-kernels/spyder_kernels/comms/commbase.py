@@ -8,7 +8,10 @@
 Class that handles communications between Spyder kernel and frontend.
 
 Comms transmit data in a list of buffers, and in a json-able dictionnary.
-Here, we only support a buffer list with a single element.
+The first buffer contains the pickled data. When pickle protocol 5 or
+higher is used, large contiguous buffers (e.g. the data of Numpy arrays) are
+sent out-of-band in the following buffers, so they are not copied into the
+first one.
 
 The messages exchanged have the following msg_dict:
 
@@ -19,7 +22,16 @@
     }
     ```
 
-The buffer is generated by cloudpickle using `PICKLE_PROTOCOL = 2`.
+The buffers are generated by cloudpickle using the highest pickle protocol
+supported by both sides, which is negotiated with the
+`pickle_highest_protocol` key sent in every call.
+
+The buffers can be compressed. The side opening the comm sends the
+compressors it can use in a `compressors` key of the comm open data, and
+the other side chooses one of them. Every message then has a `compressor`
+key with the chosen compressor, and a `compressed` key with a list of
+flags telling which of its buffers are compressed. This includes the
+out-of-band buffers and the frames of streamed replies.
 
 To simplify the usage of messaging, we use a higher level function calling
 mechanism:
@@ -49,14 +61,46 @@
                 'call_id': The uuid from above,
                 'call_name': The function name (mostly for debugging)
                 }
+    - If the 'settings' also has `'stream' = True` and the serialized
+      return value is larger than `REPLY_FRAME_SIZE`, the buffers are kept
+      on the called side and the reply content has an additional 'stream'
+      key: {
+            'sizes': The sizes of the buffers,
+            'frame_size': The maximum size of a frame,
+            }
+      The calling side then requests the frames in order with blocking
+      `_get_reply_frame(call_id, seq)` calls, which return a dictionnary
+      {'seq': seq, 'frame': frame}. This reports progress with
+      `on_stream_progress`, keeps each call below the timeout and allows
+      the transfer to be cancelled with `cancel_call`. If the transfer is
+      cancelled or fails, the called side is told to drop the buffers with
+      `_close_reply_stream`. Streams whose frames are not requested for
+      `REPLY_STREAM_IDLE_TIMEOUT` are dropped too.
+
+Non-blocking calls that expect a reply, because they have a callback or
+were made with `future=True`, return a `CommFuture`. It is resolved when the
+reply arrives, so several calls can be sent before waiting for any of them.
+The time between sending a call and receiving its reply is recorded for
+every call expecting one in `latency_stats`.
+
+Setting the `SPY_COMM_TRACE` environment variable to a directory, or calling
+`start_tracing`, records the timings of every call in a `CommTracer`, which
+can be saved in the Chrome trace format (see `spyder_kernels.comms.tracer`).
 """
+import atexit
 import cloudpickle
 import pickle
 import logging
+import os
 import sys
+import time
 import uuid
 import traceback
 
+from spyder_kernels.comms.compression import COMPRESSORS, CompressionStats
+from spyder_kernels.comms.latency import LatencyStats
+from spyder_kernels.comms.tracer import CommTracer, TRACE_ENV_VAR
+
 
 logger = logging.getLogger(__name__)
 
@@ -65,11 +109,29 @@
 # Max timeout (in secs) for blocking calls
 TIMEOUT = 3
 
+# Minimum size (in bytes) of the buffers that are sent out-of-band
+OUT_OF_BAND_MIN_SIZE = 64 * 1024
+
+# Size (in bytes) of the frames used to stream large replies
+REPLY_FRAME_SIZE = 1024 * 1024
+
+# Max number of replies that can be waiting to be streamed
+MAX_REPLY_STREAMS = 8
+
+# Time (in secs) after which a reply stream whose frames are not requested
+# anymore is dropped
+REPLY_STREAM_IDLE_TIMEOUT = 60
+
 
 class CommError(RuntimeError):
     pass
 
 
+class CommCancelled(CommError):
+    """A streamed reply was cancelled before being fully received."""
+    pass
+
+
 class CommsErrorWrapper():
     def __init__(self, call_name, call_id):
         self.call_name = call_name
@@ -112,6 +174,175 @@ def __repr__(self):
         return repr(self.error)
 
 
+class CommFuture:
+    """
+    Reply of a non-blocking remote call, that will be received later.
+
+    Done callbacks are called with the future when the reply is received or
+    the call is cancelled.
+    """
+
+    def __init__(self, comms_wrapper, call_id, call_name, timeout=None):
+        self.call_id = call_id
+        self.call_name = call_name
+        self.timeout = timeout
+        self._comms_wrapper = comms_wrapper
+        self._state = 'pending'
+        self._value = None
+        self._error = None
+        self._done_callbacks = []
+
+    def __repr__(self):
+        return '<CommFuture {} {}>'.format(self.call_name, self._state)
+
+    def done(self):
+        """Whether the reply was received or the call was cancelled."""
+        return self._state != 'pending'
+
+    def cancelled(self):
+        """Whether the call was cancelled."""
+        return self._state == 'cancelled'
+
+    def cancel(self):
+        """
+        Cancel the call, so its reply is ignored.
+
+        Returns False if the reply was already received.
+        """
+        if self._state == 'cancelled':
+            return True
+        if self.done():
+            return False
+        self._state = 'cancelled'
+        if self._comms_wrapper is not None:
+            self._comms_wrapper._unregister_call(self.call_id)
+        self._call_done_callbacks()
+        return True
+
+    def result(self, timeout=None):
+        """
+        Get the value returned by the other side.
+
+        If the reply was not received yet, wait for it for `timeout` seconds
+        or the timeout the call was made with. An error raised on the other
+        side is raised again here.
+        """
+        if not self.done():
+            if timeout is None:
+                timeout = self.timeout
+            self._comms_wrapper._wait_future(self, timeout)
+        if self.cancelled():
+            raise CommCancelled(
+                "Call {} was cancelled".format(self.call_name))
+        if isinstance(self._error, CommsErrorWrapper):
+            self._error.raise_error()
+        elif self._error is not None:
+            raise self._error
+        return self._value
+
+    def add_done_callback(self, callback):
+        """Call `callback(future)` once the future is done."""
+        if self.done():
+            callback(self)
+        else:
+            self._done_callbacks.append(callback)
+
+    def set_result(self, value):
+        """Set the value replied by the other side."""
+        if self.done():
+            return
+        self._state = 'finished'
+        self._value = value
+        self._call_done_callbacks()
+
+    def set_exception(self, error):
+        """
+        Set the error raised on the other side, as a `CommsErrorWrapper`, or
+        an exception raised on this side.
+        """
+        if self.done():
+            return
+        self._state = 'finished'
+        self._error = error
+        self._call_done_callbacks()
+
+    def succeeded(self):
+        """Whether the call returned a value without errors."""
+        return self._state == 'finished' and self._error is None
+
+    def _call_done_callbacks(self):
+        callbacks, self._done_callbacks = self._done_callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:
+                logger.exception(
+                    "Exception in done callback of %s", self.call_name)
+
+
+def serialize_data(data, protocol):
+    """
+    Serialize data with cloudpickle.
+
+    Returns a list of buffers. With pickle protocol 5 or higher, contiguous
+    buffers larger than `OUT_OF_BAND_MIN_SIZE` are not copied into the
+    first buffer but appended to the list as they are.
+    """
+    if protocol < 5:
+        return [cloudpickle.dumps(data, protocol=protocol)]
+
+    out_of_band_buffers = []
+
+    def buffer_callback(pickle_buffer):
+        """Return False to send a buffer out-of-band."""
+        try:
+            raw_buffer = pickle_buffer.raw()
+        except BufferError:
+            # Non-contiguous buffer
+            return True
+        if raw_buffer.nbytes < OUT_OF_BAND_MIN_SIZE:
+            return True
+        out_of_band_buffers.append(raw_buffer)
+        return False
+
+    data_buffer = cloudpickle.dumps(
+        data, protocol=protocol, buffer_callback=buffer_callback)
+    return [data_buffer] + out_of_band_buffers
+
+
+def deserialize_data(buffers):
+    """
+    Deserialize data from a list of buffers made by `serialize_data`.
+
+    Out-of-band buffers are used without copying them if they are writable.
+    Otherwise they are copied, so the objects rebuilt from them (e.g. Numpy
+    arrays) can be modified.
+    """
+    if len(buffers) == 1:
+        return cloudpickle.loads(buffers[0])
+
+    out_of_band_buffers = []
+    for out_of_band_buffer in buffers[1:]:
+        if memoryview(out_of_band_buffer).readonly:
+            out_of_band_buffer = bytearray(out_of_band_buffer)
+        out_of_band_buffers.append(out_of_band_buffer)
+
+    return cloudpickle.loads(buffers[0], buffers=out_of_band_buffers)
+
+
+def get_frame_ranges(sizes, frame_size):
+    """
+    Split buffers of the given sizes in frames.
+
+    Returns a list of (buffer index, start, stop) tuples, one per frame.
+    """
+    ranges = []
+    for index, size in enumerate(sizes):
+        for start in range(0, size, frame_size):
+            ranges.append((index, start, min(start + frame_size, size)))
+    return ranges
+
+
 # Replace sys.excepthook to handle CommsErrorWrapper
 sys_excepthook = sys.excepthook
 
@@ -144,12 +375,33 @@ def __init__(self):
         # Lists of reply numbers
         self._reply_inbox = {}
         self._reply_waitlist = {}
+        # Streamed replies
+        self._reply_streams = {}
+        self._cancelled_calls = set()
+        # Compression
+        self.compression_stats = CompressionStats()
+        # Time at which calls expecting a reply were sent
+        self._call_times = {}
+        self.latency_stats = LatencyStats()
+        # Tracing
+        self.tracer = None
+        if os.environ.get(TRACE_ENV_VAR):
+            self.start_tracing(os.environ[TRACE_ENV_VAR])
 
         self._register_message_handler(
             'remote_call', self._handle_remote_call)
         self._register_message_handler(
             'remote_call_reply', self._handle_remote_call_reply)
 
+        self.register_call_handler('_get_reply_frame', self._get_reply_frame)
+        self.register_call_handler(
+            '_close_reply_stream', self._close_reply_stream)
+        self.register_call_handler(
+            '_get_compression_stats', self.get_compression_stats)
+        self.register_call_handler(
+            '_get_latency_stats', self.get_latency_stats)
+        self.register_call_handler('_dump_comm_trace', self.dump_trace)
+
     def get_comm_id_list(self, comm_id=None):
         """Get a list of comms id."""
         if comm_id is None:
@@ -203,6 +455,83 @@ def remote_call(self, comm_id=None, callback=None, **settings):
         """Get a handler for remote calls."""
         return RemoteCallFactory(self, comm_id, callback, **settings)
 
+    def cancel_call(self, call_id):
+        """
+        Cancel a streamed reply that is being received.
+
+        The blocking call waiting for the reply raises `CommCancelled`
+        before requesting the next frame.
+        """
+        self._cancelled_calls.add(call_id)
+
+    def get_compression_stats(self):
+        """
+        Get statistics on the compression of the messages of this side.
+
+        Call `_get_compression_stats` remotely to get the ones of the other
+        side.
+        """
+        stats = self.compression_stats.as_dict()
+        stats['compressors'] = {
+            comm_id: comm['compressor']
+            for comm_id, comm in self._comms.items()
+        }
+        return stats
+
+    def get_latency_stats(self):
+        """
+        Get the time taken by the other side to reply to the calls of this
+        side, per call name.
+
+        Call `_get_latency_stats` remotely to get the ones of the other side.
+        """
+        return self.latency_stats.as_dict()
+
+    def start_tracing(self, directory=None):
+        """
+        Start recording the timings of the calls of this side.
+
+        If `directory` is given, the trace is saved there when the process
+        exits.
+        """
+        if self.tracer is None:
+            self.tracer = CommTracer(type(self).__name__, directory)
+
+    def stop_tracing(self):
+        """Stop recording the timings of the calls and return the tracer."""
+        tracer, self.tracer = self.tracer, None
+        if tracer is not None and tracer.directory is not None:
+            atexit.unregister(tracer.dump)
+        return tracer
+
+    def dump_trace(self, filename=None):
+        """
+        Save the trace of this side in the Chrome trace format.
+
+        If `filename` is None, the trace is saved in the directory given to
+        `start_tracing`. Returns the name of the file, or None if the trace
+        was not saved. Call `_dump_comm_trace` remotely to save the trace of
+        the other side.
+        """
+        if self.tracer is None:
+            return None
+        return self.tracer.dump(filename)
+
+    def on_stream_progress(self, call_dict, received, total):
+        """
+        A frame of a streamed reply was received.
+
+        Parameters
+        ----------
+        call_dict : dict
+            The call that is being replied to.
+        received : int
+            The number of bytes received so far.
+        total : int
+            The total number of bytes of the reply.
+        """
+        pass
+
     # ---- Private -----
     def _send_message(self, spyder_msg_type, content=None, data=None,
                       comm_id=None):
@@ -217,7 +546,9 @@ def _send_message(self, spyder_msg_type, content=None, data=None,
             The (JSONable) content of the message
         data: any
             Any object that is serializable by cloudpickle (should be most
-            things). Will arrive as cloudpickled bytes in `.buffers[0]`.
+            things). Will arrive as cloudpickled bytes in `.buffers[0]`,
+            followed by its out-of-band buffers, if any. Each buffer is
+            compressed if a compressor was chosen and it is large enough.
         comm_id: int
             the comm to send to. If None sends to all comms.
         """
@@ -225,14 +556,17 @@ def _send_message(self, spyder_msg_type, content=None, data=None,
             raise CommError("The comm is not connected.")
         id_list = self.get_comm_id_list(comm_id)
         for comm_id in id_list:
+            compressor = self._comms[comm_id]['compressor']
             msg_dict = {
                 'spyder_msg_type': spyder_msg_type,
                 'content': content,
                 'pickle_protocol': self._comms[comm_id]['pickle_protocol'],
                 'python_version': sys.version,
+                'compressor': compressor,
                 }
-            buffers = [cloudpickle.dumps(
-                data, protocol=self._comms[comm_id]['pickle_protocol'])]
+            buffers, msg_dict['compressed'] = self.compression_stats.compress(
+                compressor,
+                serialize_data(data, self._comms[comm_id]['pickle_protocol']))
             self._comms[comm_id]['comm'].send(msg_dict, buffers=buffers)
 
     def _set_pickle_protocol(self, protocol):
@@ -240,6 +574,11 @@ def _set_pickle_protocol(self, protocol):
         protocol = min(protocol, pickle.HIGHEST_PROTOCOL)
         self._comms[self.calling_comm_id]['pickle_protocol'] = protocol
 
+    def _set_compressor(self, compressor):
+        """Set the compressor used to send data, if it is available."""
+        if compressor in COMPRESSORS:
+            self._comms[self.calling_comm_id]['compressor'] = compressor
+
     @property
     def _comm_name(self):
         """
@@ -276,6 +615,7 @@ def _register_comm(self, comm):
         self._comms[comm.comm_id] = {
             'comm': comm,
             'pickle_protocol': DEFAULT_PICKLE_PROTOCOL,
+            'compressor': None,
             'status': 'opening',
             }
 
@@ -293,12 +633,25 @@ def _comm_message(self, msg):
         # Get message dict
         msg_dict = msg['content']['data']
 
-        # Load the buffer. Only one is supported.
+        # Use the compressor chosen by the other side
+        compressor = msg_dict.get('compressor')
+        if (
+            compressor is not None
+            and self.calling_comm_id in self._comms
+            and self._comms[self.calling_comm_id]['compressor'] is None
+        ):
+            self._set_compressor(compressor)
+
+        # Load the buffers
         try:
-            buffer = cloudpickle.loads(msg['buffers'][0])
+            buffers = msg['buffers']
+            if msg_dict.get('compressed'):
+                buffers = self.compression_stats.decompress(
+                    compressor, buffers, msg_dict['compressed'])
+            buffer = deserialize_data(buffers)
         except Exception as e:
             logger.debug(
-                "Exception in cloudpickle.loads : %s" % str(e))
+                "Exception in deserialize_data : %s" % str(e))
             buffer = CommsErrorWrapper(
                 msg_dict['content']['call_name'],
                 msg_dict['content']['call_id'])
@@ -317,6 +670,8 @@ def _handle_remote_call(self, msg, buffer):
         """Handle a remote call."""
         msg_dict = msg['content']
         self.on_incoming_call(msg_dict)
+        tracer = self.tracer
+        start = time.perf_counter()
         try:
             return_value = self._remote_callback(
                     msg_dict['call_name'],
@@ -327,6 +682,10 @@ def _handle_remote_call(self, msg, buffer):
             exc_infos = CommsErrorWrapper(
                 msg_dict['call_name'], msg_dict['call_id'])
             self._set_call_return_value(msg_dict, exc_infos, is_error=True)
+        finally:
+            if tracer is not None:
+                tracer.call_handled(
+                    msg_dict['call_id'], msg_dict['call_name'], start)
 
     def _remote_callback(self, call_name, call_args, call_kwargs):
         """Call the callback function for the remote call."""
@@ -359,18 +718,105 @@ def _set_call_return_value(self, call_dict, data, is_error=False):
             'call_name': call_dict['call_name']
         }
 
+        # Only blocking calls can request the frames of a stream
+        blocking = 'blocking' in settings and settings['blocking']
+        stream = 'stream' in settings and settings['stream']
+        if stream and blocking and not is_error:
+            buffers = serialize_data(
+                data,
+                self._comms[self.calling_comm_id]['pickle_protocol'])
+            sizes = [memoryview(buffer).nbytes for buffer in buffers]
+            if sum(sizes) > REPLY_FRAME_SIZE:
+                self._add_reply_stream(call_dict['call_id'], buffers, sizes)
+                content['stream'] = {
+                    'sizes': sizes,
+                    'frame_size': REPLY_FRAME_SIZE,
+                }
+                data = None
+
         self._send_message('remote_call_reply', content=content, data=data,
                            comm_id=self.calling_comm_id)
 
+    def _add_reply_stream(self, call_id, buffers, sizes):
+        """Keep the buffers of a reply until its frames are requested."""
+        self._expire_reply_streams()
+        while len(self._reply_streams) >= MAX_REPLY_STREAMS:
+            # Drop the oldest stream, its caller is likely gone
+            oldest_call_id = next(iter(self._reply_streams))
+            logger.debug("Dropping reply stream %s", oldest_call_id)
+            del self._reply_streams[oldest_call_id]
+
+        self._reply_streams[call_id] = {
+            'buffers': buffers,
+            'ranges': get_frame_ranges(sizes, REPLY_FRAME_SIZE),
+            'last_access': time.monotonic(),
+        }
+
+    def _expire_reply_streams(self):
+        """
+        Drop the reply streams whose frames were not requested lately.
+
+        Returns True if some streams are left.
+        """
+        deadline = time.monotonic() - REPLY_STREAM_IDLE_TIMEOUT
+        for call_id, stream in list(self._reply_streams.items()):
+            if stream['last_access'] < deadline:
+                logger.debug("Dropping idle reply stream %s", call_id)
+                self._reply_streams.pop(call_id, None)
+        return len(self._reply_streams) > 0
+
+    def _get_reply_frame(self, call_id, seq):
+        """Get a frame of a streamed reply."""
+        try:
+            stream = self._reply_streams[call_id]
+        except KeyError:
+            raise CommError("No reply stream for call {}".format(call_id))
+
+        stream['last_access'] = time.monotonic()
+        index, start, stop = stream['ranges'][seq]
+        frame = memoryview(stream['buffers'][index])[start:stop]
+        if seq == len(stream['ranges']) - 1:
+            # Last frame
+            del self._reply_streams[call_id]
+
+        if self._comms[self.calling_comm_id]['pickle_protocol'] >= 5:
+            # Sent out-of-band without being copied
+            frame = pickle.PickleBuffer(frame)
+        else:
+            frame = frame.tobytes()
+        return {'seq': seq, 'frame': frame}
+
+    def _close_reply_stream(self, call_id):
+        """Drop a streamed reply that was cancelled or failed."""
+        self._reply_streams.pop(call_id, None)
+
     def _register_call(self, call_dict, callback=None):
         """
         Register the call so the reply can be properly treated.
+
+        Returns a `CommFuture` for non-blocking calls expecting a reply.
         """
         settings = call_dict['settings']
         blocking = 'blocking' in settings and settings['blocking']
         call_id = call_dict['call_id']
-        if blocking or callback is not None:
-            self._reply_waitlist[call_id] = blocking, callback
+        if not settings.get('send_reply'):
+            return None
+
+        future = None
+        if not blocking:
+            future = CommFuture(
+                self, call_id, call_dict['call_name'],
+                timeout=settings.get('timeout'))
+        self._reply_waitlist[call_id] = blocking, callback, future
+        self._call_times[call_id] = time.perf_counter()
+        return future
+
+    def _unregister_call(self, call_id):
+        """Forget a call, so its reply is ignored."""
+        self._reply_waitlist.pop(call_id, None)
+        self._call_times.pop(call_id, None)
+        if self.tracer is not None:
+            self.tracer.call_cancelled(call_id)
 
     def on_outgoing_call(self, call_dict):
         """A message is about to be sent"""
@@ -385,6 +831,10 @@ def on_incoming_call(self, call_dict):
     def _send_call(self, call_dict, call_data, comm_id):
         """Send call."""
         call_dict = self.on_outgoing_call(call_dict)
+        if self.tracer is not None:
+            self.tracer.call_sent(
+                call_dict['call_id'], call_dict['call_name'],
+                bool(call_dict['settings'].get('send_reply')))
         self._send_message(
             'remote_call', content=call_dict, data=call_data,
             comm_id=comm_id)
@@ -412,21 +862,76 @@ def _get_call_return_value(self, call_dict, comm_id):
         else:
             timeout = TIMEOUT
 
-        self._wait_reply(comm_id, call_id, call_name, timeout)
+        try:
+            self._wait_reply(comm_id, call_id, call_name, timeout)
+        except BaseException:
+            # Don't keep the call if its reply never came
+            self._unregister_call(call_id)
+            raise
 
         reply = self._reply_inbox.pop(call_id)
 
         if reply['is_error']:
             return self._sync_error(reply['value'])
 
+        if 'stream' in reply['content']:
+            return self._receive_stream(
+                call_dict, comm_id, reply['content']['stream'], timeout)
+
         return reply['value']
 
+    def _receive_stream(self, call_dict, comm_id, stream, timeout):
+        """Request the frames of a streamed reply and return its value."""
+        call_id = call_dict['call_id']
+        sizes = stream['sizes']
+        total = sum(sizes)
+        buffers = [bytearray(size) for size in sizes]
+        received = 0
+        try:
+            ranges = get_frame_ranges(sizes, stream['frame_size'])
+            for seq, (index, start, stop) in enumerate(ranges):
+                if call_id in self._cancelled_calls:
+                    raise CommCancelled(
+                        "Call {} was cancelled".format(
+                            call_dict['call_name']))
+
+                reply = self.remote_call(
+                    comm_id=comm_id, blocking=True, timeout=timeout
+                )._get_reply_frame(call_id, seq)
+                if reply['seq'] != seq:
+                    raise CommError(
+                        "Got frame {} instead of {}".format(
+                            reply['seq'], seq))
+
+                buffers[index][start:stop] = reply['frame']
+                received += stop - start
+                self.on_stream_progress(call_dict, received, total)
+        except BaseException:
+            # Tell the other side to drop the buffers, otherwise they are
+            # kept until the stream expires
+            try:
+                self.remote_call(comm_id=comm_id)._close_reply_stream(
+                    call_id)
+            except Exception:
+                logger.debug("Could not close reply stream %s", call_id)
+            raise
+        finally:
+            self._cancelled_calls.discard(call_id)
+
+        return deserialize_data(buffers)
+
     def _wait_reply(self, comm_id, call_id, call_name, timeout):
         """
         Wait for the other side reply.
         """
         raise NotImplementedError
 
+    def _wait_future(self, future, timeout):
+        """
+        Wait until a future is done.
+        """
+        raise NotImplementedError
+
     def _handle_remote_call_reply(self, msg_dict, buffer):
         """
         A blocking call received a reply.
@@ -436,6 +941,13 @@ def _handle_remote_call_reply(self, msg_dict, buffer):
         call_name = content['call_name']
         is_error = content['is_error']
 
+        call_time = self._call_times.pop(call_id, None)
+        if call_time is not None:
+            self.latency_stats.record(
+                call_name, time.perf_counter() - call_time)
+        if self.tracer is not None:
+            self.tracer.reply_received(call_id, is_error)
+
         # Unexpected reply
         if call_id not in self._reply_waitlist:
             if is_error:
@@ -445,16 +957,22 @@ def _handle_remote_call_reply(self, msg_dict, buffer):
                     call_name, call_id))
             return
 
-        blocking, callback = self._reply_waitlist.pop(call_id)
+        blocking, callback, future = self._reply_waitlist.pop(call_id)
 
         # Async error
         if is_error and not blocking:
+            if future is not None:
+                future.set_exception(buffer)
             return self._async_error(buffer)
 
         # Callback
         if callback is not None and not is_error:
             callback(buffer)
 
+        # Future
+        if future is not None:
+            future.set_result(buffer)
+
         # Blocking inbox
         if blocking:
             self._reply_inbox[call_id] = {
@@ -514,7 +1032,9 @@ def __call__(self, *args, **kwargs):
         The args and kwargs have to be picklable.
         """
         blocking = 'blocking' in self._settings and self._settings['blocking']
-        self._settings['send_reply'] = blocking or self._callback is not None
+        future = 'future' in self._settings and self._settings['future']
+        self._settings['send_reply'] = (
+            blocking or future or self._callback is not None)
 
         call_id = uuid.uuid4().hex
         call_dict = {
@@ -533,7 +1053,9 @@ def __call__(self, *args, **kwargs):
                 raise CommError("The comm is not connected.")
             logger.debug("Call to unconnected comm: %s" % self._name)
             return
-        self._comms_wrapper._register_call(call_dict, self._callback)
+        future = self._comms_wrapper._register_call(call_dict, self._callback)
         self._comms_wrapper._send_call(call_dict, call_data, self._comm_id)
+        if future is not None:
+            return future
         return self._comms_wrapper._get_call_return_value(
             call_dict, self._comm_id)
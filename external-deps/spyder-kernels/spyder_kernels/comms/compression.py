@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+"""
+Compression of comm messages.
+
+The side opening a comm sends the list of compressors it can use, and the
+other side picks the first one it also supports. Each buffer of a message,
+i.e. the pickled data and its out-of-band buffers, is compressed when it is
+larger than `COMPRESSION_MIN_SIZE`, and the message tells which ones were.
+"""
+
+import time
+import zlib
+
+
+# Minimum size (in bytes) of the buffers that are compressed
+COMPRESSION_MIN_SIZE = 16 * 1024
+
+# Available compressors, fastest first
+COMPRESSORS = {}
+
+try:
+    import zstandard
+    COMPRESSORS['zstd'] = (
+        lambda data: zstandard.ZstdCompressor(level=3).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+except ImportError:
+    pass
+
+try:
+    import lz4.frame
+    COMPRESSORS['lz4'] = (lz4.frame.compress, lz4.frame.decompress)
+except ImportError:
+    pass
+
+COMPRESSORS['zlib'] = (
+    lambda data: zlib.compress(data, 1),
+    zlib.decompress,
+)
+
+
+def get_compressors():
+    """Get the names of the available compressors, by order of preference."""
+    return list(COMPRESSORS)
+
+
+def choose_compressor(names):
+    """Choose the preferred compressor among `names`, or None."""
+    for name in COMPRESSORS:
+        if name in names:
+            return name
+    return None
+
+
+class CompressionStats:
+    """Statistics on the buffers compressed and decompressed by a comm."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Reset the statistics."""
+        self.sent_messages = 0
+        self.compressed_messages = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self.compress_time = 0
+        self.decompressed_messages = 0
+        self.decompress_time = 0
+
+    def as_dict(self):
+        """Get the statistics as a dictionnary."""
+        if self.compressed_bytes:
+            ratio = self.raw_bytes / self.compressed_bytes
+        else:
+            ratio = None
+        return {
+            'sent_messages': self.sent_messages,
+            'compressed_messages': self.compressed_messages,
+            'raw_bytes': self.raw_bytes,
+            'compressed_bytes': self.compressed_bytes,
+            'ratio': ratio,
+            'compress_time': self.compress_time,
+            'decompressed_messages': self.decompressed_messages,
+            'decompress_time': self.decompress_time,
+        }
+
+    def compress(self, name, buffers):
+        """
+        Compress the buffers of a message with a compressor.
+
+        Returns the list of buffers and a list of flags telling which ones
+        were compressed. Buffers that are too small or don't compress are
+        left as they are.
+        """
+        self.sent_messages += 1
+        buffers = list(buffers)
+        flags = [False] * len(buffers)
+        if name is None:
+            return buffers, flags
+
+        for i, data in enumerate(buffers):
+            size = memoryview(data).nbytes
+            if size < COMPRESSION_MIN_SIZE:
+                continue
+            t0 = time.perf_counter()
+            compressed = COMPRESSORS[name][0](data)
+            self.compress_time += time.perf_counter() - t0
+            if len(compressed) >= size:
+                continue
+            buffers[i] = compressed
+            flags[i] = True
+            self.raw_bytes += size
+            self.compressed_bytes += len(compressed)
+
+        if any(flags):
+            self.compressed_messages += 1
+        return buffers, flags
+
+    def decompress(self, name, buffers, flags):
+        """
+        Decompress the buffers of a message compressed by `compress`.
+
+        `flags` can also be a boolean telling if only the first buffer was
+        compressed, as sent by previous versions.
+        """
+        if isinstance(flags, bool):
+            flags = [flags]
+        buffers = list(buffers)
+        if not any(flags):
+            return buffers
+
+        t0 = time.perf_counter()
+        for i, flag in enumerate(flags):
+            if flag:
+                buffers[i] = COMPRESSORS[name][1](buffers[i])
+        self.decompress_time += time.perf_counter() - t0
+        self.decompressed_messages += 1
+        return buffers
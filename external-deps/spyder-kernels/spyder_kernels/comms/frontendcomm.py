@@ -17,7 +17,9 @@
 from IPython.core.getipython import get_ipython
 import zmq
 
-from spyder_kernels.comms.commbase import CommBase, CommError
+from spyder_kernels.comms.commbase import (
+    CommBase, CommError, REPLY_STREAM_IDLE_TIMEOUT)
+from spyder_kernels.comms.compression import choose_compressor
 from spyder_kernels.comms.utils import WriteContext
 
 
@@ -49,6 +51,7 @@ def __init__(self, kernel):
         self.comm_lock = threading.Lock()
         self._cached_messages = {}
         self._pending_comms = {}
+        self._reply_streams_check_scheduled = False
 
     def close(self, comm_id=None):
         """Close the comm and notify the other side."""
@@ -94,14 +97,15 @@ def poll_one(self):
                 out_stream.flush(zmq.POLLOUT)
 
     def remote_call(self, comm_id=None, blocking=False, callback=None,
-                    timeout=None, display_error=False):
+                    timeout=None, display_error=False, future=False):
         """Get a handler for remote calls."""
         return super(FrontendComm, self).remote_call(
             blocking=blocking,
             comm_id=comm_id,
             callback=callback,
             timeout=timeout,
-            display_error=display_error)
+            display_error=display_error,
+            future=future)
 
     def wait_until(self, condition, timeout=None):
         """Wait until condition is met. Returns False if timeout."""
@@ -154,6 +158,8 @@ def _comm_ready_callback(self, ret):
                 comm.handle_msg(msg)
             self._cached_messages.pop(comm.comm_id)
 
+        self.kernel.handle_comm_ready()
+
 
     def _wait_reply(self, comm_id, call_id, call_name, timeout, retry=True):
         """Wait until the frontend replies to a request."""
@@ -168,6 +174,13 @@ def reply_received():
                 "Timeout while waiting for '{}' reply.".format(
                     call_name))
 
+    def _wait_future(self, future, timeout):
+        """Wait until the frontend replies to a non-blocking request."""
+        if not self.wait_until(future.done, timeout):
+            raise TimeoutError(
+                "Timeout while waiting for '{}' reply.".format(
+                    future.call_name))
+
     def _comm_open(self, comm, msg):
         """
         A new comm is open!
@@ -176,6 +189,8 @@ def _comm_open(self, comm, msg):
         self._register_comm(comm)
         self._set_pickle_protocol(
             msg['content']['data']['pickle_highest_protocol'])
+        self._set_compressor(
+            choose_compressor(msg['content']['data'].get('compressors', [])))
 
         # IOPub might not be connected yet, keep sending messages until a
         # reply is received.
@@ -207,6 +222,27 @@ def handle_msg(msg):
         comm.handle_msg = handle_msg
         super(FrontendComm, self)._register_comm(comm)
 
+    def _add_reply_stream(self, call_id, buffers, sizes):
+        """
+        Keep the buffers of a reply and drop them later if the frontend
+        stops requesting its frames.
+        """
+        super(FrontendComm, self)._add_reply_stream(call_id, buffers, sizes)
+        io_loop = getattr(self.kernel, 'io_loop', None)
+        if io_loop is not None and not self._reply_streams_check_scheduled:
+            self._reply_streams_check_scheduled = True
+            io_loop.add_callback(
+                io_loop.call_later, REPLY_STREAM_IDLE_TIMEOUT,
+                self._check_reply_streams)
+
+    def _check_reply_streams(self):
+        """Expire idle reply streams until there are none left."""
+        if self._expire_reply_streams():
+            self.kernel.io_loop.call_later(
+                REPLY_STREAM_IDLE_TIMEOUT, self._check_reply_streams)
+        else:
+            self._reply_streams_check_scheduled = False
+
     def _remote_callback(self, call_name, call_args, call_kwargs):
         """Call the callback function for the remote call."""
         with WriteContext(call_name):
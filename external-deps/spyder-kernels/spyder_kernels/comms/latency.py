@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+"""
+Latency of comm calls.
+
+The time between sending a call and receiving its reply is recorded per call
+name in histograms with buckets growing by powers of two, so that slow calls
+can be diagnosed without keeping every measure.
+"""
+
+import bisect
+
+
+# Upper bounds (in seconds) of the buckets of the histograms, from 1 ms to
+# about 16 s. Slower calls are counted in an additional last bucket.
+LATENCY_BUCKETS = [0.001 * 2 ** i for i in range(15)]
+
+
+class LatencyHistogram:
+    """Histogram of the latencies of a call."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, latency):
+        """Record the latency of a call, in seconds."""
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def get_percentile(self, percent):
+        """
+        Get an upper bound of the given percentile of the latencies.
+
+        Returns the upper bound of the bucket containing the percentile, or
+        the maximum latency if it is in the last bucket.
+        """
+        if not self.count:
+            return None
+        rank = percent / 100 * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self):
+        """Get the histogram as a dictionnary."""
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'max': self.max,
+            'p50': self.get_percentile(50),
+            'p95': self.get_percentile(95),
+            'buckets': list(self.buckets),
+        }
+
+
+class LatencyStats:
+    """Latency histograms of the calls made by a comm, per call name."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Reset the statistics."""
+        self.histograms = {}
+
+    def record(self, call_name, latency):
+        """Record the latency of a call, in seconds."""
+        histogram = self.histograms.get(call_name)
+        if histogram is None:
+            histogram = self.histograms[call_name] = LatencyHistogram()
+        histogram.record(latency)
+
+    def as_dict(self):
+        """
+        Get the statistics as a dictionnary.
+
+        'calls' maps call names to the dictionnaries of their histograms,
+        and 'buckets' has the upper bounds of the buckets.
+        """
+        stats = {
+            call_name: histogram.as_dict()
+            for call_name, histogram in self.histograms.items()
+        }
+        return {'buckets': list(LATENCY_BUCKETS), 'calls': stats}
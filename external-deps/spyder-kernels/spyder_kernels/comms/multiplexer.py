@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+"""
+Multiplexing of the non-blocking calls made through a comm.
+
+Calls made through a `CallMultiplexer` return a `CommFuture` right away, so
+independent calls are pipelined instead of waiting for each reply in turn.
+In addition:
+
+- An identical call (same name, arguments and settings) that is still
+  waiting for its reply is not sent again. Its future is shared instead.
+- Calls made with the same `supersede` key replace each other: when a new
+  one is made, the previous one is cancelled if it is still waiting for its
+  reply, so only the reply of the latest call is processed.
+"""
+
+from spyder_kernels.comms.commbase import CommError, CommFuture
+
+
+class CallMultiplexer:
+    """Send non-blocking calls through a comm and return their futures."""
+
+    def __init__(self, comms_wrapper):
+        self._comms_wrapper = comms_wrapper
+        # Calls waiting for their reply, by call key
+        self._pending_calls = {}
+        # Latest call made with each supersede key
+        self._superseding_calls = {}
+        self.coalesced_calls = 0
+        self.superseded_calls = 0
+
+    def remote_call(self, comm_id=None, callback=None, supersede=None,
+                    coalesce=True, **settings):
+        """
+        Get a handler for multiplexed remote calls.
+
+        Parameters
+        ----------
+        comm_id: str
+            Comm to send the calls to. If None, the calls are sent to all
+            comms.
+        callback: callable
+            Called with the value returned by the other side, unless the
+            call fails or is cancelled.
+        supersede: str
+            Cancel the previous call made with the same key, if it is still
+            waiting for its reply.
+        coalesce: bool
+            Share the future of an identical call that is still waiting for
+            its reply instead of sending a new one.
+        settings:
+            Settings of the calls, as in `CommBase.remote_call`. They can't
+            be blocking.
+        """
+        if settings.get('blocking'):
+            raise ValueError("Multiplexed calls can't be blocking")
+        return MultiplexedCallFactory(
+            self, comm_id, callback, supersede, coalesce, settings)
+
+    def _call(self, call_name, args, kwargs, comm_id, callback, supersede,
+              coalesce, settings):
+        """Make a call, or share the future of an identical one."""
+        key = None
+        if coalesce:
+            key = (comm_id, call_name, args, tuple(sorted(kwargs.items())),
+                   tuple(sorted(settings.items())))
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable arguments
+                key = None
+
+        future = self._pending_calls.get(key) if key is not None else None
+        if future is not None:
+            self.coalesced_calls += 1
+        else:
+            future = self._send(call_name, args, kwargs, comm_id, settings)
+            if key is not None and not future.done():
+                self._pending_calls[key] = future
+                future.add_done_callback(
+                    lambda f: self._forget(self._pending_calls, key, f))
+
+        if supersede is not None:
+            previous = self._superseding_calls.get(supersede)
+            if previous is not None and previous is not future:
+                if previous.cancel():
+                    self.superseded_calls += 1
+            if not future.done():
+                self._superseding_calls[supersede] = future
+                future.add_done_callback(
+                    lambda f: self._forget(
+                        self._superseding_calls, supersede, f))
+
+        if callback is not None:
+            def call_callback(future):
+                if future.succeeded():
+                    callback(future.result())
+            future.add_done_callback(call_callback)
+        return future
+
+    def _send(self, call_name, args, kwargs, comm_id, settings):
+        """Send a call and return its future."""
+        remote_call = self._comms_wrapper.remote_call(
+            comm_id=comm_id, future=True, **settings)
+        future = getattr(remote_call, call_name)(*args, **kwargs)
+        if future is None:
+            # The call was not sent
+            future = CommFuture(None, None, call_name)
+            future.set_exception(CommError("The comm is not connected."))
+        return future
+
+    def _forget(self, calls, key, future):
+        """Remove a done call from `calls`, if it was not replaced."""
+        if calls.get(key) is future:
+            del calls[key]
+
+
+class MultiplexedCallFactory:
+    """Class to create multiplexed calls."""
+
+    def __init__(self, multiplexer, comm_id, callback, supersede, coalesce,
+                 settings):
+        self._multiplexer = multiplexer
+        self._comm_id = comm_id
+        self._callback = callback
+        self._supersede = supersede
+        self._coalesce = coalesce
+        self._settings = settings
+
+    def __getattr__(self, name):
+        """Get a call for a function named 'name'."""
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            return self._multiplexer._call(
+                name, args, kwargs, self._comm_id, self._callback,
+                self._supersede, self._coalesce, self._settings)
+
+        return call
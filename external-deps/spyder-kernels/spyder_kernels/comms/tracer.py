@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+"""
+Tracing of comm calls.
+
+When tracing is enabled, a comm records when it sends calls, when it
+receives their replies and how long it takes to handle the calls of the
+other side. The timings are saved in the Chrome trace event format, which
+can be opened with chrome://tracing or https://ui.perfetto.dev.
+
+Tracing is enabled on both sides by setting the `SPY_COMM_TRACE` environment
+variable to a directory before starting Spyder, since kernels inherit it.
+Each comm then saves its trace in that directory when the process exits or
+when `_dump_comm_trace` is called remotely. Timestamps come from the wall
+clock, so the traces of the frontend and the kernel can be merged with::
+
+    python -m spyder_kernels.comms.tracer output.json trace1.json ...
+"""
+
+import atexit
+from collections import deque
+import itertools
+import json
+import os
+import threading
+import time
+
+
+# Environment variable with the directory where traces are saved
+TRACE_ENV_VAR = 'SPY_COMM_TRACE'
+
+# Max number of events kept, the oldest ones are dropped after that
+MAX_TRACE_EVENTS = 100000
+
+_tracer_ids = itertools.count()
+
+
+class CommTracer:
+    """Record the timings of the calls of a comm as trace events."""
+
+    def __init__(self, process_name, directory=None,
+                 max_events=MAX_TRACE_EVENTS):
+        """
+        Parameters
+        ----------
+        process_name: str
+            Name shown for this process in the trace.
+        directory: str
+            If given, the trace is saved in this directory when the process
+            exits.
+        max_events: int
+            Max number of events kept.
+        """
+        self.process_name = process_name
+        self.directory = directory
+        self.pid = os.getpid()
+        self.events = deque(maxlen=max_events)
+        self._id = next(_tracer_ids)
+        # Call id -> (call name, sending time, sending thread)
+        self._sent_calls = {}
+        # To convert perf_counter times to wall clock times
+        self._clock_offset = time.time() - time.perf_counter()
+        if directory is not None:
+            atexit.register(self.dump)
+
+    def call_sent(self, call_id, call_name, expects_reply):
+        """A call was sent to the other side."""
+        now = time.perf_counter()
+        if expects_reply:
+            self._sent_calls[call_id] = (
+                call_name, now, threading.get_ident())
+        else:
+            self._add_event(call_name, 'call', now, None,
+                            threading.get_ident(), {'call_id': call_id})
+
+    def reply_received(self, call_id, is_error=False):
+        """The reply of a call was received."""
+        self._end_call(call_id, {'is_error': is_error})
+
+    def call_cancelled(self, call_id):
+        """A call was cancelled before its reply was received."""
+        self._end_call(call_id, {'cancelled': True})
+
+    def call_handled(self, call_id, call_name, start):
+        """A call of the other side was handled since `start`."""
+        self._add_event(call_name, 'handle', start, time.perf_counter(),
+                        threading.get_ident(), {'call_id': call_id})
+
+    def get_trace(self):
+        """Get the trace, as a dictionnary in the Chrome trace format."""
+        metadata = {
+            'name': 'process_name',
+            'ph': 'M',
+            'pid': self.pid,
+            'args': {'name': '{} ({})'.format(self.process_name, self.pid)},
+        }
+        return {
+            'traceEvents': [metadata] + list(self.events),
+            'displayTimeUnit': 'ms',
+        }
+
+    def get_filename(self):
+        """Get the name of the file the trace is saved to by default."""
+        return os.path.join(
+            self.directory,
+            'comm-trace-{}-{}-{}.json'.format(
+                self.process_name, self.pid, self._id))
+
+    def dump(self, filename=None):
+        """
+        Save the trace to filename, or to the default file if None.
+
+        Returns the name of the file.
+        """
+        if filename is None:
+            if self.directory is None:
+                return None
+            filename = self.get_filename()
+        with open(filename, 'w') as f:
+            json.dump(self.get_trace(), f)
+        return filename
+
+    # ---- Private API
+    def _end_call(self, call_id, args):
+        sent_call = self._sent_calls.pop(call_id, None)
+        if sent_call is None:
+            return
+        call_name, start, thread_id = sent_call
+        args['call_id'] = call_id
+        self._add_event(call_name, 'call', start, time.perf_counter(),
+                        thread_id, args)
+
+    def _add_event(self, name, category, start, end, thread_id, args):
+        """Add a complete event, or an instant one if `end` is None."""
+        event = {
+            'name': name,
+            'cat': category,
+            'ts': (start + self._clock_offset) * 1e6,
+            'pid': self.pid,
+            'tid': thread_id,
+            'args': args,
+        }
+        if end is None:
+            event['ph'] = 'i'
+            event['s'] = 't'
+        else:
+            event['ph'] = 'X'
+            event['dur'] = (end - start) * 1e6
+        self.events.append(event)
+
+
+def merge_traces(filenames, output):
+    """Merge trace files into a single one."""
+    events = []
+    for filename in filenames:
+        with open(filename) as f:
+            events.extend(json.load(f)['traceEvents'])
+    with open(output, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+def main():
+    """Merge trace files."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Merge comm traces of the frontend and the kernels.")
+    parser.add_argument('output', help="Merged trace file")
+    parser.add_argument('traces', nargs='+', help="Trace files to merge")
+    options = parser.parse_args()
+    merge_traces(options.traces, options.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -11,7 +11,9 @@
 """
 
 # Standard library imports
+from collections import OrderedDict
 import faulthandler
+import itertools
 import json
 import logging
 import os
@@ -32,22 +34,34 @@
 from spyder_kernels.comms.frontendcomm import FrontendComm
 from spyder_kernels.comms.decorators import (
     register_comm_handlers, comm_handler)
-from spyder_kernels.utils.iofuncs import iofunctions
+from spyder_kernels.utils.dfview import DataFrameView
+from spyder_kernels.utils.iofuncs import LAZY_LOAD_EXTENSIONS, iofunctions
+from spyder_kernels.utils.memory import MemoryAccountant
 from spyder_kernels.utils.mpl import (
     MPL_BACKENDS_FROM_SPYDER, MPL_BACKENDS_TO_SPYDER, INLINE_FIGURE_FORMATS)
 from spyder_kernels.utils.nsview import (
-    get_remote_data, make_remote_view, get_size)
+    get_remote_data, make_remote_view, get_size, is_lazy_array,
+    NamespaceViewTracker)
+from spyder_kernels.utils.preload import ModulePreloader, parse_module_list
+from spyder_kernels.console.outstream import TTYOutStream
 from spyder_kernels.console.shell import SpyderShell
 from spyder_kernels.comms.utils import WriteContext
+from spyder_kernels.customize.monitoring import MonitoringTracer
 
 
 logger = logging.getLogger(__name__)
 
+# Number of completions whose documentation is prefetched
+DOC_PREFETCH_COUNT = 5
+
 
 # Excluded variables from the Variable Explorer (i.e. they are not
 # shown at all there)
 EXCLUDED_NAMES = ['In', 'Out', 'exit', 'get_ipython', 'quit']
 
+# Max number of DataFrame views kept open at the same time
+MAX_DATAFRAME_VIEWS = 10
+
 
 class SpyderKernel(IPythonKernel):
     """Spyder kernel for Jupyter."""
@@ -65,6 +79,18 @@ def __init__(self, *args, **kwargs):
         register_comm_handlers(self.shell, self.frontend_comm)
 
         self.namespace_view_settings = {}
+        self.namespace_view_spec = {}
+        self.namespace_view_tracker = NamespaceViewTracker()
+        self.memory_accountant = MemoryAccountant(
+            callback=self.publish_memory_usage)
+        self.module_preloader = ModulePreloader(
+            callback=self.publish_preload_timings)
+        self.shell.events.register(
+            'pre_execute', lambda: self.module_preloader.set_busy(True))
+        self.shell.events.register(
+            'post_execute', lambda: self.module_preloader.set_busy(False))
+        self._dataframe_views = OrderedDict()
+        self._dataframe_view_ids = itertools.count()
         self._mpl_backend_error = None
         self.faulthandler_handle = None
         self._cwd_initialised = False
@@ -100,8 +126,9 @@ def get_state(self):
         with WriteContext("get_state"):
             if self._cwd_initialised:
                 state["cwd"] = self.get_cwd()
-            state["namespace_view"] = self.get_namespace_view()
-            state["var_properties"] = self.get_var_properties()
+            delta = self.get_namespace_view_delta()
+            if delta is not None:
+                state["namespace_view_delta"] = delta
         return state
 
     def publish_state(self):
@@ -114,6 +141,51 @@ def publish_state(self):
         except Exception:
             pass
 
+    def publish_memory_usage(self, usage):
+        """
+        Publish the memory used by the variables of the namespace.
+
+        This is called from the thread of the memory accountant when it
+        finishes computing the sizes of the variables that changed.
+        """
+        if not self.frontend_comm.is_open():
+            return
+        try:
+            self.frontend_call(blocking=False).update_state(
+                {"memory_usage": usage})
+        except Exception:
+            pass
+
+    def publish_preload_timings(self, timings):
+        """
+        Publish the import time of the preloaded modules.
+
+        This is called from the thread of the module preloader when it
+        finishes.
+        """
+        if not self.frontend_comm.is_open():
+            return
+        try:
+            self.frontend_call(blocking=False).update_state(
+                {"preload_timings": timings})
+        except Exception:
+            pass
+
+    def handle_comm_ready(self):
+        """
+        A comm with the frontend is ready.
+
+        Start preloading the modules in `SPY_PRELOAD_MODULES_O`, so they are
+        imported before the first cell that needs them.
+        """
+        self.module_preloader.start(
+            parse_module_list(os.environ.get('SPY_PRELOAD_MODULES_O')))
+
+    @comm_handler
+    def get_preload_timings(self):
+        """Get the import time of the modules preloaded so far."""
+        return self.module_preloader.get_timings()
+
     @comm_handler
     def enable_faulthandler(self):
         """
@@ -264,6 +336,27 @@ def get_current_frames(self, ignore_internal_threads=True):
     def set_namespace_view_settings(self, settings):
         """Set namespace_view_settings."""
         self.namespace_view_settings = settings
+        # Views depend on settings, so they need to be computed again
+        self.namespace_view_tracker.reset()
+
+    @comm_handler
+    def set_namespace_view_spec(self, spec):
+        """
+        Set the filter, sort order and page of the namespace view.
+
+        This is a dictionary with the following optional keys:
+
+        * 'filter': Text that the names or types of the variables have to
+          match, with the same rules as the Variable Explorer finder.
+        * 'sort': 'name', 'type' or 'memory', to sort by the memory used by
+          the variables, as far as it's known.
+        * 'ascending': Whether to sort in ascending order.
+        * 'offset' and 'limit': Range of the sorted variables to show.
+
+        Only the variables in that range are sent to the frontend, together
+        with the number of variables that matched the filter.
+        """
+        self.namespace_view_spec = spec
 
     @comm_handler
     def get_namespace_view(self, frame=None):
@@ -296,7 +389,9 @@ def get_namespace_view(self, frame=None):
         settings = self.namespace_view_settings
         if settings:
             ns = self.shell._get_current_namespace(frame=frame)
-            view = make_remote_view(ns, settings, EXCLUDED_NAMES)
+            spec, sort_values = self._get_namespace_view_spec()
+            view = make_remote_view(ns, settings, EXCLUDED_NAMES, spec,
+                                    sort_values)
             return view
         else:
             return None
@@ -315,28 +410,224 @@ def get_var_properties(self):
 
             properties = {}
             for name, value in list(data.items()):
-                properties[name] = {
-                    'is_list':  self._is_list(value),
-                    'is_dict':  self._is_dict(value),
-                    'is_set': self._is_set(value),
-                    'len': self._get_len(value),
-                    'is_array': self._is_array(value),
-                    'is_image': self._is_image(value),
-                    'is_data_frame': self._is_data_frame(value),
-                    'is_series': self._is_series(value),
-                    'array_shape': self._get_array_shape(value),
-                    'array_ndim': self._get_array_ndim(value)
-                }
+                properties[name] = self._get_var_properties(value)
 
             return properties
         else:
             return None
 
+    @comm_handler
+    def get_namespace_view_delta(self, full=False):
+        """
+        Return the changes in the namespace view since the last call.
+
+        This is a dictionary with the following structure
+
+        {
+            'version': 3,
+            'base_version': 2,
+            'view': {'a': {...}},
+            'var_properties': {'a': {...}},
+            'removed': ['b'],
+            'total': 10
+        }
+
+        Here:
+        * 'view' and 'var_properties' contain the entries of the variables
+          that were added or changed, with the same structure as the ones
+          returned by `get_namespace_view` and `get_var_properties`.
+        * 'removed' are the names of the variables that are not shown
+          anymore.
+        * 'base_version' is the version the delta has to be applied to. It's
+          None when `full` is True, which means 'view' and 'var_properties'
+          contain all variables.
+        * 'total' is the number of variables that matched the filter of the
+          view spec set with `set_namespace_view_spec`, of which only the
+          ones in its page are part of the view.
+
+        None is returned if nothing changed.
+        """
+        settings = self.namespace_view_settings
+        if settings:
+            ns = self.shell._get_current_namespace()
+            spec, sort_values = self._get_namespace_view_spec()
+            delta = self.namespace_view_tracker.get_delta(
+                ns, settings, self._get_var_properties,
+                more_excluded_names=EXCLUDED_NAMES, full=full, spec=spec,
+                sort_values=sort_values)
+            self.memory_accountant.update(
+                self.namespace_view_tracker.get_values())
+            return delta
+        else:
+            return None
+
+    @comm_handler
+    def get_memory_usage(self):
+        """
+        Get the memory used by the variables of the namespace.
+
+        This returns a dictionary with keys 'sizes', mapping variable names
+        to their size in bytes, and 'total', the sum of those sizes. Only
+        the sizes computed so far in the background are included.
+        """
+        return self.memory_accountant.get_usage()
+
     @comm_handler
     def get_value(self, name):
-        """Get the value of a variable"""
+        """
+        Get the value of a variable.
+
+        Lazy arrays are read, since their data is not in the frontend.
+        """
+        ns = self.shell._get_current_namespace()
+        value = ns[name]
+        if is_lazy_array(value):
+            import numpy as np
+            value = np.asarray(value)
+        return value
+
+    @comm_handler
+    def get_array_info(self, name):
+        """
+        Get the information needed to show an array without its data.
+
+        This is a dictionary with the following keys:
+
+        * 'shape', 'dtype' and 'writeable': The ones of the array.
+        * 'is_masked' and 'is_record': Whether it's a masked or record array.
+        * 'vmin' and 'vmax': The range of its values, used to color the
+          cells of the Array Editor. They are None if they can't be computed.
+        * 'has_inf': Whether it contains infinite values.
+
+        The range and infinite values of lazy arrays are not computed, since
+        that would need to read all their data.
+        """
+        import numpy as np
+
+        ns = self.shell._get_current_namespace()
+        value = ns[name]
+
+        vmin = vmax = None
+        has_inf = False
+        if is_lazy_array(value):
+            return {
+                'shape': value.shape,
+                'dtype': value.dtype,
+                'writeable': False,
+                'is_masked': False,
+                'is_record': value.dtype.names is not None,
+                'vmin': vmin,
+                'vmax': vmax,
+                'has_inf': has_inf
+            }
+        elif value.dtype.name != 'object':
+            # For complex numbers, the range is based on the absolute value
+            if value.dtype in (np.complex64, np.complex128):
+                color_func = np.abs
+            else:
+                color_func = np.real
+            try:
+                vmin = np.nanmin(color_func(value))
+                vmax = np.nanmax(color_func(value))
+            except (AttributeError, TypeError, ValueError):
+                pass
+            if value.dtype.kind in ['f', 'c']:
+                has_inf = bool(np.any(np.isinf(value)))
+
+        return {
+            'shape': value.shape,
+            'dtype': value.dtype,
+            'writeable': value.flags.writeable,
+            'is_masked': isinstance(value, np.ma.MaskedArray),
+            'is_record': value.dtype.names is not None,
+            'vmin': vmin,
+            'vmax': vmax,
+            'has_inf': has_inf
+        }
+
+    @comm_handler
+    def get_array_block(self, name, rows, cols):
+        """
+        Get a block of an array.
+
+        `rows` and `cols` are the (start, stop) indexes of the block in the
+        two dimensional view of the array shown by the Array Editor, where
+        one dimensional arrays are shown as a column. Only the block is read
+        for lazy arrays.
+        """
+        import numpy as np
+
         ns = self.shell._get_current_namespace()
-        return ns[name]
+        value = ns[name]
+        if is_lazy_array(value) and value.ndim == 1:
+            block = np.asarray(value[rows[0]:rows[1]])[:, None]
+            return np.ascontiguousarray(block[:, cols[0]:cols[1]])
+        value = self._get_array_2d(value)
+        return np.ascontiguousarray(
+            value[rows[0]:rows[1], cols[0]:cols[1]])
+
+    @comm_handler
+    def set_array_values(self, name, changes):
+        """
+        Set individual values of an array.
+
+        `changes` is a dictionary whose keys are (row, column) indexes in
+        the two dimensional view of the array shown by the Array Editor.
+        """
+        ns = self.shell._get_reference_namespace(name)
+        value = self._get_array_2d(ns[name])
+        for index, new_value in changes.items():
+            value[index] = new_value
+
+    @comm_handler
+    def open_dataframe_view(self, name):
+        """
+        Open a view to show a DataFrame, Series or Index by blocks.
+
+        Returns the view information, with its id in 'view_id'.
+        """
+        ns = self.shell._get_current_namespace()
+        view = DataFrameView(ns[name])
+        view_id = next(self._dataframe_view_ids)
+        self._dataframe_views[view_id] = view
+
+        # Views that were not closed by the frontend are discarded when
+        # there are too many of them
+        while len(self._dataframe_views) > MAX_DATAFRAME_VIEWS:
+            self._dataframe_views.popitem(last=False)
+
+        info = view.get_info()
+        info['view_id'] = view_id
+        return info
+
+    @comm_handler
+    def get_dataframe_block(self, view_id, rows, cols):
+        """Get a block of a DataFrame view."""
+        return self._dataframe_views[view_id].get_block(rows, cols)
+
+    @comm_handler
+    def sort_dataframe_view(self, view_id, column, ascending=True):
+        """Sort a DataFrame view and return its new shape."""
+        view = self._dataframe_views[view_id]
+        view.sort(column, ascending)
+        return view.shape
+
+    @comm_handler
+    def filter_dataframe_view(self, view_id, column, text):
+        """Filter the rows of a DataFrame view and return its new shape."""
+        view = self._dataframe_views[view_id]
+        view.filter(column, text)
+        return view.shape
+
+    @comm_handler
+    def set_dataframe_values(self, view_id, changes):
+        """Set values of the object shown in a DataFrame view."""
+        self._dataframe_views[view_id].set_values(changes)
+
+    @comm_handler
+    def close_dataframe_view(self, view_id):
+        """Close a DataFrame view."""
+        self._dataframe_views.pop(view_id, None)
 
     @comm_handler
     def set_value(self, name, value):
@@ -358,7 +649,7 @@ def copy_value(self, orig_name, new_name):
         ns[new_name] = ns[orig_name]
 
     @comm_handler
-    def load_data(self, filename, ext, overwrite=False):
+    def load_data(self, filename, ext, overwrite=False, lazy=False):
         """
         Load data from filename.
 
@@ -370,12 +661,19 @@ def load_data(self, filename, ext, overwrite=False):
         'overwrite=True' will cause 'var' to be updated.
         In the other hand, with 'overwrite=False', a new variable will be
         created with a sufix starting with 000 i.e 'var000' (default behavior).
+
+        Use 'lazy' to memory-map the arrays of .spydata and .npy files, and
+        to read the datasets of HDF5 files only when they're sliced, instead
+        of reading them.
         """
         from spyder_kernels.utils.misc import fix_reference_name
 
         glbs = self.shell.user_ns
         load_func = iofunctions.load_funcs[ext]
-        data, error_message = load_func(filename)
+        if lazy and ext in LAZY_LOAD_EXTENSIONS:
+            data, error_message = load_func(filename, lazy=True)
+        else:
+            data, error_message = load_func(filename)
 
         if error_message:
             return error_message
@@ -416,7 +714,17 @@ def do_complete(self, code, cursor_pos):
         """
         if self.shell.is_debugging():
             return self.shell.pdb_session.do_complete(code, cursor_pos)
-        return self._do_complete(code, cursor_pos)
+        reply = self._do_complete(code, cursor_pos)
+        if isinstance(reply, dict) and getattr(self, 'io_loop', None):
+            # Prefetch the documentation of the first completions once the
+            # reply is sent, since it's likely to be requested next
+            prefix = re.search(r'[\w.]*$', code[:reply['cursor_start']])
+            objtxts = [
+                prefix.group() + match
+                for match in reply['matches'][:DOC_PREFETCH_COUNT]
+            ]
+            self.io_loop.add_callback(self.prefetch_doc, objtxts)
+        return reply
 
     def interrupt_eventloop(self):
         """
@@ -464,20 +772,48 @@ def get_doc(self, objtxt):
             matplotlib.rcParams['docstring.hardcopy'] = True
         except:
             pass
-        from spyder_kernels.utils.dochelpers import getdoc
+        from spyder_kernels.utils.dochelpers import doc_cache, getdoc
 
         obj, valid = self._eval(objtxt)
         if valid:
-            return getdoc(obj)
+            return doc_cache.get(getdoc, obj)
 
     @comm_handler
     def get_source(self, objtxt):
         """Get object source"""
-        from spyder_kernels.utils.dochelpers import getsource
+        from spyder_kernels.utils.dochelpers import doc_cache, getsource
 
         obj, valid = self._eval(objtxt)
         if valid:
-            return getsource(obj)
+            return doc_cache.get(getsource, obj)
+
+    @comm_handler
+    def prefetch_doc(self, objtxts):
+        """
+        Compute the documentation of objects that are likely to be requested
+        next, so that `get_doc` can get it from the cache.
+
+        Only the names of modules, classes and functions are looked up,
+        without running any code.
+        """
+        from spyder_kernels.utils.dochelpers import (
+            doc_cache, getdoc, getobjstatic)
+
+        ns = self.shell._get_current_namespace(with_magics=True)
+        for objtxt in objtxts:
+            obj = getobjstatic(objtxt, ns)
+            if obj is None:
+                continue
+            try:
+                doc_cache.get(getdoc, obj)
+            except Exception:
+                pass
+
+    @comm_handler
+    def get_doc_cache_stats(self):
+        """Get the hits, misses and size of the documentation cache."""
+        from spyder_kernels.utils.dochelpers import doc_cache
+        return doc_cache.get_stats()
 
     # -- For Matplolib
     @comm_handler
@@ -597,6 +933,16 @@ def set_autocall(self, autocall):
         """Enable/Disable autocall funtionality."""
         self._set_config_option('ZMQInteractiveShell.autocall', autocall)
 
+    @comm_handler
+    def set_max_output_rate(self, max_output_rate):
+        """
+        Set the maximum number of lines per second sent to the console, or 0
+        for no limit.
+        """
+        for stream in (sys.stdout, sys.stderr):
+            if isinstance(stream, TTYOutStream):
+                stream.set_max_output_rate(max_output_rate)
+
     # --- Additional methods
     @comm_handler
     def set_cwd(self, dirname):
@@ -622,6 +968,37 @@ def get_env(self):
         """Get environment variables."""
         return os.environ.copy()
 
+    @comm_handler
+    def get_code_cache_stats(self):
+        """
+        Get the hits, misses and size of the cache of code compiled by
+        runfile and runcell.
+        """
+        code_runner = self.shell.magics_manager.registry['SpyderCodeRunner']
+        return code_runner.code_cache.get_stats()
+
+    @comm_handler
+    def get_profile_results(self):
+        """
+        Get the name and time of the last profiling results, oldest first.
+        """
+        code_runner = self.shell.magics_manager.registry['SpyderCodeRunner']
+        return [
+            (name, timestamp)
+            for name, timestamp, __ in code_runner.profile_results
+        ]
+
+    @comm_handler
+    def get_profile_result(self, index=-1):
+        """
+        Get profiling results, as saved by `pstats.Stats.dump_stats`.
+
+        `index` is the position of the results in the list returned by
+        `get_profile_results`.
+        """
+        code_runner = self.shell.magics_manager.registry['SpyderCodeRunner']
+        return code_runner.profile_results[index][2]
+
     @comm_handler
     def close_all_mpl_figures(self):
         """Close all Matplotlib figures."""
@@ -679,7 +1056,30 @@ def update_syspath(self, path_dict, new_path_dict):
             os.environ.pop('PYTHONPATH', None)
 
     # -- Private API ---------------------------------------------------
+    def _get_namespace_view_spec(self):
+        """Get the view spec and sort values to pass to nsview."""
+        spec = self.namespace_view_spec
+        if spec.get('sort') == 'memory':
+            sizes = self.memory_accountant.get_usage()['sizes']
+            return dict(spec, sort='value'), sizes
+        return spec, None
+
     # --- For the Variable Explorer
+    def _get_var_properties(self, value):
+        """Return the properties of a variable."""
+        return {
+            'is_list':  self._is_list(value),
+            'is_dict':  self._is_dict(value),
+            'is_set': self._is_set(value),
+            'len': self._get_len(value),
+            'is_array': self._is_array(value),
+            'is_image': self._is_image(value),
+            'is_data_frame': self._is_data_frame(value),
+            'is_series': self._is_series(value),
+            'array_shape': self._get_array_shape(value),
+            'array_ndim': self._get_array_ndim(value)
+        }
+
     def _get_len(self, var):
         """Return sequence length"""
         try:
@@ -688,10 +1088,10 @@ def _get_len(self, var):
             return None
 
     def _is_array(self, var):
-        """Return True if variable is a NumPy array"""
+        """Return True if variable is a NumPy or lazy array"""
         try:
             import numpy
-            return isinstance(var, numpy.ndarray)
+            return isinstance(var, numpy.ndarray) or is_lazy_array(var)
         except:
             return False
 
@@ -753,6 +1153,14 @@ def _get_array_shape(self, var):
         except:
             return None
 
+    def _get_array_2d(self, var):
+        """Return a two dimensional view of an array."""
+        if var.ndim == 1:
+            return var[:, None]
+        elif var.ndim == 0:
+            return var[None, None]
+        return var
+
     def _get_array_ndim(self, var):
         """Return array's ndim"""
         try:
@@ -957,3 +1365,4 @@ def post_handler_hook(self):
         self.shell.register_debugger_sigint()
         # Reset tracing function so that pdb.set_trace works
         sys.settrace(None)
+        MonitoringTracer.stop_active()
@@ -10,13 +10,139 @@
 Custom Spyder Outstream class.
 """
 
+import os
+import sys
+import time
+
 from ipykernel.iostream import OutStream
 
 
+# Default maximum number of lines sent to the frontend per second, 0 for no
+# limit
+MAX_OUTPUT_RATE = 0
+
+# Packages whose flushes are sent immediately, because they need the output
+# to arrive before the messages they send next.
+IMMEDIATE_FLUSH_PACKAGES = {'ipykernel', 'IPython', 'spyder_kernels'}
+
+
+def collapse_carriage_returns(text):
+    """
+    Remove the parts of the lines of text that are overwritten after a
+    carriage return, as progress bars do.
+
+    Each line keeps its last non-empty part, preceded by a carriage return
+    so that the frontend still clears what was shown of it before.
+    """
+    if '\r' not in text:
+        return text
+
+    lines = text.split('\n')
+    for i, line in enumerate(lines):
+        parts = line.split('\r')
+        last = max(j for j, part in enumerate(parts) if part or j == 0)
+        if last > 0:
+            lines[i] = '\r' + '\r'.join(parts[last:])
+    return '\n'.join(lines)
+
+
 class TTYOutStream(OutStream):
-    """Subclass of OutStream that represents a TTY."""
+    """
+    Subclass of OutStream that represents a TTY.
+
+    Flushes requested by user code don't wait for the output to be sent.
+    Instead, the output is sent in batches every `flush_interval` seconds,
+    with the lines overwritten by carriage returns removed. If
+    `max_output_rate` is set, at most that many lines per second are sent,
+    and the lines above it are replaced by a message saying how many were
+    suppressed. It's off by default, so no output is lost.
+    """
 
     def __init__(self, session, pub_thread, name, pipe=None, echo=None, *,
                  watchfd=True):
         super().__init__(session, pub_thread, name, pipe,
                          echo=echo, watchfd=watchfd, isatty=True)
+        try:
+            self.max_output_rate = int(
+                os.environ.get('SPY_MAX_OUTPUT_RATE_O', MAX_OUTPUT_RATE))
+        except ValueError:
+            self.max_output_rate = MAX_OUTPUT_RATE
+        self.suppressed_lines = 0
+
+        # Lines that can be sent before exceeding the rate. They accumulate
+        # up to one second of output.
+        self._allowed_lines = self.max_output_rate
+        self._last_flush_time = time.monotonic()
+
+    def flush(self):
+        """
+        Send the output to the frontend.
+
+        This only schedules the output to be sent with the next batch when
+        called by user code.
+        """
+        caller = sys._getframe(1).f_globals.get('__name__') or ''
+        if (
+            caller.split('.')[0] not in IMMEDIATE_FLUSH_PACKAGES
+            and self._is_master_process()
+        ):
+            self._schedule_flush()
+        else:
+            super().flush()
+
+    def set_max_output_rate(self, max_output_rate):
+        """Set the maximum number of lines per second, or 0 for no limit."""
+        self.max_output_rate = max_output_rate
+        self._allowed_lines = max_output_rate
+
+    def _flush_buffers(self):
+        """Get the output to send, collapsed and limited to the max rate."""
+        self._update_allowed_lines()
+        for parent, data in super()._flush_buffers():
+            yield parent, self._limit_output(collapse_carriage_returns(data))
+
+    def _flush_buffer(self):
+        """
+        Get the output to send, collapsed and limited to the max rate.
+
+        This is what ipykernel calls instead of `_flush_buffers` before
+        version 6.29.
+        """
+        self._update_allowed_lines()
+        data = super()._flush_buffer()
+        return self._limit_output(collapse_carriage_returns(data))
+
+    def _update_allowed_lines(self):
+        """Add the lines allowed since the last flush."""
+        now = time.monotonic()
+        if self.max_output_rate:
+            self._allowed_lines = min(
+                self.max_output_rate,
+                self._allowed_lines
+                + (now - self._last_flush_time) * self.max_output_rate
+            )
+        self._last_flush_time = now
+
+    def _limit_output(self, data):
+        """Keep the last lines of data that don't exceed the max rate."""
+        if not self.max_output_rate:
+            return data
+
+        # Carriage returns don't start new lines here
+        lines = [line + '\n' for line in data.split('\n')]
+        lines[-1] = lines[-1][:-1]
+        if not lines[-1]:
+            lines.pop()
+
+        allowed = int(self._allowed_lines)
+        if len(lines) <= allowed:
+            self._allowed_lines -= len(lines)
+            return data
+
+        suppressed = len(lines) - allowed
+        self._allowed_lines -= allowed
+        self.suppressed_lines += suppressed
+        return (
+            '[... {} lines suppressed ...]\n'.format(suppressed)
+            + ''.join(lines[suppressed:])
+        )
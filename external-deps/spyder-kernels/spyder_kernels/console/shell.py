@@ -29,6 +29,7 @@
 from spyder_kernels.customize.code_runner import SpyderCodeRunner
 from spyder_kernels.comms.frontendcomm import CommError
 from spyder_kernels.comms.decorators import comm_handler
+from spyder_kernels.utils.dochelpers import doc_cache
 from spyder_kernels.utils.mpl import automatic_backend
 
 
@@ -44,7 +45,8 @@ class SpyderShell(ZMQInteractiveShell):
         'pdb_use_exclamation_mark',
         'pdb_stop_first_line',
         'breakpoints',
-        'pdb_publish_stack'
+        'pdb_publish_stack',
+        'pdb_use_monitoring',
     ]
 
     def __init__(self, *args, **kwargs):
@@ -362,6 +364,11 @@ def pdb_input_reply(self, line, echo_stack_entry=True):
         # Interrupts eventloop if needed
         self.kernel.interrupt_eventloop()
 
+    def reset(self, *args, **kwargs):
+        """Reset the namespace and forget the documentation cached for it."""
+        doc_cache.clear()
+        super().reset(*args, **kwargs)
+
     def do_post_execute(self):
         """Flush __std*__ after execution."""
         # Flush C standard streams.
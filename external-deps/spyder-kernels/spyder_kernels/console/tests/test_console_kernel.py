@@ -14,12 +14,14 @@
 import asyncio
 import os
 import os.path as osp
+import pstats
 from textwrap import dedent
 from contextlib import contextmanager
 import time
 from subprocess import Popen, PIPE
 import sys
 import inspect
+import json
 import uuid
 from collections import namedtuple
 
@@ -35,7 +37,13 @@
 from spyder_kernels.utils.mpl import MPL_BACKENDS_FROM_SPYDER
 from spyder_kernels.utils.test_utils import get_kernel, get_log_text
 from spyder_kernels.customize.spyderpdb import SpyderPdb
-from spyder_kernels.comms.commbase import CommBase
+from spyder_kernels.comms.commbase import (
+    CommBase, CommCancelled, REPLY_FRAME_SIZE, REPLY_STREAM_IDLE_TIMEOUT)
+from spyder_kernels.comms.compression import (
+    COMPRESSION_MIN_SIZE, choose_compressor, get_compressors)
+from spyder_kernels.comms.latency import LATENCY_BUCKETS
+from spyder_kernels.comms.multiplexer import CallMultiplexer
+from spyder_kernels.comms.tracer import merge_traces
 
 # =============================================================================
 # Constants and utility functions
@@ -333,6 +341,328 @@ def test_get_var_properties(kernel):
     assert "'array_ndim': None" in var_properties
 
 
+def test_get_namespace_view_delta(kernel):
+    """
+    Test that only the changes in the namespace view are sent.
+    """
+    asyncio.run(kernel.do_execute('a = 1; b = [1, 2]', True))
+
+    # The first delta contains all variables
+    delta = kernel.get_namespace_view_delta()
+    assert delta['base_version'] is None
+    assert set(delta['view']) == {'a', 'b'}
+    assert set(delta['var_properties']) == {'a', 'b'}
+    version = delta['version']
+
+    # Nothing changed
+    assert kernel.get_namespace_view_delta() is None
+
+    # Rebind, mutate and add variables
+    asyncio.run(kernel.do_execute('a = 2; b.append(3); c = 3; d = 4', True))
+    delta = kernel.get_namespace_view_delta()
+    assert delta['base_version'] == version
+    assert delta['view']['a']['view'] == '2'
+    assert delta['view']['b']['view'] == '[1, 2, 3]'
+    assert delta['var_properties']['b']['len'] == 3
+    assert set(delta['view']) == {'a', 'b', 'c', 'd'}
+    assert delta['removed'] == []
+
+    # Remove variables
+    asyncio.run(kernel.do_execute('del c', True))
+    delta = kernel.get_namespace_view_delta()
+    assert delta['view'] == {}
+    assert delta['removed'] == ['c']
+
+    # A full view contains all variables
+    delta = kernel.get_namespace_view_delta(full=True)
+    assert delta['base_version'] is None
+    assert set(delta['view']) == {'a', 'b', 'd'}
+
+
+def test_get_memory_usage(kernel):
+    """Test that the memory used by variables is computed in the background."""
+    asyncio.run(kernel.do_execute(
+        'import numpy as np; a = np.zeros(1000); b = list(range(10))', True))
+    kernel.get_namespace_view_delta()
+
+    accountant = kernel.memory_accountant
+    for __ in range(50):
+        if not accountant._pending.is_set():
+            usage = kernel.get_memory_usage()
+            if set(usage['sizes']) == {'a', 'b'}:
+                break
+        time.sleep(0.1)
+
+    usage = kernel.get_memory_usage()
+    assert usage['sizes']['a'] >= 8000
+    assert usage['total'] == usage['sizes']['a'] + usage['sizes']['b']
+
+
+def test_get_array_block(kernel):
+    """Test getting blocks of arrays and setting their values."""
+    asyncio.run(kernel.do_execute(
+        'import numpy as np; a = np.arange(20.).reshape(4, 5); '
+        'b = np.arange(4)', True))
+
+    # Array information
+    info = kernel.get_array_info('a')
+    assert info['shape'] == (4, 5)
+    assert info['dtype'] == np.float64
+    assert info['writeable']
+    assert not info['is_masked']
+    assert not info['is_record']
+    assert (info['vmin'], info['vmax']) == (0, 19)
+    assert not info['has_inf']
+
+    # Two dimensional block
+    block = kernel.get_array_block('a', (1, 3), (2, 4))
+    assert np.array_equal(block, np.array([[7., 8.], [12., 13.]]))
+
+    # One dimensional arrays are shown as a column
+    block = kernel.get_array_block('b', (1, 10), (0, 1))
+    assert np.array_equal(block, np.array([[1], [2], [3]]))
+
+    # Set values
+    kernel.set_array_values('a', {(0, 0): 100, (3, 4): -1})
+    kernel.set_array_values('b', {(2, 0): 10})
+    a = kernel.get_value('a')
+    assert a[0, 0] == 100
+    assert a[3, 4] == -1
+    assert np.array_equal(kernel.get_value('b'), np.array([0, 1, 10, 3]))
+
+
+def test_get_lazy_array_block(kernel, tmpdir):
+    """Test getting blocks of arrays loaded lazily from an HDF5 file."""
+    h5py = pytest.importorskip('h5py')
+    filename = str(tmpdir.join('lazy.h5'))
+    with h5py.File(filename, 'w') as f:
+        f['a'] = np.arange(20.).reshape(4, 5)
+        f['b'] = np.arange(4)
+
+    error = kernel.load_data(filename, '.h5', lazy=True)
+    assert error is None
+    assert kernel._is_array(kernel.shell.user_ns['a'])
+
+    # The range of values is not computed and the array can't be edited
+    info = kernel.get_array_info('a')
+    assert info['shape'] == (4, 5)
+    assert info['dtype'] == np.float64
+    assert not info['writeable']
+    assert (info['vmin'], info['vmax']) == (None, None)
+
+    block = kernel.get_array_block('a', (1, 3), (2, 4))
+    assert isinstance(block, np.ndarray)
+    assert np.array_equal(block, np.array([[7., 8.], [12., 13.]]))
+    block = kernel.get_array_block('b', (1, 10), (0, 1))
+    assert np.array_equal(block, np.array([[1], [2], [3]]))
+
+    # The whole array is read when its value is requested
+    assert np.array_equal(kernel.get_value('b'), np.arange(4))
+
+
+def test_code_cache(kernel, tmpdir):
+    """Test that code run several times is only compiled once."""
+    p = tmpdir.join("cached.py")
+    p.write("a = 1\nb = a + 1\nb")
+    runfile = "%runfile {} --current-namespace".format(repr(str(p)))
+    code_runner = kernel.shell.magics_manager.registry['SpyderCodeRunner']
+    code_runner.code_cache.clear()
+    stats = kernel.get_code_cache_stats()
+
+    for i in range(3):
+        asyncio.run(kernel.do_execute(runfile, True))
+    assert kernel.shell.user_ns['b'] == 2
+    new_stats = kernel.get_code_cache_stats()
+    assert new_stats['misses'] == stats['misses'] + 1
+    assert new_stats['hits'] == stats['hits'] + 2
+    assert new_stats['size'] == 1
+
+    # Changed code is compiled again
+    p.write("b = 3")
+    asyncio.run(kernel.do_execute(runfile, True))
+    assert kernel.shell.user_ns['b'] == 3
+    new_stats = kernel.get_code_cache_stats()
+    assert new_stats['misses'] == stats['misses'] + 2
+    assert new_stats['size'] == 2
+
+
+def test_preload_modules(kernel, monkeypatch):
+    """Test that modules are preloaded when the comm is ready."""
+    monkeypatch.setenv('SPY_PRELOAD_MODULES_O', 'xml.dom.minidom, spyder_no')
+    kernel.handle_comm_ready()
+    kernel.module_preloader._thread.join(5)
+
+    timings = kernel.get_preload_timings()
+    assert timings['finished']
+    assert 'xml.dom.minidom' in sys.modules
+    assert timings['modules']['xml.dom.minidom'] >= 0
+    assert timings['modules']['spyder_no'] is None
+
+
+def test_profile_magics(kernel, tmpdir):
+    """Test profiling cells and files in the current namespace."""
+    code = dedent("""
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        fib(n)
+        """)
+    asyncio.run(kernel.do_execute('n = 10', True))
+    asyncio.run(kernel.do_execute('%%profile fib cell\n' + code, True))
+
+    p = tmpdir.join("fib.py")
+    p.write(code + "result = 1")
+    asyncio.run(kernel.do_execute(
+        "%profilefile {} --current-namespace".format(repr(str(p))), True))
+    assert kernel.shell.user_ns['result'] == 1
+
+    results = kernel.get_profile_results()
+    assert [name for name, __ in results[-2:]] == ['fib cell', str(p)]
+
+    # The results can be loaded by pstats
+    p = tmpdir.join("fib.prof")
+    p.write_binary(kernel.get_profile_result(-2))
+    stats = pstats.Stats(str(p))
+    calls = {
+        func[2]: ncalls for func, (__, ncalls, *__) in stats.stats.items()
+    }
+    assert calls['fib'] == 177
+
+    # Sampling mode
+    asyncio.run(kernel.do_execute(
+        '%%profile --sampling --interval 1 sampled\n'
+        'import time\n'
+        'time.sleep(0.2)', True))
+    assert kernel.get_profile_results()[-1][0] == 'sampled'
+    p.write_binary(kernel.get_profile_result())
+    stats = pstats.Stats(str(p))
+    assert stats.total_tt > 0.1
+
+
+def test_output_coalescing():
+    """
+    Test that output flushed by user code is sent in batches, with the lines
+    overwritten by carriage returns and above the max rate removed.
+    """
+    import zmq
+    from jupyter_client.session import Session
+    from ipykernel.iostream import IOPubThread
+    from spyder_kernels.console.outstream import (
+        TTYOutStream, collapse_carriage_returns)
+
+    assert collapse_carriage_returns('a\rb\rc') == '\rc'
+    assert collapse_carriage_returns('10%\r20%\r') == '\r20%\r'
+    assert collapse_carriage_returns('a\r\nb\n1\r2') == 'a\r\nb\n\r2'
+
+    ctx = zmq.Context()
+    pub = ctx.socket(zmq.PUB)
+    thread = IOPubThread(pub)
+    thread.start()
+    session = Session()
+    texts = []
+
+    def send(stream, msg, ident=None):
+        texts.append(msg['content']['text'])
+
+    session.send = send
+    stream = TTYOutStream(session, thread, 'stdout', watchfd=False)
+    # Flush by hand below, instead of waiting for the scheduled flush
+    stream.flush_interval = 3600
+
+    # No output is suppressed by default
+    assert stream.max_output_rate == 0
+    assert stream._limit_output('line\n' * 5000) == 'line\n' * 5000
+
+    stream.set_max_output_rate(100)
+    try:
+        # Run as user code, whose flushes are not immediate
+        exec(
+            dedent("""
+                for i in range(10):
+                    stream.write('{}%\\r'.format(i * 10))
+                    stream.flush()
+                stream.write('\\n')
+                for i in range(200):
+                    stream.write('line {}\\n'.format(i))
+                    stream.flush()
+                """),
+            {'__name__': '__main__', 'stream': stream}
+        )
+
+        # Nothing was sent yet
+        assert texts == []
+        stream._flush()
+        assert len(texts) == 1
+        assert texts[0] == (
+            '[... 101 lines suppressed ...]\n'
+            + ''.join('line {}\n'.format(i) for i in range(100, 200))
+        )
+        assert stream.suppressed_lines == 101
+
+        # Progress bars are collapsed, even without a max rate
+        stream.set_max_output_rate(0)
+        exec(
+            dedent("""
+                for i in range(10):
+                    stream.write('{}%\\r'.format(i * 10))
+                    stream.flush()
+                """),
+            {'__name__': '__main__', 'stream': stream}
+        )
+        stream._flush()
+        assert texts[1] == '\r90%\r'
+    finally:
+        stream.close()
+        thread.stop()
+        thread.close()
+        ctx.term()
+
+
+def test_doc_cache(kernel):
+    """Test that documentation is cached and prefetched by the kernel."""
+    asyncio.run(kernel.do_execute('import os', True))
+    kernel.shell.reset(new_session=False)
+    stats = kernel.get_doc_cache_stats()
+    assert stats['size'] == 0
+
+    asyncio.run(kernel.do_execute('import os', True))
+    kernel.prefetch_doc(['os.path.join', 'os.sep', 'undefined'])
+    assert kernel.get_doc_cache_stats()['misses'] == stats['misses'] + 1
+
+    doc = kernel.get_doc('os.path.join')
+    assert doc['name'] == 'join'
+    new_stats = kernel.get_doc_cache_stats()
+    assert new_stats['hits'] == stats['hits'] + 1
+    assert new_stats['size'] == 1
+
+    # The cache is cleared when the namespace is reset
+    kernel.shell.reset(new_session=False)
+    assert kernel.get_doc_cache_stats()['size'] == 0
+
+
+def test_dataframe_view(kernel):
+    """Test showing a DataFrame through a view in the kernel."""
+    asyncio.run(kernel.do_execute(
+        'import pandas as pd; df = pd.DataFrame({"a": [3, 1, 2]})', True))
+
+    info = kernel.open_dataframe_view('df')
+    view_id = info['view_id']
+    assert info['shape'] == (3, 1)
+
+    # Sort and filter in the kernel
+    assert kernel.sort_dataframe_view(view_id, 0) == (3, 1)
+    assert kernel.filter_dataframe_view(view_id, 0, '2') == (1, 1)
+    block = kernel.get_dataframe_block(view_id, (0, 500), (0, 40))
+    assert block['data']['a'].tolist() == [2]
+
+    # Changes use the positions in the original object
+    kernel.set_dataframe_values(view_id, {(block['rows'][0], 0): 5})
+    assert kernel.get_value('df')['a'].tolist() == [3, 1, 5]
+
+    kernel.close_dataframe_view(view_id)
+    assert view_id not in kernel._dataframe_views
+
+
 def test_get_value(kernel):
     """Test getting the value of a variable."""
     name = 'a'
@@ -1137,6 +1467,191 @@ def test_locals_globals_in_pdb(kernel):
     pdb_obj.curframe_locals = None
 
 
+def test_pdb_code_filters(kernel):
+    """Test the filters cached by the debugger for each code object."""
+    def hidden():
+        __tracebackhide__ = True
+
+    def visible():
+        pass
+
+    pdb_obj = SpyderPdb()
+    lib_code = dedent.__code__
+    assert pdb_obj._get_code_filters(hidden.__code__)[0]
+    assert not pdb_obj._get_code_filters(visible.__code__)[0]
+
+    # spyder-kernels internals are skipped
+    assert pdb_obj._get_code_filters(SpyderPdb.stop_here.__code__)[1]
+    assert not pdb_obj._get_code_filters(lib_code)[1]
+
+    # Changing the settings invalidates the cache
+    pdb_obj.pdb_ignore_lib = True
+    assert pdb_obj._get_code_filters(lib_code)[1]
+    pdb_obj.skip_hidden = False
+    assert not pdb_obj._get_code_filters(SpyderPdb.stop_here.__code__)[1]
+
+
+@pytest.mark.parametrize("use_monitoring", [False, True])
+def test_pdb_backends(kernel, tmpdir, use_monitoring):
+    """
+    Test that breakpoints and stepping work the same with sys.settrace and
+    sys.monitoring.
+    """
+    if use_monitoring and sys.version_info < (3, 12):
+        pytest.skip("sys.monitoring requires Python 3.12+")
+    from spyder_kernels.customize.monitoring import MonitoringTracer
+
+    code = dedent("""
+        def f(x):
+            y = x + 1
+            return y
+
+        def g(x):
+            return x
+
+        for i in range(5):
+            g(i)
+            f(i)
+        """)
+    filename = str(tmpdir.join("pdb-backend-test.py"))
+    with open(filename, "w") as f:
+        f.write(code)
+
+    stops = []
+
+    class Debugger(SpyderPdb):
+        def interaction(self, frame, traceback):
+            stops.append((frame.f_lineno, frame.f_locals.get('x')))
+            if use_monitoring:
+                assert sys.gettrace() is None
+                assert MonitoringTracer.active is self._tracer
+            if len(stops) == 3:
+                self.set_next(frame)
+            else:
+                self.set_continue()
+
+    kernel.shell._namespace_stack = []
+    pdb_obj = Debugger()
+    pdb_obj.pdb_use_monitoring = use_monitoring
+    pdb_obj.set_spyder_breakpoints({filename: [(3, 'x % 2 == 0')]})
+    try:
+        pdb_obj.run(compile(code, filename, 'exec'), {})
+    finally:
+        pdb_obj.set_spyder_breakpoints({})
+
+    # Stop at the first line, then on the breakpoint and after `next`
+    assert stops == [(2, None), (3, 0), (3, 2), (4, 2), (3, 4)]
+    assert MonitoringTracer.active is None
+
+
+@pytest.mark.parametrize("use_monitoring", [False, True])
+def test_pdb_backends_set_trace(kernel, tmpdir, use_monitoring):
+    """Test stepping after set_trace with sys.settrace and sys.monitoring."""
+    if use_monitoring and sys.version_info < (3, 12):
+        pytest.skip("sys.monitoring requires Python 3.12+")
+    from spyder_kernels.customize.monitoring import MonitoringTracer
+
+    code = dedent("""
+        def h(a):
+            return a * 2
+
+        def f():
+            debugger.set_trace()
+            x = 1
+            y = h(x)
+            return y
+
+        result = f()
+        """)
+    filename = str(tmpdir.join("pdb-set-trace-test.py"))
+    with open(filename, "w") as f:
+        f.write(code)
+
+    stops = []
+
+    class Debugger(SpyderPdb):
+        def interaction(self, frame, traceback):
+            stops.append((frame.f_code.co_name, frame.f_lineno))
+            if frame.f_code.co_name == 'h':
+                self.set_continue()
+            else:
+                self.set_step()
+
+    kernel.shell._namespace_stack = []
+    pdb_obj = Debugger()
+    pdb_obj.pdb_use_monitoring = use_monitoring
+    namespace = {'debugger': pdb_obj}
+    try:
+        exec(compile(code, filename, 'exec'), namespace)
+    finally:
+        sys.settrace(None)
+        MonitoringTracer.stop_active()
+        kernel.shell._namespace_stack = []
+
+    assert namespace['result'] == 2
+    if sys.version_info >= (3, 13):
+        # Stop on the set_trace line
+        assert stops[0] == ('f', 6)
+        stops.pop(0)
+    assert stops == [('f', 7), ('f', 8), ('h', 2)]
+
+
+@pytest.mark.parametrize("use_monitoring", [False, True])
+def test_pdb_backends_next_return(kernel, tmpdir, use_monitoring):
+    """
+    Test that `next` past a return stops in a caller that was not traced
+    because it was entered while continuing.
+    """
+    if use_monitoring and sys.version_info < (3, 12):
+        pytest.skip("sys.monitoring requires Python 3.12+")
+    from spyder_kernels.customize.monitoring import MonitoringTracer
+
+    code = dedent("""
+        def f(a):
+            b = a + 1
+            return b
+
+        def main():
+            x = f(1)
+            y = x + 1
+            return y
+
+        result = main()
+        """)
+    filename = str(tmpdir.join("pdb-next-return-test.py"))
+    with open(filename, "w") as f:
+        f.write(code)
+
+    stops = []
+
+    class Debugger(SpyderPdb):
+        def interaction(self, frame, traceback):
+            stops.append((frame.f_code.co_name, frame.f_lineno))
+            if len(stops) == 1:
+                self.set_continue()
+            elif frame.f_code.co_name in ('f', 'main'):
+                self.set_next(frame)
+            else:
+                self.set_continue()
+
+    kernel.shell._namespace_stack = []
+    pdb_obj = Debugger()
+    pdb_obj.pdb_use_monitoring = use_monitoring
+    pdb_obj.set_spyder_breakpoints({filename: [(3, None)]})
+    namespace = {}
+    try:
+        pdb_obj.run(compile(code, filename, 'exec'), namespace)
+    finally:
+        pdb_obj.set_spyder_breakpoints({})
+
+    assert namespace['result'] == 3
+    # Stop at the first line, on the breakpoint, then go back to main
+    assert stops[:6] == [
+        ('<module>', 2), ('f', 3), ('f', 4), ('f', 4), ('main', 8),
+        ('main', 9)]
+    assert MonitoringTracer.active is None
+
+
 @flaky(max_runs=3)
 @pytest.mark.parametrize("backend", [None, 'inline', 'tk', 'qt5'])
 @pytest.mark.skipif(
@@ -1361,6 +1876,358 @@ def test_enter_debug_after_interruption():
         assert time.time() - t0 < 5
 
 
+class LoopbackComm:
+    """Comm delivering its messages synchronously to a peer."""
+
+    def __init__(self, comm_id):
+        self.comm_id = comm_id
+        self.peer = None
+        self._msg_callback = None
+
+    def on_msg(self, callback):
+        self._msg_callback = callback
+
+    def on_close(self, callback):
+        pass
+
+    def send(self, data, buffers):
+        self.peer._msg_callback({
+            'content': {'comm_id': self.comm_id, 'data': data},
+            'buffers': buffers
+        })
+
+
+class DeferredLoopbackComm(LoopbackComm):
+    """Comm delivering its messages to its peer when `deliver` is called."""
+
+    def __init__(self, comm_id):
+        super().__init__(comm_id)
+        self.queue = []
+
+    def send(self, data, buffers):
+        self.queue.append((data, buffers))
+
+    def deliver(self):
+        queue, self.queue = self.queue, []
+        for data, buffers in queue:
+            super().send(data, buffers)
+
+
+class LoopbackCommBase(CommBase):
+    """CommBase whose replies are received before waiting for them."""
+
+    def _wait_reply(self, comm_id, call_id, call_name, timeout):
+        if call_id not in self._reply_inbox:
+            raise TimeoutError("No reply for {}".format(call_name))
+
+
+@pytest.mark.parametrize("protocol", [4, 5])
+def test_streamed_reply(protocol):
+    """Test that large replies are streamed in frames and can be cancelled."""
+    frontend_comm = LoopbackCommBase()
+    kernel_comm = LoopbackCommBase()
+    frontend_side, kernel_side = LoopbackComm('id'), LoopbackComm('id')
+    frontend_side.peer, kernel_side.peer = kernel_side, frontend_side
+    frontend_comm._register_comm(frontend_side)
+    kernel_comm._register_comm(kernel_side)
+    frontend_comm.on_outgoing_call = lambda call_dict: dict(
+        call_dict, pickle_highest_protocol=protocol)
+
+    value = np.arange(REPLY_FRAME_SIZE // 2, dtype=np.float64)
+    kernel_comm.register_call_handler('get_value', lambda: value)
+    kernel_comm.register_call_handler('get_small_value', lambda: 'small')
+
+    progress = []
+    frontend_comm.on_stream_progress = (
+        lambda call_dict, received, total: progress.append((received, total)))
+
+    # The value is received in order in several frames
+    result = frontend_comm.remote_call(
+        blocking=True, stream=True).get_value()
+    assert np.array_equal(result, value)
+    assert len(progress) > 3
+    assert progress == sorted(progress)
+    assert progress[-1][0] == progress[-1][1] > value.nbytes
+    assert kernel_comm._reply_streams == {}
+
+    # Small values are not streamed
+    progress.clear()
+    assert frontend_comm.remote_call(
+        blocking=True, stream=True).get_small_value() == 'small'
+    assert progress == []
+
+    # Cancel after receiving the first frame
+    def cancel(call_dict, received, total):
+        progress.append((received, total))
+        frontend_comm.cancel_call(call_dict['call_id'])
+
+    frontend_comm.on_stream_progress = cancel
+    with pytest.raises(CommCancelled):
+        frontend_comm.remote_call(blocking=True, stream=True).get_value()
+    assert len(progress) == 1
+    assert kernel_comm._reply_streams == {}
+    assert frontend_comm._cancelled_calls == set()
+
+    # The stream is dropped too when a frame request times out
+    progress.clear()
+    frontend_comm.on_stream_progress = (
+        lambda call_dict, received, total: progress.append((received, total)))
+    wait_reply = frontend_comm._wait_reply
+
+    def wait_first_frame(comm_id, call_id, call_name, timeout):
+        if call_name == '_get_reply_frame' and progress:
+            raise TimeoutError("Timeout while waiting for a frame")
+        wait_reply(comm_id, call_id, call_name, timeout)
+
+    frontend_comm._wait_reply = wait_first_frame
+    with pytest.raises(TimeoutError):
+        frontend_comm.remote_call(blocking=True, stream=True).get_value()
+    assert len(progress) == 1
+    assert kernel_comm._reply_streams == {}
+
+    # Streams whose frames are not requested anymore expire
+    kernel_comm._add_reply_stream('id', [b'x' * 10], [10])
+    assert kernel_comm._expire_reply_streams()
+    kernel_comm._reply_streams['id']['last_access'] -= (
+        REPLY_STREAM_IDLE_TIMEOUT + 1)
+    assert not kernel_comm._expire_reply_streams()
+    assert kernel_comm._reply_streams == {}
+
+
+@pytest.mark.parametrize("compressor", get_compressors())
+def test_compressed_messages(compressor):
+    """Test that large messages are compressed with the chosen compressor."""
+    frontend_comm = LoopbackCommBase()
+    kernel_comm = LoopbackCommBase()
+    frontend_side, kernel_side = LoopbackComm('id'), LoopbackComm('id')
+    frontend_side.peer, kernel_side.peer = kernel_side, frontend_side
+    frontend_comm._register_comm(frontend_side)
+    kernel_comm._register_comm(kernel_side)
+
+    # The kernel side chooses among the compressors sent on comm open
+    kernel_comm.calling_comm_id = 'id'
+    kernel_comm._set_compressor(choose_compressor([compressor, 'unknown']))
+
+    value = 'spam' * COMPRESSION_MIN_SIZE
+    kernel_comm.register_call_handler('get_value', lambda v=None: value)
+
+    # The frontend side uses the compressor it gets in the first reply
+    assert frontend_comm.remote_call(blocking=True).get_value() == value
+    assert frontend_comm._comms['id']['compressor'] == compressor
+    assert frontend_comm.remote_call(blocking=True).get_value(value) == value
+
+    kernel_stats = kernel_comm.get_compression_stats()
+    frontend_stats = frontend_comm.get_compression_stats()
+    assert kernel_stats['compressors'] == {'id': compressor}
+    assert frontend_stats['compressors'] == {'id': compressor}
+    assert kernel_stats['compressed_messages'] == 2
+    assert frontend_stats['decompressed_messages'] == 2
+    assert frontend_stats['compressed_messages'] == 1
+    assert kernel_stats['decompressed_messages'] == 1
+    assert kernel_stats['ratio'] > 10
+
+    # Small messages are not compressed
+    kernel_comm.compression_stats.reset()
+    kernel_comm.register_call_handler('get_small_value', lambda: 'small')
+    assert frontend_comm.remote_call(
+        blocking=True).get_small_value() == 'small'
+    stats = kernel_comm.get_compression_stats()
+    assert stats['sent_messages'] == 1
+    assert stats['compressed_messages'] == 0
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_compressed_out_of_band_buffers(stream):
+    """
+    Test that large arrays sent out-of-band, or in the frames of a streamed
+    reply, are compressed.
+    """
+    frontend_comm = LoopbackCommBase()
+    kernel_comm = LoopbackCommBase()
+    frontend_side, kernel_side = LoopbackComm('id'), LoopbackComm('id')
+    frontend_side.peer, kernel_side.peer = kernel_side, frontend_side
+    frontend_comm._register_comm(frontend_side)
+    kernel_comm._register_comm(kernel_side)
+    frontend_comm.on_outgoing_call = lambda call_dict: dict(
+        call_dict, pickle_highest_protocol=5)
+    kernel_comm.calling_comm_id = 'id'
+    kernel_comm._set_compressor(get_compressors()[0])
+
+    sent = []
+    send = kernel_side.send
+
+    def recording_send(data, buffers):
+        sent.append((data['compressed'], buffers))
+        send(data, buffers)
+
+    kernel_side.send = recording_send
+
+    value = np.zeros(REPLY_FRAME_SIZE, dtype=np.uint8)
+    kernel_comm.register_call_handler('get_value', lambda: value)
+    result = frontend_comm.remote_call(
+        blocking=True, stream=stream).get_value()
+    assert np.array_equal(result, value)
+
+    # The array is in the out-of-band buffers, which are all compressed
+    compressed, buffers = sent[-1]
+    assert len(buffers) > 1
+    assert all(compressed[1:])
+    assert sum(memoryview(b).nbytes for b in buffers[1:]) < value.nbytes
+    if stream:
+        assert len(sent) > 2
+    stats = kernel_comm.get_compression_stats()
+    assert stats['raw_bytes'] >= value.nbytes
+    assert stats['ratio'] > 10
+
+
+def test_multiplexed_calls():
+    """
+    Test that multiplexed calls are pipelined, coalesced and superseded, and
+    that their latency is recorded.
+    """
+    frontend_comm = LoopbackCommBase()
+    kernel_comm = LoopbackCommBase()
+    frontend_side = DeferredLoopbackComm('id')
+    kernel_side = LoopbackComm('id')
+    frontend_side.peer, kernel_side.peer = kernel_side, frontend_side
+    frontend_comm._register_comm(frontend_side)
+    kernel_comm._register_comm(kernel_side)
+
+    calls = []
+
+    def double(value):
+        calls.append(value)
+        return 2 * value
+
+    kernel_comm.register_call_handler('double', double)
+    kernel_comm.register_call_handler('fail', lambda: 1 / 0)
+    multiplexer = CallMultiplexer(frontend_comm)
+
+    # Calls are sent without waiting for the previous replies, and identical
+    # calls waiting for their reply are only sent once
+    future_1 = multiplexer.remote_call().double(1)
+    future_2 = multiplexer.remote_call().double(2)
+    assert multiplexer.remote_call().double(1) is future_1
+    assert len(frontend_side.queue) == 2
+    assert not future_1.done()
+
+    frontend_side.deliver()
+    assert future_1.result() == 2
+    assert future_2.result() == 4
+    assert calls == [1, 2]
+    assert multiplexer.coalesced_calls == 1
+
+    # Calls that were replied to are sent again
+    future_3 = multiplexer.remote_call().double(1)
+    assert future_3 is not future_1
+
+    # The reply of superseded calls is ignored
+    results = []
+    future_4 = multiplexer.remote_call(
+        supersede='key', callback=results.append).double(4)
+    future_5 = multiplexer.remote_call(
+        supersede='key', callback=results.append).double(5)
+    assert future_4.cancelled()
+    frontend_side.deliver()
+    assert results == [10]
+    assert future_3.result() == 2
+    with pytest.raises(CommCancelled):
+        future_4.result()
+
+    # Errors are raised when getting the result
+    future = multiplexer.remote_call().fail()
+    frontend_side.deliver()
+    with pytest.raises(ZeroDivisionError):
+        future.result()
+
+    # The latency of all calls that were replied to is recorded
+    stats = frontend_comm.get_latency_stats()
+    assert stats['buckets'] == LATENCY_BUCKETS
+    assert set(stats['calls']) == {'double', 'fail'}
+    histogram = stats['calls']['double']
+    assert histogram['count'] == 4
+    assert sum(histogram['buckets']) == 4
+    assert 0 < histogram['mean'] <= histogram['p95'] <= histogram['max']
+    assert frontend_comm._call_times == {}
+    assert frontend_comm._reply_waitlist == {}
+
+
+def test_comm_tracer(tmpdir):
+    """Test that the timings of the calls are traced on both sides."""
+    frontend_comm = LoopbackCommBase()
+    kernel_comm = LoopbackCommBase()
+    frontend_side = DeferredLoopbackComm('id')
+    kernel_side = LoopbackComm('id')
+    frontend_side.peer, kernel_side.peer = kernel_side, frontend_side
+    frontend_comm._register_comm(frontend_side)
+    kernel_comm._register_comm(kernel_side)
+    kernel_comm.register_call_handler('double', lambda value: 2 * value)
+
+    # Nothing is recorded by default
+    assert frontend_comm.tracer is None
+    assert frontend_comm.dump_trace() is None
+
+    frontend_comm.start_tracing()
+    kernel_comm.start_tracing(str(tmpdir))
+
+    future = frontend_comm.remote_call(future=True).double(1)
+    cancelled = frontend_comm.remote_call(future=True).double(2)
+    frontend_comm.remote_call().double(3)
+    cancelled.cancel()
+    frontend_side.deliver()
+    assert future.result() == 2
+
+    # Replied, cancelled and not replied calls are recorded when sending
+    frontend_events = frontend_comm.tracer.get_trace()['traceEvents']
+    calls = sorted(
+        [event for event in frontend_events if event['ph'] != 'M'],
+        key=lambda event: event['ts'])
+    assert [event['ph'] for event in calls] == ['X', 'X', 'i']
+    assert calls[0]['args']['call_id'] == future.call_id
+    assert calls[1]['args']['cancelled']
+    assert all(event['name'] == 'double' for event in calls)
+    assert calls[0]['dur'] > 0
+
+    # Handled calls are recorded on the other side, in the same time base
+    dump_future = frontend_comm.remote_call(future=True)._dump_comm_trace()
+    frontend_side.deliver()
+    filename = dump_future.result()
+    assert filename == kernel_comm.tracer.get_filename()
+    assert filename.startswith(str(tmpdir))
+    with open(filename) as f:
+        kernel_events = json.load(f)['traceEvents']
+    handled = [event for event in kernel_events
+               if event.get('cat') == 'handle' and event['name'] == 'double']
+    assert len(handled) == 3
+    assert (calls[0]['ts'] <= handled[0]['ts']
+            <= calls[0]['ts'] + calls[0]['dur'])
+
+    # Traces can be merged
+    frontend_file = str(tmpdir.join('frontend.json'))
+    assert frontend_comm.dump_trace(frontend_file) == frontend_file
+    merged_file = str(tmpdir.join('merged.json'))
+    merge_traces([frontend_file, filename], merged_file)
+    with open(merged_file) as f:
+        merged = json.load(f)['traceEvents']
+    assert len(merged) == (
+        len(frontend_comm.tracer.events) + len(kernel_events) + 1)
+
+    # Blocking calls that time out are forgotten
+    with pytest.raises(TimeoutError):
+        frontend_comm.remote_call(blocking=True).double(5)
+    frontend_side.queue = []
+    assert frontend_comm.tracer._sent_calls == {}
+    assert frontend_comm._call_times == {}
+    assert frontend_comm._reply_waitlist == {}
+
+    # Nothing is recorded after stopping
+    tracer = frontend_comm.stop_tracing()
+    n_events = len(tracer.events)
+    frontend_comm.remote_call(future=True).double(4)
+    assert len(tracer.events) == n_events
+    kernel_comm.stop_tracing()
+
+
 def test_non_strings_in_locals(kernel):
     """
     Test that we can hande non-string entries in `locals` when bulding the
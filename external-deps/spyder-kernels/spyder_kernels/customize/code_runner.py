@@ -13,11 +13,16 @@
 import ast
 import bdb
 import builtins
+from collections import deque
 from contextlib import contextmanager
+import cProfile
+import hashlib
 import io
 import logging
+import marshal
 import os
 import pdb
+import pstats
 import shlex
 import sys
 import time
@@ -32,21 +37,35 @@
     needs_local_scope,
     magics_class,
     Magics,
+    cell_magic,
     line_magic,
 )
 from IPython.core import magic_arguments
 
 # Local imports
+from spyder_kernels.comms.commbase import CommError
 from spyder_kernels.comms.frontendcomm import frontend_request
 from spyder_kernels.customize.namespace_manager import NamespaceManager
 from spyder_kernels.customize.spyderpdb import SpyderPdb
 from spyder_kernels.customize.umr import UserModuleReloader
 from spyder_kernels.customize.utils import capture_last_Expr, canonic
+from spyder_kernels.utils.misc import LRUCache
+from spyder_kernels.utils.sampling import SAMPLING_INTERVAL, SamplingProfiler
 
 
 # For logging
 logger = logging.getLogger(__name__)
 
+# Number of compiled cells and files kept in the cache
+CODE_CACHE_SIZE = 32
+
+# Number of profiling results kept to compare them
+PROFILE_RESULTS_SIZE = 10
+
+# Number of functions printed when profiling results can't be shown in the
+# Profiler pane
+PROFILE_PRINT_LIMIT = 20
+
 
 def runfile_arguments(func):
     """Decorator to add runfile magic arguments to magic."""
@@ -98,6 +117,30 @@ def runfile_arguments(func):
     return func
 
 
+def profile_arguments(func):
+    """Decorator to add profiling arguments to magic."""
+    decorators = [
+        magic_arguments.argument(
+            "--sampling", "-s",
+            action="store_true",
+            help="""
+            Sample the call stacks instead of tracing every call
+            """,
+        ),
+        magic_arguments.argument(
+            "--interval",
+            type=float,
+            default=SAMPLING_INTERVAL * 1000,
+            help="""
+            Time between samples, in milliseconds
+            """,
+        ),
+        ]
+    for dec in reversed(decorators):
+        func = dec(func)
+    return func
+
+
 def runcell_arguments(func):
     """Decorator to add runcell magic arguments to magic."""
     decorators = [
@@ -146,6 +189,10 @@ def __init__(self, *args, **kwargs):
         self.umr = UserModuleReloader(
             namelist=os.environ.get("SPY_UMR_NAMELIST", None)
         )
+        self.code_cache = LRUCache(CODE_CACHE_SIZE)
+        self._transformer_manager = TransformerManager()
+        # (name, time, pstats data) of the last profiling results
+        self.profile_results = deque(maxlen=PROFILE_RESULTS_SIZE)
         super().__init__(*args, **kwargs)
 
     @runfile_arguments
@@ -230,6 +277,114 @@ def debugcell(self, line, local_ns=None):
                 context_locals=local_ns,
             )
 
+    @runfile_arguments
+    @profile_arguments
+    @needs_local_scope
+    @line_magic
+    def profilefile(self, line, local_ns=None):
+        """
+        Profile a file.
+        """
+        args, local_ns = self._parse_runfile_argstring(
+            self.profilefile, line, local_ns)
+
+        with self._profile_exec(args.canonic_filename, args) as profile_exec:
+            self._exec_file(
+                filename=args.filename,
+                canonic_filename=args.canonic_filename,
+                args=args.args,
+                wdir=args.wdir,
+                current_namespace=args.current_namespace,
+                exec_fun=profile_exec,
+                post_mortem=args.post_mortem,
+                context_globals=args.namespace,
+                context_locals=local_ns,
+            )
+
+    @runcell_arguments
+    @profile_arguments
+    @needs_local_scope
+    @line_magic
+    def profilecell(self, line, local_ns=None):
+        """
+        Profile a code cell from an editor.
+        """
+        args = self._parse_runcell_argstring(self.profilecell, line)
+
+        name = "{} ({})".format(args.canonic_filename, args.cell_id)
+        with self._profile_exec(name, args) as profile_exec:
+            return self._exec_cell(
+                cell_id=args.cell_id,
+                filename=args.filename,
+                canonic_filename=args.canonic_filename,
+                exec_fun=profile_exec,
+                post_mortem=args.post_mortem,
+                context_globals=self.shell.user_ns,
+                context_locals=local_ns,
+            )
+
+    @magic_arguments.magic_arguments()
+    @magic_arguments.argument(
+        "name",
+        nargs="*",
+        help="""
+        Name of the profiling result
+        """,
+    )
+    @profile_arguments
+    @needs_local_scope
+    @cell_magic
+    def profile(self, line, cell, local_ns=None):
+        """
+        Profile the code of a cell in the current namespace.
+        """
+        args = self.profile.parser.parse_args(shlex.split(line))
+        name = " ".join(args.name) or "<cell>"
+        filename = self.shell.compile.cache(cell)
+        with self._profile_exec(name, args) as profile_exec:
+            return self._exec_code(
+                cell,
+                filename,
+                self.shell.user_ns,
+                local_ns,
+                exec_fun=profile_exec,
+                capture_last_expression=True,
+            )
+
+    @contextmanager
+    def _profile_exec(self, name, args):
+        """
+        Get an exec function to use for profiling.
+
+        The code is profiled with cProfile, or with a sampling profiler if
+        `args.sampling` is set. The results are sent to the frontend after
+        the code runs, or printed if that's not possible.
+        """
+        if args.sampling:
+            profiler = SamplingProfiler(interval=args.interval / 1000)
+        else:
+            profiler = cProfile.Profile()
+
+        def profile_exec(code, glob, loc):
+            profiler.runctx(code, glob, loc)
+
+        try:
+            yield profile_exec
+        finally:
+            profiler.create_stats()
+            data = marshal.dumps(profiler.stats)
+            stacks = None
+            if args.sampling:
+                stacks = profiler.get_folded_stacks()
+            self.profile_results.append((name, time.time(), data))
+            try:
+                frontend_request(blocking=False).show_profile_file(
+                    data, name, stacks=stacks)
+            except CommError:
+                stats = pstats.Stats(profiler, stream=sys.stdout)
+                stats.sort_stats("cumulative").print_stats(
+                    PROFILE_PRINT_LIMIT)
+
     @contextmanager
     def _debugger_exec(self, filename, continue_if_has_breakpoints):
         """Get an exec function to use for debugging."""
@@ -448,59 +603,46 @@ def _exec_code(
 
         is_ipython = os.path.splitext(filename)[1] == ".ipy"
         try:
-            if not is_ipython:
-                # TODO: Remove the try-except and let the SyntaxError raise
-                # because there should't be IPython code in a Python file.
-                try:
-                    ast_code = ast.parse(
-                        self._transform_cell(code, indent_only=True)
-                    )
-                except SyntaxError as e:
-                    try:
-                        ast_code = ast.parse(self._transform_cell(code))
-                    except SyntaxError:
-                        raise e from None
-                    else:
-                        if self.show_invalid_syntax_msg:
-                            print(
-                                "\nWARNING: This is not valid Python code. "
-                                "If you want to use IPython magics, "
-                                "flexible indentation, and prompt removal, "
-                                "we recommend that you save this file with the "
-                                ".ipy extension.\n"
-                            )
-                            self.show_invalid_syntax_msg = False
-            else:
-                ast_code = ast.parse(self._transform_cell(code))
-
-            # Print warning for global
-            if global_warning and self.show_global_msg:
-                has_global = any(
-                    isinstance(node, ast.Global) for node in ast.walk(ast_code)
-                )
-                if has_global:
-                    print(
-                        "\nWARNING: This file contains a global statement, "
-                        "but it is run in an empty namespace. "
-                        "Consider using the "
-                        "'Run in console's namespace instead of an empty one' "
-                        "option, that you can find in the menu 'Run > "
-                        "Configuration per file', if you want to capture the "
-                        "namespace.\n"
-                    )
-                    self.show_global_msg = False
-
             if code.rstrip()[-1:] == ";":
                 # Supress output with ;
                 capture_last_expression = False
 
-            if capture_last_expression:
-                ast_code, capture_last_expression = capture_last_Expr(
-                    ast_code, "_spyder_out"
+            (
+                compiled_code,
+                capture_last_expression,
+                has_global,
+                is_python
+            ) = self._compile_code(
+                code, filename, is_ipython, capture_last_expression
+            )
+
+            if not is_python and self.show_invalid_syntax_msg:
+                print(
+                    "\nWARNING: This is not valid Python code. "
+                    "If you want to use IPython magics, "
+                    "flexible indentation, and prompt removal, "
+                    "we recommend that you save this file with the "
+                    ".ipy extension.\n"
+                )
+                self.show_invalid_syntax_msg = False
+
+            # Print warning for global
+            if global_warning and self.show_global_msg and has_global:
+                print(
+                    "\nWARNING: This file contains a global statement, "
+                    "but it is run in an empty namespace. "
+                    "Consider using the "
+                    "'Run in console's namespace instead of an empty one' "
+                    "option, that you can find in the menu 'Run > "
+                    "Configuration per file', if you want to capture the "
+                    "namespace.\n"
                 )
+                self.show_global_msg = False
+
+            if capture_last_expression:
                 ns_globals["__spyder_builtins__"] = builtins
 
-            exec_fun(compile(ast_code, filename, "exec"), ns_globals, ns_locals)
+            exec_fun(compiled_code, ns_globals, ns_locals)
 
             if capture_last_expression:
                 out = ns_globals.pop("_spyder_out", None)
@@ -523,6 +665,60 @@ def _exec_code(
         finally:
             __tracebackhide__ = "__pdb_exit__"
 
+    def _compile_code(self, code, filename, is_ipython,
+                      capture_last_expression):
+        """
+        Transform and compile code, or get the result from the cache.
+
+        Returns the code object, whether it captures the last expression,
+        whether it contains a global statement and whether the code is valid
+        Python code.
+        """
+        key = (
+            hashlib.sha1(code.encode("utf-8", "surrogatepass")).digest(),
+            filename,
+            is_ipython,
+            capture_last_expression,
+        )
+        entry = self.code_cache.lookup(key)
+        if entry is not None:
+            return entry
+
+        is_python = True
+        if not is_ipython:
+            # TODO: Remove the try-except and let the SyntaxError raise
+            # because there should't be IPython code in a Python file.
+            try:
+                ast_code = ast.parse(
+                    self._transform_cell(code, indent_only=True)
+                )
+            except SyntaxError as e:
+                try:
+                    ast_code = ast.parse(self._transform_cell(code))
+                except SyntaxError:
+                    raise e from None
+                is_python = False
+        else:
+            ast_code = ast.parse(self._transform_cell(code))
+
+        has_global = any(
+            isinstance(node, ast.Global) for node in ast.walk(ast_code)
+        )
+
+        if capture_last_expression:
+            ast_code, capture_last_expression = capture_last_Expr(
+                ast_code, "_spyder_out"
+            )
+
+        entry = (
+            compile(ast_code, filename, "exec"),
+            capture_last_expression,
+            has_global,
+            is_python
+        )
+        self.code_cache.store(key, entry)
+        return entry
+
     def _count_leading_empty_lines(self, cell):
         """Count the number of leading empty cells."""
         lines = cell.splitlines(keepends=True)
@@ -543,8 +739,7 @@ def _transform_cell(self, code, indent_only=False):
             lines = leading_indent(leading_empty_lines(lines))
             code = "".join(lines)
         else:
-            tm = TransformerManager()
-            code = tm.transform_cell(code)
+            code = self._transformer_manager.transform_cell(code)
         return "\n" * number_empty_lines + code
 
     def _post_mortem_excepthook(self, type, value, tb):
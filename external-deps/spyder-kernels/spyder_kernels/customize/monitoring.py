@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Debugger backend based on sys.monitoring (PEP 669).
+
+With sys.settrace, a trace function is called every time a frame is entered
+and on every line of the frames it traces. Here, line events are only
+enabled for the code objects that need them: the ones containing
+breakpoints and, while stepping, the ones of the traced frames. Calls to
+code the debugger is not interested in are disabled the first time they are
+seen, until the stepping state or the breakpoints change.
+
+The events are translated to the ones sys.settrace would have generated, so
+that the bdb machinery can be used unchanged.
+"""
+
+import sys
+import threading
+import weakref
+
+
+MONITORING_AVAILABLE = hasattr(sys, 'monitoring')
+
+if MONITORING_AVAILABLE:
+    monitoring = sys.monitoring
+    events = monitoring.events
+
+    TOOL_ID = monitoring.DEBUGGER_ID
+    TOOL_NAME = 'spyder-pdb'
+
+    # Events that are needed everywhere. Calls can be disabled per code
+    # object, but exceptions can't.
+    GLOBAL_EVENTS = (
+        events.PY_START | events.PY_RESUME | events.PY_THROW
+        | events.PY_UNWIND | events.RAISE
+    )
+
+    # Events that are only enabled for the code objects being traced
+    LOCAL_EVENTS = (
+        events.LINE | events.JUMP | events.PY_RETURN | events.PY_YIELD
+    )
+
+
+# Lines of each code object, including the definition line, which is where
+# bdb puts function breakpoints.
+_code_lines = weakref.WeakKeyDictionary()
+
+
+def get_code_lines(code):
+    """Return the set of lines of a code object."""
+    try:
+        return _code_lines[code]
+    except KeyError:
+        lines = {line for __, __, line in code.co_lines() if line is not None}
+        lines.add(code.co_firstlineno)
+        _code_lines[code] = lines
+        return lines
+
+
+def get_offset_line(code, offset):
+    """Return the line of the instruction at `offset` in a code object."""
+    for start, end, line in code.co_lines():
+        if start <= offset < end:
+            return line
+    return None
+
+
+class MonitoringTracer:
+    """
+    Drive a bdb debugger with sys.monitoring events.
+
+    Only one tracer can be active at a time, because all of them share the
+    debugger tool id.
+    """
+
+    # Tracer currently using the tool id
+    active = None
+
+    def __init__(self, debugger):
+        self.debugger = debugger
+        self._thread = None
+
+        # Local events set for each code object
+        self._local_events = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def is_available():
+        """Check if the debugger tool id can be used."""
+        return (
+            MONITORING_AVAILABLE
+            and monitoring.get_tool(TOOL_ID) in (None, TOOL_NAME)
+        )
+
+    @classmethod
+    def stop_active(cls):
+        """Stop the active tracer, if any."""
+        if cls.active is not None:
+            cls.active.stop()
+
+    @property
+    def is_active(self):
+        """Whether this tracer is receiving events."""
+        return MonitoringTracer.active is self
+
+    def start(self, frame):
+        """
+        Start tracing in the current thread.
+
+        Line events are enabled for the frames in the stack of `frame`
+        that have a trace function.
+        """
+        if self.is_active:
+            self.update(frame)
+            return
+
+        MonitoringTracer.stop_active()
+        if monitoring.get_tool(TOOL_ID) == TOOL_NAME:
+            # Left behind by a tracer that was not stopped
+            monitoring.free_tool_id(TOOL_ID)
+        monitoring.use_tool_id(TOOL_ID, TOOL_NAME)
+
+        for event, callback in self._get_callbacks().items():
+            monitoring.register_callback(TOOL_ID, event, callback)
+
+        self._thread = threading.get_ident()
+        MonitoringTracer.active = self
+        self.update(frame)
+        monitoring.set_events(TOOL_ID, GLOBAL_EVENTS)
+
+    def stop(self):
+        """Stop tracing and release the tool id."""
+        if not self.is_active:
+            return
+        monitoring.set_events(TOOL_ID, 0)
+        for code in list(self._local_events):
+            monitoring.set_local_events(TOOL_ID, code, 0)
+        self._local_events.clear()
+        for event in self._get_callbacks():
+            monitoring.register_callback(TOOL_ID, event, None)
+        monitoring.free_tool_id(TOOL_ID)
+        MonitoringTracer.active = None
+
+    def restart(self, frame):
+        """
+        Update the events after the stepping state or breakpoints changed.
+
+        Calls that were disabled are seen again, and line events are
+        updated for the traced frames in the stack of `frame`.
+        """
+        if not self.is_active:
+            return
+        monitoring.restart_events()
+        self.update(frame)
+
+    def update(self, frame):
+        """Update line events for the traced frames in a stack."""
+        while frame is not None:
+            if frame.f_trace is not None:
+                self._set_local_events(frame)
+            frame = frame.f_back
+
+    def has_breaks(self, code):
+        """Check if a code object contains breakpoints."""
+        debugger = self.debugger
+        breaks = debugger.breaks.get(debugger.canonic(code.co_filename))
+        if not breaks:
+            return False
+        return not get_code_lines(code).isdisjoint(breaks)
+
+    # ---- Private API
+    def _get_callbacks(self):
+        return {
+            events.PY_START: self._on_start,
+            events.PY_RESUME: self._on_start,
+            events.PY_THROW: self._on_throw,
+            events.LINE: self._on_line,
+            events.JUMP: self._on_jump,
+            events.PY_RETURN: self._on_return,
+            events.PY_YIELD: self._on_return,
+            events.PY_UNWIND: self._on_unwind,
+            events.RAISE: self._on_raise,
+            events.INSTRUCTION: self._on_instruction,
+        }
+
+    def _set_local_events(self, frame):
+        """Enable the events needed by the debugger in a frame's code."""
+        code = frame.f_code
+        debugger = self.debugger
+        continuing = (
+            debugger.stopframe is debugger.botframe
+            and debugger.stoplineno == -1
+        )
+        if continuing and not self.has_breaks(code):
+            local_events = 0
+        else:
+            local_events = LOCAL_EVENTS
+
+        # Set by bdb to stop on the next instruction (Python 3.13+)
+        if frame.f_trace_opcodes:
+            local_events |= events.INSTRUCTION
+
+        if self._local_events.get(code, 0) != local_events:
+            monitoring.set_local_events(TOOL_ID, code, local_events)
+            self._local_events[code] = local_events
+
+    def _trace_caller(self, frame):
+        """
+        Enable line events in the caller of a returning frame.
+
+        When stepping out of a frame, bdb sets the trace function of its
+        caller after updating the stepping state (Python 3.13+), so the
+        caller was not traced yet when the events were updated. Before
+        Python 3.13, bdb relies on the caller being traced because it's in
+        a file with breakpoints, which is not the case here since only the
+        code objects containing breakpoints are traced, so its trace
+        function is set here.
+        """
+        caller = frame.f_back
+        if caller is None or not self.is_active:
+            return
+        debugger = self.debugger
+        if caller.f_trace is None and debugger.stoplineno != -1:
+            caller.f_trace = debugger.trace_dispatch
+        if caller.f_trace is not None:
+            self._set_local_events(caller)
+
+    def _dispatch(self, frame, event, arg):
+        """Send an event to the trace function of a frame."""
+        if frame.f_trace is not None:
+            frame.f_trace = frame.f_trace(frame, event, arg)
+
+    def _call(self):
+        """Trace a call, returning False if the code is not of interest."""
+        frame = sys._getframe(2)
+        trace = self.debugger.trace_dispatch(frame, 'call', None)
+        if trace is None:
+            return False
+        frame.f_trace = trace
+        if self.is_active:
+            self._set_local_events(frame)
+        return True
+
+    def _on_start(self, code, offset):
+        if threading.get_ident() != self._thread:
+            return
+        if not self._call():
+            return monitoring.DISABLE
+
+    def _on_throw(self, code, offset, exception):
+        if threading.get_ident() != self._thread:
+            return
+        self._call()
+
+    def _on_line(self, code, line):
+        if threading.get_ident() != self._thread:
+            return
+        frame = sys._getframe(1)
+        if frame.f_trace_lines:
+            self._dispatch(frame, 'line', None)
+
+    def _on_jump(self, code, offset, destination):
+        # sys.settrace reports a line when jumping back to the same line,
+        # which sys.monitoring doesn't.
+        if destination > offset:
+            return monitoring.DISABLE
+        line = get_offset_line(code, destination)
+        if line != get_offset_line(code, offset):
+            return monitoring.DISABLE
+        if threading.get_ident() != self._thread:
+            return
+        frame = sys._getframe(1)
+        if frame.f_trace_lines:
+            self._dispatch(frame, 'line', None)
+
+    def _on_instruction(self, code, offset):
+        if threading.get_ident() != self._thread:
+            return
+        frame = sys._getframe(1)
+        if frame.f_trace_opcodes:
+            self._dispatch(frame, 'opcode', None)
+
+    def _on_return(self, code, offset, value):
+        if threading.get_ident() != self._thread:
+            return
+        frame = sys._getframe(1)
+        self._dispatch(frame, 'return', value)
+        self._trace_caller(frame)
+
+    def _on_unwind(self, code, offset, exception):
+        if threading.get_ident() != self._thread:
+            return
+        frame = sys._getframe(1)
+        self._dispatch(frame, 'return', None)
+        self._trace_caller(frame)
+
+    def _on_raise(self, code, offset, exception):
+        if threading.get_ident() != self._thread:
+            return
+        self._dispatch(
+            sys._getframe(1),
+            'exception',
+            (type(exception), exception, exception.__traceback__)
+        )
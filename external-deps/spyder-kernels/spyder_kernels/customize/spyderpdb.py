@@ -11,6 +11,7 @@
 import bdb
 import builtins
 from contextlib import contextmanager
+import inspect
 import logging
 import os
 import sys
@@ -18,6 +19,7 @@
 import threading
 from collections import namedtuple
 from functools import lru_cache
+import weakref
 
 from IPython.core.autocall import ZMQExitAutocall
 from IPython.core.debugger import Pdb as ipyPdb
@@ -25,6 +27,7 @@
 
 import spyder_kernels
 from spyder_kernels.comms.frontendcomm import CommError, frontend_request
+from spyder_kernels.customize.monitoring import MonitoringTracer
 from spyder_kernels.customize.utils import path_is_library, capture_last_Expr
 
 
@@ -67,18 +70,26 @@ class SpyderPdb(ipyPdb):
      - Better interrupt signal handling.
      - Option to skip libraries while stepping.
      - Add completion to non-command code.
+     - Low-overhead tracing with sys.monitoring on Python 3.12+.
     """
 
     def __init__(self, completekey='tab', stdin=None, stdout=None,
                  skip=None, nosigint=False):
         """Init Pdb."""
         self.curframe_locals = None
+        # Filters that only depend on the code of a frame. They are reset
+        # when pdb_ignore_lib or skip_hidden change.
+        self._code_filters = weakref.WeakKeyDictionary()
         # Only set to true when calling debugfile
         self.continue_if_has_breakpoints = False
         self.pdb_ignore_lib = False
         self.pdb_execute_events = False
         self.pdb_use_exclamation_mark = False
         self.pdb_publish_stack = False
+        self.pdb_use_monitoring = False
+        # sys.monitoring tracer, used instead of sys.settrace if
+        # pdb_use_monitoring is set
+        self._tracer = None
         self._exclamation_warning_printed = False
         self.pdb_stop_first_line = True
         self._disable_next_stack_entry = False
@@ -312,6 +323,7 @@ def set_quit(self):
         """Register that debugger is not tracing."""
         self.shell.remove_pdb_session(self)
         super(SpyderPdb, self).set_quit()
+        self._stop_monitoring()
 
     def interaction(self, frame, traceback):
         """
@@ -329,7 +341,143 @@ def print_stack_entry(self, *args, **kwargs):
             return
         return super().print_stack_entry(*args, **kwargs)
 
+    # --- Methods overriden for the sys.monitoring backend
+    def trace_dispatch(self, frame, event, arg):
+        """
+        Dispatch a trace event.
+
+        bdb starts tracing with sys.settrace. If pdb_use_monitoring is set,
+        tracing is handed over to sys.monitoring on the first event.
+        """
+        if (
+            self.pdb_use_monitoring
+            and sys.gettrace() == self.trace_dispatch
+            and MonitoringTracer.is_available()
+        ):
+            sys.settrace(None)
+            if self._tracer is None:
+                self._tracer = MonitoringTracer(self)
+            self._tracer.start(frame)
+            trace = super().trace_dispatch(frame, event, arg)
+            if event == 'call':
+                frame.f_trace = trace
+            self._tracer.update(frame)
+            return trace
+
+        return super().trace_dispatch(frame, event, arg)
+
+    def break_anywhere(self, frame):
+        """
+        Check if there is a breakpoint in the code of a frame.
+
+        Reimplemented to only trace the code objects that contain
+        breakpoints instead of all the ones in the same file.
+        """
+        if self._tracer is not None and self._tracer.is_active:
+            return self._tracer.has_breaks(frame.f_code)
+        return super().break_anywhere(frame)
+
+    def set_break(self, *args, **kwargs):
+        """Set a breakpoint and update the events of the tracer."""
+        error = super().set_break(*args, **kwargs)
+        self._restart_monitoring()
+        return error
+
+    def _set_stopinfo(self, *args, **kwargs):
+        """Set where to stop and update the events of the tracer."""
+        super()._set_stopinfo(*args, **kwargs)
+        self._restart_monitoring()
+
+    def _restart_monitoring(self):
+        """Update the events of the tracer after a state change."""
+        if self._tracer is not None:
+            self._tracer.restart(sys._getframe().f_back)
+
+    def _stop_monitoring(self):
+        """Stop the sys.monitoring tracer."""
+        if self._tracer is not None:
+            self._tracer.stop()
+
     # --- Methods overriden for skipping libraries
+    @property
+    def pdb_ignore_lib(self):
+        """Whether to skip library code while stepping."""
+        return self._pdb_ignore_lib
+
+    @pdb_ignore_lib.setter
+    def pdb_ignore_lib(self, value):
+        if value != getattr(self, '_pdb_ignore_lib', None):
+            self._code_filters.clear()
+        self._pdb_ignore_lib = value
+
+    @property
+    def skip_hidden(self):
+        """Whether to skip hidden frames, including spyder-kernels ones."""
+        return self._skip_hidden
+
+    @skip_hidden.setter
+    def skip_hidden(self, value):
+        if value != getattr(self, '_skip_hidden', None):
+            self._code_filters.clear()
+        self._skip_hidden = value
+
+    def _get_code_filters(self, code):
+        """
+        Get the filters of a code object.
+
+        Returns
+        -------
+        A tuple (may_hide, skip). may_hide is False if frames of this code
+        can't define `__tracebackhide__`, so that their locals don't need
+        to be checked. skip is True if the debugger should not stop in
+        this code because it's a library or spyder-kernels internals.
+        """
+        try:
+            return self._code_filters[code]
+        except KeyError:
+            pass
+
+        # Frames of module and class bodies get their locals from a dict
+        may_hide = (
+            not code.co_flags & inspect.CO_OPTIMIZED
+            or '__tracebackhide__' in code.co_varnames
+            or '__tracebackhide__' in code.co_cellvars
+            or '__tracebackhide__' in code.co_freevars
+        )
+
+        filename = code.co_filename
+        if filename.startswith('<'):
+            # This is not a file
+            skip = False
+        elif self.pdb_ignore_lib and path_is_library(filename):
+            skip = True
+        elif (
+            self.skip_hidden
+            and os.path.dirname(spyder_kernels.__file__) in filename
+        ):
+            # This is spyder-kernels internals
+            skip = True
+        else:
+            skip = False
+
+        filters = (may_hide, skip)
+        self._code_filters[code] = filters
+        return filters
+
+    def _hidden_predicate(self, frame):
+        """
+        Check if a frame is hidden.
+
+        Reimplemented to avoid getting the locals of frames that can't
+        define `__tracebackhide__`.
+        """
+        if (
+            not self._predicates["readonly"]
+            and not self._get_code_filters(frame.f_code)[0]
+        ):
+            return False
+        return super()._hidden_predicate(frame)
+
     def stop_here(self, frame):
         """Check if pdb should stop here."""
         # Never stop if we are continuing unless there is a breakpoint
@@ -338,8 +486,12 @@ def stop_here(self, frame):
         if self.continue_if_has_breakpoints and self.should_continue(frame):
             self.set_continue()
             return False
+        if frame is None:
+            return super().stop_here(frame)
+
+        may_hide, skip = self._get_code_filters(frame.f_code)
         if (
-            frame is not None
+            may_hide
             and "__tracebackhide__" in frame.f_locals
             and frame.f_locals["__tracebackhide__"] == "__pdb_exit__"
         ):
@@ -350,17 +502,8 @@ def stop_here(self, frame):
             return False
         if frame is self.stopframe:
             return True
-        filename = frame.f_code.co_filename
-        if filename.startswith('<'):
-            # This is not a file
-            return True
-        if self.pdb_ignore_lib and path_is_library(filename):
-            return False
-        if self.skip_hidden and os.path.dirname(spyder_kernels.__file__) in filename:
-            # This is spyder-kernels internals
-            return False
-        return True
-    
+        return not skip
+
     def should_continue(self, frame):
         """
         Jump to first breakpoint if needed.
@@ -634,6 +777,11 @@ def recursive_debugger(self):
         trace_function = sys.gettrace()
         sys.settrace(None)
 
+        # Only one sys.monitoring tracer can be active at a time
+        tracer = MonitoringTracer.active
+        if tracer is not None:
+            tracer.stop()
+
         # Create child debugger
         debugger = self.__class__(
             completekey=self.completekey,
@@ -644,6 +792,8 @@ def recursive_debugger(self):
         finally:
             # Reset parent debugger
             sys.settrace(trace_function)
+            if tracer is not None:
+                tracer.start(sys._getframe())
             self.lastcmd = debugger.lastcmd
 
             # Reset _previous_step so that get_pdb_state() notifies Spyder about
@@ -688,6 +838,7 @@ def do_exitdb(self, arg):
         """Exit the debugger"""
         self._set_stopinfo(self.botframe, None, -1)
         sys.settrace(None)
+        self._stop_monitoring()
         frame = sys._getframe().f_back
         while frame and frame is not self.botframe:
             del frame.f_trace
@@ -873,7 +1024,10 @@ def run(self, cmd, globals=None, locals=None):
         globals defaults to __main__.dict; locals defaults to globals.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).run(cmd, globals, locals)
+            try:
+                super(SpyderPdb, self).run(cmd, globals, locals)
+            finally:
+                self._stop_monitoring()
 
     def runeval(self, expr, globals=None, locals=None):
         """Debug an expression executed via the eval() function.
@@ -881,7 +1035,10 @@ def runeval(self, expr, globals=None, locals=None):
         globals defaults to __main__.dict; locals defaults to globals.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).runeval(expr, globals, locals)
+            try:
+                super(SpyderPdb, self).runeval(expr, globals, locals)
+            finally:
+                self._stop_monitoring()
 
     def runcall(self, *args, **kwds):
         """Debug a single function call.
@@ -889,7 +1046,10 @@ def runcall(self, *args, **kwds):
         Return the result of the function call.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).runcall(*args, **kwds)
+            try:
+                super(SpyderPdb, self).runcall(*args, **kwds)
+            finally:
+                self._stop_monitoring()
 
     def set_remote_filename(self, filename):
         """Set remote filename to signal Spyder on mainpyfile."""
@@ -11,12 +11,14 @@
 # Stdlib imports
 import os
 import sys
+import time
 
 # Third party imports
 import pytest
 
 # Local imports
-from spyder_kernels.customize.umr import UserModuleReloader
+from spyder_kernels.customize.umr import (
+    get_module_imports, UserModuleReloader)
 
 
 @pytest.fixture
@@ -118,3 +120,93 @@ def test_umr_reload_modules(user_module):
     # Reload user modules
     import foo3
     assert umr.is_module_reloadable(foo3, 'foo3')
+
+
+def test_umr_changed_modules(tmpdir, monkeypatch):
+    """
+    Test that the UMR only reloads changed modules and the ones that
+    depend on them.
+    """
+    if str(tmpdir) not in sys.path:
+        sys.path.append(str(tmpdir))
+
+    package = tmpdir.mkdir('foo4')
+    package.join('__init__.py').write('#')
+    package.join('a.py').write('from . import b')
+    package.join('b.py').write('x = 1')
+    package.join('c.py').write('y = 1')
+
+    # Files that were modified long ago
+    past = time.time() - 60
+    for name in ['__init__.py', 'a.py', 'b.py', 'c.py']:
+        os.utime(str(package.join(name)), (past, past))
+
+    monkeypatch.setenv('SPY_UMR_ENABLED', 'True')
+    monkeypatch.setenv('SPY_UMR_VERBOSE', 'False')
+    umr = UserModuleReloader()
+    import foo4.a, foo4.c
+
+    # Nothing changed
+    umr.run()
+    assert umr.modnames_to_reload == []
+
+    # Changing a module reloads its dependents too
+    package.join('b.py').write('x = 2')
+    umr.run()
+    assert set(umr.modnames_to_reload) == {'foo4.a', 'foo4.b'}
+    import foo4.a
+    assert foo4.b.x == 2
+
+    # Touching a file without changing it doesn't reload it
+    os.utime(str(package.join('c.py')))
+    umr.run()
+    assert umr.modnames_to_reload == []
+
+    # Changing a package reloads its submodules
+    package.join('__init__.py').write('# Changed')
+    umr.run()
+    assert set(umr.modnames_to_reload) == {
+        'foo4', 'foo4.a', 'foo4.b', 'foo4.c'}
+
+
+def test_umr_import_timer(tmpdir, monkeypatch, capsys):
+    """Test that the UMR reports the import time saved in verbose mode."""
+    if str(tmpdir) not in sys.path:
+        sys.path.append(str(tmpdir))
+
+    modfile = tmpdir.join('foo5.py')
+    modfile.write('import time; time.sleep(0.1)')
+    past = time.time() - 60
+    os.utime(str(modfile), (past, past))
+
+    monkeypatch.setenv('SPY_UMR_ENABLED', 'True')
+    monkeypatch.setenv('SPY_UMR_VERBOSE', 'True')
+    umr = UserModuleReloader()
+    try:
+        import foo5
+        assert umr.import_timer.durations['foo5'] >= 0.1
+
+        umr.run()
+        assert umr.modnames_to_reload == []
+        out = capsys.readouterr().out
+        assert 'Unchanged modules' in out
+        assert '1 kept, saving 0.1' in out
+    finally:
+        sys.meta_path.remove(umr.import_timer)
+
+
+def test_umr_module_imports(tmpdir):
+    """Test getting the imports of a module from its source."""
+    modfile = tmpdir.join('mod.py')
+    modfile.write(
+        'import os.path\n'
+        'from . import b\n'
+        'from ..c import d\n'
+        'def f():\n'
+        '    from e import *\n'
+    )
+    imports = get_module_imports(str(modfile), 'pkg.sub.mod')
+    assert imports == {
+        'os', 'os.path', 'pkg', 'pkg.sub', 'pkg.sub.b', 'pkg.c', 'pkg.c.d',
+        'e'
+    }
@@ -5,10 +5,162 @@
 
 """User module reloader."""
 
+import ast
+import hashlib
+import importlib.abc
 import os
 import sys
+import threading
+import time
+import weakref
 
 from spyder_kernels.customize.utils import path_is_library
+from spyder_kernels.utils.dochelpers import doc_cache
+
+
+# Resolution of file modification times (in nanoseconds). Files modified less
+# than this before a module could have been imported are considered changed,
+# to be on the safe side.
+MTIME_RESOLUTION = 2 * 10**9
+
+
+def get_file_state(path):
+    """Return the modification time and size of a file, or None."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def get_file_digest(path):
+    """Return the hash of the contents of a file, or None."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def get_module_imports(path, modname, is_package=False):
+    """
+    Return the names of the modules imported by a module's source file.
+
+    This includes the parent packages of the imported modules and the names
+    imported with `from ... import`, which can also be modules.
+    """
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, ValueError):
+        return set()
+
+    package = modname if is_package else modname.rpartition('.')[0]
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                # Relative import
+                parts = package.split('.') if package else []
+                if node.level - 1 > len(parts):
+                    continue
+                base = '.'.join(parts[:len(parts) - node.level + 1])
+                if node.module:
+                    base = base + '.' + node.module if base else node.module
+            else:
+                base = node.module
+            if not base:
+                continue
+            names.add(base)
+            names.update(base + '.' + alias.name for alias in node.names
+                         if alias.name != '*')
+
+    # Importing a module also imports its parent packages
+    for name in list(names):
+        parts = name.split('.')
+        names.update('.'.join(parts[:i]) for i in range(1, len(parts)))
+
+    return names
+
+
+class ModuleImportTimer(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder that measures the time taken to import user modules.
+
+    It doesn't find modules by itself, it only wraps the loaders of the user
+    modules found by the other finders to time their execution.
+    """
+
+    def __init__(self, umr):
+        self.umr = umr
+
+        # Module name -> import time (in seconds), excluding the time taken
+        # to import other user modules
+        self.durations = {}
+
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        """Find the spec of a user module and time its loader."""
+        if (getattr(self._local, 'finding', False) or
+                self.umr.is_module_in_namelist(fullname)):
+            return None
+
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                find_spec = getattr(finder, 'find_spec', None)
+                if finder is self or find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+
+        if (
+            not hasattr(spec.loader, 'exec_module') or
+            not spec.has_location or
+            path_is_library(spec.origin, self.umr.pathlist)
+        ):
+            return None
+
+        spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def exec_module(self, loader, module):
+        """Execute a module with its loader and time it."""
+        children_times = self._local.__dict__.setdefault('children_times', [])
+        children_times.append(0)
+        start = time.perf_counter()
+        try:
+            loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.durations[module.__name__] = elapsed - children_times.pop()
+            if children_times:
+                children_times[-1] += elapsed
+
+
+class _TimedLoader:
+    """Loader that times the execution of the modules of another loader."""
+
+    def __init__(self, loader, timer):
+        self._loader = loader
+        self._timer = timer
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._timer.exec_module(self._loader, module)
 
 
 class UserModuleReloader:
@@ -16,6 +168,10 @@ class UserModuleReloader:
     User Module Reloader (UMR) aims at deleting user modules
     to force Python to deeply reload them during import
 
+    Only the modules whose source files changed since they were imported
+    are deleted, together with the modules that import them (directly or
+    not) and their submodules.
+
     pathlist [list]: blacklist in terms of module path
     namelist [list]: blacklist in terms of module name
     """
@@ -64,6 +220,25 @@ def __init__(self, namelist=None, pathlist=None):
         verbose = os.environ.get("SPY_UMR_VERBOSE", "")
         self.verbose = verbose.lower() == "true"
 
+        # File state, contents hash, imports and module object of the user
+        # modules that were not changed since they were imported
+        self._modules_info = {}
+
+        # Time of the last run and modules present after it. Modules imported
+        # later from files not modified since then are up to date.
+        self._last_run_time = time.time_ns()
+        self._last_modnames = set(sys.modules)
+
+        # File state of the modules deleted in the last run, at that moment
+        self._reloaded_states = {}
+
+        # Measure import times to report the time saved by not reloading
+        # unchanged modules
+        self.import_timer = None
+        if self.enabled and self.verbose:
+            self.import_timer = ModuleImportTimer(self)
+            sys.meta_path.insert(0, self.import_timer)
+
     def is_module_reloadable(self, module, modname):
         """Decide if a module is reloadable or not."""
         if self.has_cython:
@@ -114,26 +289,134 @@ def activate_cython(self):
                 pyximport.install(setup_args=pyx_setup_args,
                                   reload_support=True)
 
+    def get_module_info(self, modname, module):
+        """
+        Return the information of a module if it didn't change since it was
+        imported, or None otherwise.
+        """
+        path = module.__file__
+        info = self._modules_info.get(modname)
+
+        if info is not None and info['module']() is module:
+            state = get_file_state(path)
+            if state != info['state']:
+                # Files touched without changing their contents are fine
+                if state is None or get_file_digest(path) != info['digest']:
+                    return None
+                info['state'] = state
+            return info
+
+        # The module was imported after the last run, so it's up to date if
+        # its file wasn't modified since then or if it's the same it was when
+        # the module was deleted in that run.
+        if modname in self._last_modnames:
+            return None
+        state = get_file_state(path)
+        if state is None:
+            return None
+        if (
+            state != self._reloaded_states.get(modname) and
+            state[0] > self._last_run_time - MTIME_RESOLUTION
+        ):
+            return None
+
+        info = {
+            'module': weakref.ref(module),
+            'state': state,
+            'digest': get_file_digest(path),
+            'imports': (
+                get_module_imports(path, modname, hasattr(module, '__path__'))
+                if path.endswith('.py') else set()
+            )
+        }
+        self._modules_info[modname] = info
+        return info
+
     def run(self):
         """
         Delete user modules to force Python to deeply reload them
 
+        Only modules that changed since they were imported are deleted, along
+        with the modules that depend on them.
+
         Do not del modules which are considered as system modules, i.e.
         modules installed in subdirectories of Python interpreter's binary
         Do not del C modules
         """
-        self.modnames_to_reload = []
+        run_time = time.time_ns()
+
+        # User modules and reverse import graph among them
+        user_modules = []
+        changed = []
+        dependents = {}
         for modname, module in list(sys.modules.items()):
             if modname not in self.previous_modules:
                 # Decide if a module can be reloaded or not
                 if self.is_module_reloadable(module, modname):
-                    self.modnames_to_reload.append(modname)
-                    del sys.modules[modname]
+                    user_modules.append(modname)
+                    info = self.get_module_info(modname, module)
+                    if info is None:
+                        changed.append(modname)
+                    else:
+                        for name in info['imports']:
+                            dependents.setdefault(name, []).append(modname)
                 else:
                     continue
 
+        # Changed modules, their dependents and the submodules of all of them
+        # need to be reloaded
+        to_reload = set()
+        while changed:
+            modname = changed.pop()
+            if modname in to_reload:
+                continue
+            to_reload.add(modname)
+            changed.extend(dependents.get(modname, []))
+            changed.extend(name for name in user_modules
+                           if name.startswith(modname + '.'))
+
+        self.modnames_to_reload = []
+        self._reloaded_states = {}
+        for modname in user_modules:
+            if modname in to_reload:
+                self.modnames_to_reload.append(modname)
+                module = sys.modules.pop(modname)
+                self._reloaded_states[modname] = get_file_state(
+                    module.__file__)
+
+                # Remove the module from its parent package if it's kept.
+                # Otherwise `from package import module` would give the old
+                # module instead of importing it again.
+                parent_name, __, name = modname.rpartition('.')
+                parent = sys.modules.get(parent_name)
+                if parent_name not in to_reload and parent is not None:
+                    if getattr(parent, name, None) is module:
+                        delattr(parent, name)
+
+        # Forget modules that are no longer imported
+        self._modules_info = {
+            modname: info for (modname, info) in self._modules_info.items()
+            if modname in user_modules and modname not in to_reload
+        }
+        self._last_run_time = run_time
+        self._last_modnames = set(sys.modules)
+
+        # The documentation of the reloaded modules' objects is outdated
+        if self.modnames_to_reload:
+            doc_cache.clear()
+
         # Report reloaded modules
         if self.verbose and self.modnames_to_reload:
             modnames = self.modnames_to_reload
             print("\x1b[4;33m%s\x1b[24m%s\x1b[0m"
                   % ("Reloaded modules", ": "+", ".join(modnames)))
+
+        # Report time saved by not reloading unchanged modules
+        kept = [name for name in user_modules if name not in to_reload]
+        if self.import_timer is not None and kept:
+            saved = sum(self.import_timer.durations.get(name, 0)
+                        for name in kept)
+            print("\x1b[4;33m%s\x1b[24m%s\x1b[0m"
+                  % ("Unchanged modules",
+                     ": %d kept, saving %.2f s of imports"
+                     % (len(kept), saved)))
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Utilities to show DataFrames in the frontend without transferring them.
+
+Sorting, filtering and paging are done here on the live object, so that only
+the blocks of rows and columns displayed by the DataFrame Editor need to be
+sent to the frontend.
+"""
+
+from spyder_kernels.utils.lazymodules import numpy as np, pandas as pd
+
+
+class DataFrameView:
+    """
+    Sorted and filtered view of a DataFrame, Series or Index.
+
+    Rows are referred to by their position in the view, which is mapped to
+    their position in the original object through `rows`. Series and Index
+    objects are shown as DataFrames with a single column.
+    """
+
+    def __init__(self, value):
+        self.value = value
+        if isinstance(value, pd.Series):
+            self.df = value.to_frame()
+        elif isinstance(value, pd.Index):
+            self.df = pd.DataFrame(value)
+        else:
+            self.df = value
+
+        # Positions of the rows shown in the view. None means all rows in
+        # their original order.
+        self.rows = None
+
+        self._sort_key = None
+        self._filters = {}
+
+    @property
+    def shape(self):
+        """Shape of the view."""
+        nrows = len(self.df) if self.rows is None else len(self.rows)
+        return (nrows, self.df.shape[1])
+
+    def get_info(self):
+        """Return the information needed to show the view."""
+        columns = self.df.columns
+        index = self.df.index
+        return {
+            'shape': self.shape,
+            'type': self.value.__class__.__name__,
+            'is_series': isinstance(self.value, pd.Series),
+            'readonly': isinstance(self.value, pd.Index),
+            'column_levels': getattr(columns, 'nlevels', 1),
+            'index_levels': getattr(index, 'nlevels', 1),
+            'column_names': list(columns.names),
+            'index_names': list(index.names),
+        }
+
+    def get_block(self, rows, cols):
+        """
+        Return a block of the view.
+
+        Parameters
+        ----------
+        rows, cols: tuple
+            (start, stop) positions of the rows and columns in the view.
+
+        Returns
+        -------
+        A dictionary with the block as a DataFrame in 'data' and the
+        positions of its rows in the original object in 'rows'.
+        """
+        if self.rows is None:
+            positions = np.arange(*slice(*rows).indices(len(self.df)))
+        else:
+            positions = self.rows[rows[0]:rows[1]]
+        return {
+            'data': self.df.iloc[positions, cols[0]:cols[1]],
+            'rows': positions
+        }
+
+    def sort(self, column, ascending=True):
+        """
+        Sort the view by a column, or by the index if `column` is -1.
+
+        The sort is stable and the original object is not modified.
+        """
+        sort_key = (column, ascending)
+        self._update_rows(sort_key, self._filters)
+        self._sort_key = sort_key
+
+    def filter(self, column, text):
+        """
+        Show only the rows whose value in `column` contains `text`.
+
+        The comparison is done on the string representation of values and
+        is case insensitive. An empty text removes the filter.
+        """
+        filters = self._filters.copy()
+        if text:
+            filters[column] = text
+        else:
+            filters.pop(column, None)
+        self._update_rows(self._sort_key, filters)
+        self._filters = filters
+
+    def get_filters(self):
+        """Return the filters applied to the view."""
+        return self._filters.copy()
+
+    def set_values(self, changes):
+        """
+        Set values in the original object.
+
+        `changes` is a dictionary whose keys are (row, column) positions in
+        the original object, as given by `get_block`.
+        """
+        if isinstance(self.value, pd.Index):
+            raise TypeError("Index objects are immutable")
+        for (row, column), value in changes.items():
+            if isinstance(self.value, pd.Series):
+                self.value.iloc[row] = value
+            else:
+                self.value.iloc[row, column] = value
+
+        # The frame of a Series may be a copy of it
+        if isinstance(self.value, pd.Series):
+            self.df = self.value.to_frame()
+
+    def _update_rows(self, sort_key, filters):
+        """Compute the rows shown after sorting and filtering."""
+        rows = None
+        if filters:
+            mask = np.ones(len(self.df), dtype=bool)
+            for column, text in filters.items():
+                col = self.df.iloc[:, column].astype(str)
+                mask &= col.str.contains(
+                    text, case=False, regex=False).to_numpy(dtype=bool)
+            rows = np.flatnonzero(mask)
+
+        if sort_key is not None:
+            column, ascending = sort_key
+            if column < 0:
+                keys = self.df.index
+                if rows is not None:
+                    keys = keys[rows]
+                order = pd.Series(np.arange(len(keys)), index=keys)
+                order = order.sort_index(
+                    ascending=ascending, kind='mergesort').to_numpy()
+            else:
+                keys = self.df.iloc[:, column]
+                if rows is not None:
+                    keys = keys.iloc[rows]
+                order = keys.reset_index(drop=True).sort_values(
+                    ascending=ascending, kind='mergesort').index.to_numpy()
+            rows = order if rows is None else rows[order]
+
+        self.rows = rows
@@ -9,11 +9,19 @@
 """Utilities and wrappers around inspect module"""
 import builtins
 import inspect
+import os
 import re
+import sys
+import weakref
+
+from spyder_kernels.utils.misc import LRUCache
 
 
 SYMBOLS = r"[^\'\"a-zA-Z0-9_.]"
 
+# Number of results kept by the documentation cache
+DOC_CACHE_SIZE = 128
+
 
 def getobj(txt, last=False):
     """Return the last valid object name in string"""
@@ -282,6 +290,102 @@ def getargtxt(obj, one_arg_per_line=True):
         return textlist
 
 
+def getobjstatic(txt, namespace):
+    """
+    Return the module, class or function called `txt` in namespace, or None.
+
+    Unlike evaluating `txt`, this doesn't run any code, like properties or
+    module `__getattr__` functions.
+    """
+    names = txt.split('.')
+    if not all(name.isidentifier() for name in names):
+        return None
+    if names[0] in namespace:
+        obj = namespace[names[0]]
+    elif hasattr(builtins, names[0]):
+        obj = getattr(builtins, names[0])
+    else:
+        return None
+    for name in names[1:]:
+        if not (inspect.ismodule(obj) or inspect.isclass(obj)):
+            return None
+        try:
+            obj = inspect.getattr_static(obj, name)
+        except AttributeError:
+            return None
+    if inspect.ismodule(obj) or inspect.isclass(obj) or inspect.isroutine(obj):
+        return obj
+    return None
+
+
+def _get_file_mtime(obj):
+    """Return the modification time of the module file of obj, or None."""
+    try:
+        module = sys.modules.get(getattr(obj, '__module__', None) or '')
+        return os.stat(module.__file__).st_mtime_ns
+    except Exception:
+        return None
+
+
+def _get_identity(obj):
+    """
+    Return the objects that identify obj.
+
+    Bound methods are created every time they're accessed, so they're
+    identified by their function and instance.
+    """
+    if inspect.ismethod(obj):
+        return (obj.__func__, obj.__self__)
+    return (obj,)
+
+
+class DocCache(LRUCache):
+    """
+    LRU cache of the results of `getdoc`, `getsource` and `getargtxt`.
+
+    Results are keyed by the identity of the object they were computed for,
+    and are only valid while the file of its module is not modified. Only
+    weak references to the objects are kept, so caching a result doesn't
+    keep them alive, and objects that can't be weakly referenced are not
+    cached.
+    """
+
+    def __init__(self, maxsize=DOC_CACHE_SIZE):
+        # Entries are (weak references to the objects identifying the
+        # object, mtime, result)
+        super().__init__(maxsize)
+
+    def get(self, func, obj, *args):
+        """Return `func(obj, *args)`, computing it if it's not cached."""
+        identity = _get_identity(obj)
+        try:
+            references = tuple(weakref.ref(item) for item in identity)
+        except TypeError:
+            # Not cached, to not keep obj alive
+            self.misses += 1
+            return func(obj, *args)
+        key = (func.__name__, tuple(id(item) for item in identity), args)
+        mtime = _get_file_mtime(obj)
+
+        def is_valid(entry):
+            return (
+                all(ref() is item for ref, item in zip(entry[0], identity))
+                and entry[1] == mtime
+            )
+
+        entry = self.lookup(key, is_valid)
+        if entry is not None:
+            return entry[2]
+
+        result = func(obj, *args)
+        self.store(key, (references, mtime, result))
+        return result
+
+
+# Cache used by the kernel
+doc_cache = DocCache()
+
+
 def isdefined(obj, force_import=False, namespace=None):
     """Return True if object is defined in namespace
     If namespace is None --> namespace = locals()"""
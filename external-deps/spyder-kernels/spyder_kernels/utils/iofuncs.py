@@ -25,7 +25,13 @@
 import dis
 import copy
 import glob
+import gzip
+import hashlib
+import io
 import pickle
+import collections
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Local imports
 from spyder_kernels.utils.lazymodules import (
@@ -169,13 +175,23 @@ def save_matlab(data, filename):
 
 # ---- For arrays
 # -----------------------------------------------------------------------------
-def load_array(filename):
+def load_array(filename, lazy=False):
+    """
+    Load a .npy or .npz file.
+
+    If `lazy` is True, the array of a .npy file is memory-mapped in
+    copy-on-write mode instead of being read.
+    """
     if np.load is FakeObject:
         return None, ''
 
     try:
         name = osp.splitext(osp.basename(filename))[0]
-        data = np.load(filename)
+        data = None
+        if lazy and osp.splitext(filename)[1].lower() == '.npy':
+            data = _memmap_npy(filename)
+        if data is None:
+            data = np.load(filename)
         if isinstance(data, np.lib.npyio.NpzFile):
             return dict(data), None
         elif hasattr(data, 'keys'):
@@ -186,13 +202,6 @@ def load_array(filename):
         return None, str(error)
 
 
-def __save_array(data, basename, index):
-    """Save numpy array"""
-    fname = basename + '_%04d.npy' % index
-    np.save(fname, data)
-    return fname
-
-
 # ---- For PIL images
 # -----------------------------------------------------------------------------
 if sys.byteorder == 'little':
@@ -266,99 +275,319 @@ def load_json(filename):
 
 # ---- For Spydata files
 # -----------------------------------------------------------------------------
-def save_dictionary(data, filename):
-    """Save dictionary in a single file .spydata file"""
+# Size (in bytes) of the chunks compressed in parallel
+SPYDATA_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Width of the size record written for members whose size is not known
+# before writing them, so their header can be rewritten in place.
+_PAX_SIZE_WIDTH = 20
+
+
+class _ParallelGzipWriter:
+    """
+    File-like object compressing the data written to it with gzip.
+
+    The data is split in chunks that are compressed in parallel as
+    independent gzip members, which form a valid gzip file once
+    concatenated.
+    """
+
+    def __init__(self, fileobj, compresslevel=6, workers=None):
+        self.fileobj = fileobj
+        self.compresslevel = compresslevel
+        self._workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(self._workers)
+        self._pending = collections.deque()
+        self._buffer = bytearray()
+        self._position = 0
+
+    def seekable(self):
+        return False
+
+    def tell(self):
+        """Get the number of bytes written so far."""
+        return self._position
+
+    def write(self, data):
+        """Write data, which is compressed once a chunk is full."""
+        data = memoryview(data).cast('B')
+        self._position += data.nbytes
+        if self._buffer:
+            size = SPYDATA_CHUNK_SIZE - len(self._buffer)
+            self._buffer += data[:size]
+            data = data[size:]
+            if len(self._buffer) < SPYDATA_CHUNK_SIZE:
+                return
+            self._compress(bytes(self._buffer))
+            self._buffer = bytearray()
+
+        # Full chunks are compressed without being copied
+        while data.nbytes >= SPYDATA_CHUNK_SIZE:
+            self._compress(data[:SPYDATA_CHUNK_SIZE])
+            data = data[SPYDATA_CHUNK_SIZE:]
+        self._buffer += data
+
+    def close(self):
+        """Compress the remaining data and wait for all chunks."""
+        try:
+            if self._buffer:
+                self._compress(bytes(self._buffer))
+                self._buffer = bytearray()
+            while self._pending:
+                self.fileobj.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown()
+
+    def _compress(self, chunk):
+        """Compress a chunk in a worker thread."""
+        self._pending.append(self._executor.submit(
+            gzip.compress, chunk, self.compresslevel, mtime=0))
+
+        # Limit the memory used by chunks waiting to be written
+        while len(self._pending) > 2 * self._workers:
+            self.fileobj.write(self._pending.popleft().result())
+
+
+class _TarStreamWriter:
+    """
+    Write a tar file member by member, directly from the saved objects.
+
+    Only what the tarfile module needs to read the file back is written.
+    """
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+
+    def add(self, name, size, write_data):
+        """
+        Add a member of a known size.
+
+        `write_data` is called with a file object to write the data to.
+        """
+        self.fileobj.write(self._get_header(name, size))
+        start = self.fileobj.tell()
+        write_data(self.fileobj)
+        written = self.fileobj.tell() - start
+        if written != size:
+            raise RuntimeError(
+                "Wrote {} bytes instead of {} for {}".format(
+                    written, size, name))
+        self._pad(size)
+
+    def add_unsized(self, name, write_data):
+        """
+        Add a member whose size is only known once written.
+
+        The header is rewritten after the data if the file is seekable.
+        Otherwise, the data is written to a temporary file first. If
+        `write_data` fails, nothing is added.
+        """
+        if not self.fileobj.seekable():
+            with tempfile.SpooledTemporaryFile(
+                    max_size=16 * SPYDATA_CHUNK_SIZE) as spool:
+                write_data(spool)
+                size = spool.tell()
+                spool.seek(0)
+                self.add(
+                    name, size, lambda f: shutil.copyfileobj(spool, f))
+            return
+
+        header_start = self.fileobj.tell()
+        header = self._get_header(name, 0, fixed_size=True)
+        self.fileobj.write(header)
+        try:
+            write_data(self.fileobj)
+        except BaseException:
+            self.fileobj.seek(header_start)
+            self.fileobj.truncate()
+            raise
+
+        end = self.fileobj.tell()
+        size = end - header_start - len(header)
+        self.fileobj.seek(header_start)
+        self.fileobj.write(self._get_header(name, size, fixed_size=True))
+        self.fileobj.seek(end)
+        self._pad(size)
+
+    def close(self):
+        """Write the end of archive marker."""
+        self.fileobj.write(tarfile.NUL * (2 * tarfile.BLOCKSIZE))
+
+    def _get_header(self, name, size, fixed_size=False):
+        """Get the header of a member."""
+        tarinfo = tarfile.TarInfo(name)
+        tarinfo.size = size
+        tarinfo.mtime = int(time.time())
+        tarinfo.mode = 0o644
+        if fixed_size:
+            tarinfo.pax_headers['size'] = str(size).zfill(_PAX_SIZE_WIDTH)
+        return tarinfo.tobuf(
+            tarfile.PAX_FORMAT, tarfile.ENCODING, 'surrogateescape')
+
+    def _pad(self, size):
+        """Pad the data of a member to a full block."""
+        remainder = size % tarfile.BLOCKSIZE
+        if remainder:
+            self.fileobj.write(
+                tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+
+
+def _get_npy_version(array):
+    """
+    Get the version of the .npy format needed to save an array.
+
+    Returns the version and the size of the file, or None if the array
+    can't be saved without pickling it.
+    """
+    if array.dtype.hasobject:
+        return None
+    header_data = np.lib.format.header_data_from_array_1_0(array)
+    for version, write_header in [
+            ((1, 0), np.lib.format.write_array_header_1_0),
+            ((2, 0), np.lib.format.write_array_header_2_0)]:
+        header = io.BytesIO()
+        try:
+            write_header(header, header_data)
+        except ValueError:
+            # Header too large for this version
+            continue
+        return version, len(header.getvalue()) + array.nbytes
+    return None
+
+
+def _write_spydata(tar, basename, pickled_data, saved_arrays, array_files,
+                   skipped_keys):
+    """Write the members of a .spydata file."""
+    # Attempt to pickle everything.
+    # If pickling fails, iterate through to eliminate problem objs & retry.
+    pickle_name = basename + '.pickle'
+    try:
+        tar.add_unsized(
+            pickle_name, lambda f: pickle.dump(pickled_data, f, protocol=2))
+    except (pickle.PicklingError, AttributeError, TypeError,
+            ImportError, IndexError, RuntimeError):
+        data_filtered = {}
+        for obj_name, obj_value in pickled_data.items():
+            try:
+                pickle.dumps(obj_value, protocol=2)
+            except Exception:
+                skipped_keys.append(obj_name)
+            else:
+                data_filtered[obj_name] = obj_value
+        if not data_filtered:
+            raise RuntimeError('No supported objects to save')
+        tar.add_unsized(
+            pickle_name, lambda f: pickle.dump(data_filtered, f, protocol=2))
+
+    # Arrays are written from memory, in chunks if the file is compressed
+    for fname, (array, version, size) in zip(
+            saved_arrays.values(), array_files):
+        tar.add(
+            fname, size,
+            lambda f: np.lib.format.write_array(
+                f, array, version=version, allow_pickle=False))
+
+    tar.close()
+
+
+def save_dictionary(data, filename, compress=False, workers=None):
+    """
+    Save dictionary in a single file .spydata file.
+
+    The objects are not copied. Arrays are written to the file directly
+    from memory, and the other objects are pickled straight into it.
+
+    Parameters
+    ----------
+    data : dict
+        The objects to save.
+    filename : str
+        The path of the file.
+    compress : bool
+        Compress the file with gzip. Chunks of the file are compressed in
+        parallel.
+    workers : int or None
+        The number of threads compressing the file. If None, the number of
+        CPUs is used.
+    """
     filename = osp.abspath(filename)
-    old_cwd = os.getcwd()
-    os.chdir(osp.dirname(filename))
+    basename = osp.splitext(osp.basename(filename))[0]
     error_message = None
     skipped_keys = []
-    data_copy = {}
+    tmp_filename = None
 
     try:
-        # Copy dictionary before modifying it to fix #6689
+        pickled_data = {}
+        # Arrays saved with np.save
+        saved_arrays = {}
+        array_files = []
         for obj_name, obj_value in data.items():
             # Skip modules, since they can't be pickled, users virtually never
             # would want them to be and so they don't show up in the skip list.
             # Skip callables, since they are only pickled by reference and thus
             # must already be present in the user's environment anyway.
-            if not (callable(obj_value) or isinstance(obj_value,
-                                                      types.ModuleType)):
-                # If an object cannot be deepcopied, then it cannot be pickled.
-                # Ergo, we skip it and list it later.
-                try:
-                    data_copy[obj_name] = copy.deepcopy(obj_value)
-                except Exception:
-                    skipped_keys.append(obj_name)
-        data = data_copy
-        if not data:
+            if callable(obj_value) or isinstance(obj_value, types.ModuleType):
+                continue
+
+            if np.ndarray is FakeObject:
+                pickled_data[obj_name] = obj_value
+                continue
+
+            if isinstance(obj_value, np.ndarray) and obj_value.size > 0:
+                # Save arrays at data root
+                npy_version = _get_npy_version(obj_value)
+                if npy_version is not None:
+                    saved_arrays[(obj_name, None)] = '%s_%04d.npy' % (
+                        basename, len(saved_arrays))
+                    array_files.append((obj_value, ) + npy_version)
+                    continue
+            elif isinstance(obj_value, (list, dict)):
+                # Save arrays nested in lists or dictionaries. A shallow copy
+                # of the container is pickled without them, so the user's
+                # objects are left untouched.
+                if isinstance(obj_value, list):
+                    iterator = enumerate(obj_value)
+                else:
+                    iterator = iter(list(obj_value.items()))
+                to_remove = []
+                for index, value in iterator:
+                    if isinstance(value, np.ndarray) and value.size > 0:
+                        npy_version = _get_npy_version(value)
+                        if npy_version is None:
+                            continue
+                        saved_arrays[(obj_name, index)] = '%s_%04d.npy' % (
+                            basename, len(saved_arrays))
+                        array_files.append((value, ) + npy_version)
+                        to_remove.append(index)
+                if to_remove:
+                    obj_value = copy.copy(obj_value)
+                    for index in sorted(to_remove, reverse=True):
+                        obj_value.pop(index)
+            pickled_data[obj_name] = obj_value
+
+        if not pickled_data and not saved_arrays:
             raise RuntimeError('No supported objects to save')
-
-        saved_arrays = {}
-        if np.ndarray is not FakeObject:
-            # Saving numpy arrays with np.save
-            arr_fname = osp.splitext(filename)[0]
-            for name in list(data.keys()):
-                try:
-                    if (isinstance(data[name], np.ndarray) and
-                            data[name].size > 0):
-                        # Save arrays at data root
-                        fname = __save_array(data[name], arr_fname,
-                                             len(saved_arrays))
-                        saved_arrays[(name, None)] = osp.basename(fname)
-                        data.pop(name)
-                    elif isinstance(data[name], (list, dict)):
-                        # Save arrays nested in lists or dictionaries
-                        if isinstance(data[name], list):
-                            iterator = enumerate(data[name])
-                        else:
-                            iterator = iter(list(data[name].items()))
-                        to_remove = []
-                        for index, value in iterator:
-                            if (isinstance(value, np.ndarray) and
-                                    value.size > 0):
-                                fname = __save_array(value, arr_fname,
-                                                     len(saved_arrays))
-                                saved_arrays[(name, index)] = (
-                                    osp.basename(fname))
-                                to_remove.append(index)
-                        for index in sorted(to_remove, reverse=True):
-                            data[name].pop(index)
-                except (RuntimeError, pickle.PicklingError, TypeError,
-                        AttributeError, IndexError):
-                    # If an array can't be saved with numpy for some reason,
-                    # leave the object intact and try to save it normally.
-                    pass
-            if saved_arrays:
-                data['__saved_arrays__'] = saved_arrays
-
-        pickle_filename = osp.splitext(filename)[0] + '.pickle'
-        # Attempt to pickle everything.
-        # If pickling fails, iterate through to eliminate problem objs & retry.
-        with open(pickle_filename, 'w+b') as fdesc:
+        if saved_arrays:
+            pickled_data['__saved_arrays__'] = saved_arrays
+
+        # Write to a temporary file, so an existing file is only replaced
+        # once the new one is complete.
+        tmp_filename = filename + '.tmp'
+        with open(tmp_filename, 'wb') as fdesc:
+            if compress:
+                fileobj = _ParallelGzipWriter(fdesc, workers=workers)
+            else:
+                fileobj = fdesc
             try:
-                pickle.dump(data, fdesc, protocol=2)
-            except (pickle.PicklingError, AttributeError, TypeError,
-                    ImportError, IndexError, RuntimeError):
-                data_filtered = {}
-                for obj_name, obj_value in data.items():
-                    try:
-                        pickle.dumps(obj_value, protocol=2)
-                    except Exception:
-                        skipped_keys.append(obj_name)
-                    else:
-                        data_filtered[obj_name] = obj_value
-                if not data_filtered:
-                    raise RuntimeError('No supported objects to save')
-                pickle.dump(data_filtered, fdesc, protocol=2)
-
-        # Use PAX (POSIX.1-2001) format instead of default GNU.
-        # This improves interoperability and UTF-8/long variable name support.
-        with tarfile.open(filename, "w", format=tarfile.PAX_FORMAT) as tar:
-            for fname in ([pickle_filename]
-                          + [fn for fn in list(saved_arrays.values())]):
-                tar.add(osp.basename(fname))
-                os.remove(fname)
+                _write_spydata(
+                    _TarStreamWriter(fileobj), basename, pickled_data,
+                    saved_arrays, array_files, skipped_keys)
+            finally:
+                if compress:
+                    fileobj.close()
+
+        os.replace(tmp_filename, filename)
+        tmp_filename = None
     except (RuntimeError, pickle.PicklingError, TypeError) as error:
         error_message = str(error)
     else:
@@ -367,7 +596,11 @@ def save_dictionary(data, filename):
             error_message = ('Some objects could not be saved: '
                              + ', '.join(skipped_keys))
     finally:
-        os.chdir(old_cwd)
+        if tmp_filename is not None:
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
     return error_message
 
 
@@ -390,8 +623,38 @@ def safe_extract(tar, path=".", members=None, *, numeric_owner=False):
     tar.extractall(path, members, numeric_owner=numeric_owner)
 
 
-def load_dictionary(filename):
-    """Load dictionary from .spydata file"""
+def _restore_saved_arrays(data, load_func):
+    """
+    Put back the arrays saved with np.save in the loaded data.
+
+    `load_func` is called with the name of the file of each array.
+    """
+    if np.load is FakeObject:
+        return
+    try:
+        saved_arrays = data.pop('__saved_arrays__')
+    except KeyError:
+        return
+    for (name, index), fname in list(saved_arrays.items()):
+        arr = load_func(fname)
+        if index is None:
+            data[name] = arr
+        elif isinstance(data[name], dict):
+            data[name][index] = arr
+        else:
+            data[name].insert(index, arr)
+
+
+def load_dictionary(filename, lazy=False):
+    """
+    Load dictionary from .spydata file.
+
+    If `lazy` is True, arrays are memory-mapped instead of being read. See
+    `load_dictionary_lazy`.
+    """
+    if lazy:
+        return load_dictionary_lazy(filename)
+
     filename = osp.abspath(filename)
     old_cwd = os.getcwd()
     tmp_folder = tempfile.mkdtemp()
@@ -406,21 +669,11 @@ def load_dictionary(filename):
         # 'New' format (Spyder >=2.2)
         with open(pickle_filename, 'rb') as fdesc:
             data = pickle.loads(fdesc.read())
-        saved_arrays = {}
-        if np.load is not FakeObject:
-            # Loading numpy arrays saved with np.save
-            try:
-                saved_arrays = data.pop('__saved_arrays__')
-                for (name, index), fname in list(saved_arrays.items()):
-                    arr = np.load(osp.join(tmp_folder, fname), allow_pickle=True)
-                    if index is None:
-                        data[name] = arr
-                    elif isinstance(data[name], dict):
-                        data[name][index] = arr
-                    else:
-                        data[name].insert(index, arr)
-            except KeyError:
-                pass
+        # Loading numpy arrays saved with np.save
+        _restore_saved_arrays(
+            data,
+            lambda fname: np.load(
+                osp.join(tmp_folder, fname), allow_pickle=True))
     # Except AttributeError from e.g. trying to load function no longer present
     except (AttributeError, EOFError, ValueError) as error:
         error_message = str(error)
@@ -434,29 +687,246 @@ def load_dictionary(filename):
     return data, error_message
 
 
+# ---- For lazy loading
+# -----------------------------------------------------------------------------
+# Extensions of the files that can be loaded lazily
+LAZY_LOAD_EXTENSIONS = ('.spydata', '.npy', '.h5')
+
+# Number of compressed .spydata files whose extracted arrays are kept
+SPYDATA_CACHE_SIZE = 4
+
+
+def _memmap_npy(filename, offset=0):
+    """
+    Memory-map the array of a .npy file found at `offset` in a file.
+
+    The array is copy-on-write: it can be modified, but the changes are not
+    written to the file. Returns None if the array can't be memory-mapped.
+    """
+    with open(filename, 'rb') as f:
+        f.seek(offset)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            header = np.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            header = np.lib.format.read_array_header_2_0(f)
+        else:
+            return None
+        shape, fortran_order, dtype = header
+        data_offset = f.tell()
+
+    if dtype.hasobject:
+        return None
+    return np.memmap(
+        filename, dtype=dtype, mode='c', offset=data_offset, shape=shape,
+        order='F' if fortran_order else 'C')
+
+
+def _get_spydata_cache_dir():
+    """Get the directory where compressed .spydata files are extracted."""
+    name = 'spyder_kernels_spydata'
+    if hasattr(os, 'getuid'):
+        # Not shared between users
+        name += '_%d' % os.getuid()
+    return osp.join(tempfile.gettempdir(), name)
+
+
+def _extract_spydata(filename):
+    """
+    Extract a compressed .spydata file to the cache and return its folder.
+
+    The cache is keyed by the path, size and modification time of the file,
+    so it is extracted again if it changes. Only the last
+    `SPYDATA_CACHE_SIZE` files used are kept.
+    """
+    stat = os.stat(filename)
+    key = hashlib.sha1(
+        '{}:{}:{}'.format(filename, stat.st_size, stat.st_mtime_ns).encode()
+    ).hexdigest()
+    cache_dir = _get_spydata_cache_dir()
+    folder = osp.join(cache_dir, key)
+
+    if osp.isdir(folder):
+        # Mark as recently used
+        os.utime(folder)
+        return folder
+
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    tmp_folder = tempfile.mkdtemp(dir=cache_dir)
+    try:
+        with tarfile.open(filename, "r") as tar:
+            safe_extract(tar, tmp_folder)
+        os.rename(tmp_folder, folder)
+    except OSError:
+        # Extracted at the same time by another kernel
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+        if not osp.isdir(folder):
+            raise
+    except BaseException:
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+        raise
+
+    # Remove the least recently used files
+    folders = sorted(
+        (osp.join(cache_dir, name) for name in os.listdir(cache_dir)),
+        key=osp.getmtime, reverse=True)
+    for old_folder in folders[SPYDATA_CACHE_SIZE:]:
+        # Can fail on Windows if its arrays are still mapped
+        shutil.rmtree(old_folder, ignore_errors=True)
+
+    return folder
+
+
+def load_dictionary_lazy(filename):
+    """
+    Load dictionary from .spydata file, memory-mapping its arrays.
+
+    The arrays of uncompressed files are mapped from the file itself, where
+    they are stored contiguously, without extracting them. Compressed files
+    are extracted once to a cache and their arrays mapped from there. The
+    arrays are copy-on-write, so editing them doesn't change the files.
+    """
+    filename = osp.abspath(filename)
+    data = None
+    error_message = None
+    try:
+        try:
+            tar = tarfile.open(filename, "r:")
+        except tarfile.ReadError:
+            # Compressed file
+            folder = _extract_spydata(filename)
+            pickle_filename = glob.glob(
+                osp.join(glob.escape(folder), '*.pickle'))[0]
+            with open(pickle_filename, 'rb') as fdesc:
+                data = pickle.loads(fdesc.read())
+
+            def load_array(fname):
+                path = osp.join(folder, fname)
+                arr = _memmap_npy(path)
+                if arr is None:
+                    arr = np.load(path, allow_pickle=True)
+                return arr
+
+            _restore_saved_arrays(data, load_array)
+        else:
+            with tar:
+                members = {member.name: member for member in tar}
+                pickle_name = [
+                    name for name in members
+                    if name.endswith('.pickle') and '/' not in name][0]
+                data = pickle.loads(
+                    tar.extractfile(members[pickle_name]).read())
+
+                def load_array(fname):
+                    member = members[fname]
+                    arr = _memmap_npy(filename, member.offset_data)
+                    if arr is None:
+                        arr = np.load(
+                            tar.extractfile(member), allow_pickle=True)
+                    return arr
+
+                _restore_saved_arrays(data, load_array)
+    # Except AttributeError from e.g. trying to load function no longer present
+    except (AttributeError, EOFError, ValueError) as error:
+        data = None
+        error_message = str(error)
+    return data, error_message
+
+
 # ---- For HDF5 files
 # -----------------------------------------------------------------------------
-def load_hdf5(filename):
+class LazyHDF5Dataset:
+    """
+    Proxy of an HDF5 dataset whose data is only read when it's sliced.
+
+    It implements the part of the Numpy array interface needed to show it in
+    the Variable Explorer. Its file is kept open while the proxy is alive,
+    and it's pickled as a reference to the dataset, not as its data.
+    """
+
+    def __init__(self, dataset):
+        self._dataset = dataset
+        self.filename = dataset.file.filename
+        self.name = dataset.name
+
+    @classmethod
+    def open(cls, filename, name):
+        """Open the dataset called `name` in an HDF5 file."""
+        import h5py
+        return cls(h5py.File(filename, 'r')[name])
+
+    @property
+    def shape(self):
+        return self._dataset.shape
+
+    @property
+    def dtype(self):
+        return self._dataset.dtype
+
+    @property
+    def ndim(self):
+        return self._dataset.ndim
+
+    @property
+    def size(self):
+        return self._dataset.size
+
+    @property
+    def nbytes(self):
+        return self._dataset.size * self._dataset.dtype.itemsize
+
+    def __len__(self):
+        return len(self._dataset)
+
+    def __getitem__(self, key):
+        return self._dataset[key]
+
+    def __array__(self, dtype=None, copy=None):
+        data = self._dataset[()]
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+        return data
+
+    def __reduce__(self):
+        return (LazyHDF5Dataset.open, (self.filename, self.name))
+
+    def __repr__(self):
+        return '<HDF5 dataset "{}": shape {}, type "{}">'.format(
+            self.name, self.shape, self.dtype.str)
+
+
+def load_hdf5(filename, lazy=False):
     """
     Load an hdf5 file.
 
     Notes
     -----
-    - This is a fairly dumb implementation which reads the whole HDF5 file into
-      Spyder's variable explorer.  Since HDF5 files are designed for storing
-      very large data-sets, it may be much better to work directly with the
-      HDF5 objects, thus keeping the data on disk. Nonetheless, this gives
-      quick and dirty but convenient access to them.
+    - By default, this reads the whole HDF5 file into Spyder's variable
+      explorer. Since HDF5 files are designed for storing very large
+      data-sets, `lazy` can be used to keep the data on disk instead: its
+      datasets are loaded as Dask arrays if Dask is installed, or as
+      `LazyHDF5Dataset` proxies otherwise, and they are only read when
+      they're sliced. Scalar datasets are always read.
     - There is no support for creating files with compression, chunking etc,
       although these can be read without problem.
     - When reading an HDF5 file with sub-groups, groups in the file will
       correspond to dictionaries with the same layout.
     """
+    def get_dataset(dataset):
+        if not lazy or dataset.ndim == 0:
+            return np.array(dataset)
+        proxy = LazyHDF5Dataset(dataset)
+        if da is None:
+            return proxy
+        # h5py is not thread safe, so reads are serialized with a lock
+        return da.from_array(
+            proxy, chunks=dataset.chunks or 'auto', lock=True, name=False)
+
     def get_group(group):
         contents = {}
         for name, obj in list(group.items()):
             if isinstance(obj, h5py.Dataset):
-                contents[name] = np.array(obj)
+                contents[name] = get_dataset(obj)
             elif isinstance(obj, h5py.Group):
                 # it is a group, so call self recursively
                 contents[name] = get_group(obj)
@@ -466,9 +936,17 @@ def get_group(group):
     try:
         import h5py
 
+        da = None
+        if lazy:
+            try:
+                import dask.array as da
+            except ImportError:
+                pass
+
         f = h5py.File(filename, 'r')
         contents = get_group(f)
-        f.close()
+        if not lazy:
+            f.close()
         return contents, None
     except Exception as error:
         return None, str(error)
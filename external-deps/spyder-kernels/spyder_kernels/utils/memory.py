@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Memory accounting of the variables of a namespace.
+
+The deep size of each variable is computed in a background thread, which
+works in short slices of time so that user code is barely slowed down, and
+is cached until the variable is replaced or its fingerprint changes.
+"""
+
+import mmap
+import sys
+import threading
+import time
+import types
+
+from spyder_kernels.utils.lazymodules import numpy as np, pandas as pd
+from spyder_kernels.utils.nsview import (
+    _get_reference, get_display_fingerprint, is_lazy_array)
+
+
+# Max nesting level followed when sizing containers
+MEMORY_MAX_DEPTH = 8
+
+# Max number of elements sized in each container. The size of the rest is
+# extrapolated from them.
+MEMORY_MAX_ITEMS = 1000
+
+# Max time spent sizing a single variable. Its size is a lower bound when
+# this is exceeded.
+MEMORY_TIME_BUDGET = 0.5
+
+# Time the accountant works before yielding to other threads, and time it
+# sleeps then
+MEMORY_WORK_SLICE = 0.01
+MEMORY_SLEEP_SLICE = 0.02
+
+# Objects shared with the rest of the process, whose size is not counted
+_SHARED_TYPES = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+    types.MethodType, types.CodeType, types.FrameType
+)
+
+
+def format_bytes(size):
+    """Format a number of bytes as a human readable string."""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024:
+            break
+        size /= 1024
+    else:
+        unit = 'TB'
+    if unit == 'B':
+        return '{} {}'.format(int(size), unit)
+    return '{:.1f} {}'.format(size, unit)
+
+
+def _get_data_owner(array):
+    """Get the object at the end of the base chain of an array."""
+    owner = array
+    while isinstance(owner, np.ndarray) and owner.base is not None:
+        owner = owner.base
+    return owner
+
+
+def get_deep_size(value, max_depth=MEMORY_MAX_DEPTH,
+                  max_items=MEMORY_MAX_ITEMS, time_budget=MEMORY_TIME_BUDGET):
+    """
+    Return the number of bytes used by *value* and the objects it contains.
+
+    The size of arrays is their number of bytes, views counting the array
+    owning their data instead and memory mapped arrays not counting their
+    data. The size of DataFrames and Series is given by their
+    `memory_usage(deep=True)` method and the one of other objects by
+    `sys.getsizeof`, plus the size of their elements or attributes. Objects
+    referenced several times are only counted once.
+
+    Parameters
+    ----------
+    value: object
+        Object to get the size of.
+    max_depth: int
+        Max nesting level followed in containers.
+    max_items: int
+        Max number of elements sized in each container. The size of the
+        others is assumed to be the average of the sized ones.
+    time_budget: float
+        Time after which the elements of containers are not sized anymore,
+        in which case the returned size is a lower bound.
+    """
+    seen = set()
+    deadline = time.perf_counter() + time_budget
+
+    def sizeof(obj, depth):
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+
+        if isinstance(obj, _SHARED_TYPES):
+            return 0
+        if is_lazy_array(obj):
+            # Their data is not in memory
+            return sys.getsizeof(obj)
+        if isinstance(obj, np.ndarray):
+            size = sys.getsizeof(obj)
+            owner = _get_data_owner(obj)
+            if isinstance(owner, mmap.mmap):
+                # Memory mapped data is not resident
+                pass
+            elif isinstance(owner, np.ndarray):
+                # Views don't include their data in their size, so count
+                # the array owning it, only once
+                if owner is not obj:
+                    size += sizeof(owner, depth)
+            else:
+                size += obj.nbytes
+            if obj.dtype.hasobject:
+                size += sum_items(obj.flat, obj.size, depth)
+            return size
+        if isinstance(obj, (pd.DataFrame, pd.Series)):
+            size = obj.memory_usage(deep=True, index=True)
+            return int(size.sum() if isinstance(obj, pd.DataFrame) else size)
+        if isinstance(obj, pd.Index):
+            return int(obj.memory_usage(deep=True))
+
+        size = sys.getsizeof(obj, 0)
+        if isinstance(obj, (str, bytes, bytearray, int, float, complex)):
+            return size
+        if isinstance(obj, dict):
+            size += sum_items(
+                (x for item in obj.items() for x in item),
+                2 * len(obj), depth)
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            size += sum_items(obj, len(obj), depth)
+
+        # Attributes of instances
+        attrs = getattr(obj, '__dict__', None)
+        if isinstance(attrs, dict):
+            size += sizeof(attrs, depth + 1)
+        for slot in getattr(type(obj), '__slots__', ()):
+            if isinstance(slot, str) and hasattr(obj, slot):
+                size += sizeof(getattr(obj, slot), depth + 1)
+        return size
+
+    def sum_items(items, length, depth):
+        if depth >= max_depth or not length:
+            return 0
+        total = 0
+        count = 0
+        for item in items:
+            if count >= max_items or time.perf_counter() > deadline:
+                break
+            total += sizeof(item, depth + 1)
+            count += 1
+        if count and count < length and count >= max_items:
+            # Extrapolate from the sized elements
+            total = total * length // count
+        return total
+
+    return sizeof(value, 0)
+
+
+class MemoryAccountant:
+    """
+    Compute the memory used by the variables of a namespace in a
+    background thread.
+
+    Sizes are cached by variable name, together with a reference to the
+    variable and its fingerprint as computed by `get_display_fingerprint`,
+    so they are only computed again when the variable changes.
+    """
+
+    def __init__(self, callback=None):
+        """
+        Parameters
+        ----------
+        callback: callable
+            Function called from the background thread with the result of
+            `get_usage` each time the sizes of all variables are known after
+            some of them changed.
+        """
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._pending = threading.Event()
+        # Name -> reference to the variable
+        self._variables = {}
+        # Name -> (reference, fingerprint, size)
+        self._sizes = {}
+        self._thread = None
+
+    def update(self, data):
+        """Set the variables to account for, as a name -> value dict."""
+        with self._lock:
+            self._variables = {
+                name: _get_reference(value) for name, value in data.items()
+            }
+        self._pending.set()
+
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name='Spyder memory accountant',
+                daemon=True)
+            self._thread.start()
+
+    def get_usage(self):
+        """
+        Get the sizes computed so far.
+
+        Returns
+        -------
+        dict
+            A dictionary with keys 'sizes', mapping variable names to their
+            size in bytes, and 'total', the sum of those sizes.
+        """
+        with self._lock:
+            sizes = {
+                name: self._sizes[name][2] for name in self._variables
+                if name in self._sizes
+            }
+        return {'sizes': sizes, 'total': sum(sizes.values())}
+
+    def compute(self):
+        """
+        Compute the sizes of the variables that changed.
+
+        Returns True if any size changed.
+        """
+        changed = False
+        slice_start = time.perf_counter()
+
+        with self._lock:
+            variables = dict(self._variables)
+            for name in list(self._sizes):
+                if name not in variables:
+                    del self._sizes[name]
+                    changed = True
+
+        for name, reference in variables.items():
+            value = reference()
+            if value is None:
+                continue
+
+            fingerprint = get_display_fingerprint(value)
+            cached = self._sizes.get(name)
+            if (
+                cached is not None
+                and fingerprint is not None
+                and cached[0]() is value
+                and cached[1] == fingerprint
+            ):
+                continue
+
+            try:
+                size = get_deep_size(value)
+            except Exception:
+                # The value was modified while being sized, or can't be
+                size = sys.getsizeof(value, 0)
+
+            with self._lock:
+                if self._variables.get(name) is not reference:
+                    # Replaced while being sized
+                    continue
+                self._sizes[name] = (reference, fingerprint, size)
+            changed = changed or cached is None or cached[2] != size
+
+            # Yield to the other threads
+            if time.perf_counter() - slice_start > MEMORY_WORK_SLICE:
+                time.sleep(MEMORY_SLEEP_SLICE)
+                slice_start = time.perf_counter()
+
+        return changed
+
+    # ---- Private API
+    def _run(self):
+        while True:
+            self._pending.wait()
+            self._pending.clear()
+            try:
+                changed = self.compute()
+            except Exception:
+                continue
+            if changed and self.callback is not None:
+                self.callback(self.get_usage())
@@ -8,6 +8,7 @@
 
 """Miscellaneous utilities"""
 
+from collections import OrderedDict
 import re
 
 from functools import lru_cache
@@ -48,3 +49,49 @@ def fix_reference_name(name, blacklist=None):
             index += 1
         name = get_new_name(index)
     return name
+
+
+class LRUCache:
+    """
+    Cache of limited size that drops its least recently used entries first
+    and counts its hits and misses.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+
+    def lookup(self, key, is_valid=None):
+        """
+        Get the entry of `key`, or None if it's not cached or
+        `is_valid(entry)` is False.
+        """
+        entry = self._entries.get(key)
+        if entry is None or (is_valid is not None and not is_valid(entry)):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def store(self, key, entry):
+        """Add an entry, removing the least recently used ones if needed."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get_stats(self):
+        """Get the number of hits, misses and entries of the cache."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
@@ -9,9 +9,16 @@
 """
 Utilities to build a namespace view.
 """
+import codecs
+import functools
 from itertools import islice
 import inspect
 import re
+import sys
+import threading
+import time
+import weakref
+import zlib
 
 from spyder_kernels.utils.lazymodules import (
     bs4, FakeObject, numpy as np, pandas as pd, PIL)
@@ -26,6 +33,25 @@ def get_numeric_numpy_types():
             np.complex64, np.complex128, np.bool_)
 
 
+def is_lazy_array(obj):
+    """
+    Return True if `obj` is an array whose data is only read when it's
+    sliced, like the datasets of HDF5 files loaded lazily or Dask arrays.
+    """
+    from spyder_kernels.utils.iofuncs import LazyHDF5Dataset
+
+    # The try/except is necessary to fix spyder-ide/spyder#19516.
+    try:
+        if isinstance(obj, LazyHDF5Dataset):
+            return True
+
+        # Dask is not imported if it wasn't already
+        dask_array = sys.modules.get('dask.array')
+        return dask_array is not None and isinstance(obj, dask_array.Array)
+    except Exception:
+        return False
+
+
 def get_numpy_dtype(obj):
     """
     Return Numpy data type associated to `obj`.
@@ -246,6 +272,31 @@ def unsorted_unique(lista):
 #==============================================================================
 # Display <--> Value
 #==============================================================================
+# Max number of characters shown in the display of a value
+DISPLAY_MAX_CHARS = 70
+
+# Max time (in seconds) spent computing the display of a value
+DISPLAY_TIME_BUDGET = 0.2
+
+
+class DisplayBudget:
+    """
+    Time and character budget to compute the display of a value.
+
+    It's shared by the nested calls done to display the elements of a
+    collection, so that they stop as soon as enough characters were
+    generated or too much time was spent.
+    """
+
+    def __init__(self, seconds=DISPLAY_TIME_BUDGET, chars=DISPLAY_MAX_CHARS):
+        self.deadline = time.perf_counter() + seconds
+        self.chars = chars
+
+    def is_exhausted(self, length=0):
+        """Check if the budget is exhausted after generating `length` chars."""
+        return length > self.chars or time.perf_counter() > self.deadline
+
+
 def default_display(value, with_module=True):
     """Default display for unknown objects."""
     object_type = type(value)
@@ -269,7 +320,7 @@ def default_display(value, with_module=True):
         return type_str[1:-1]
 
 
-def collections_display(value, level):
+def collections_display(value, level, budget=None):
     """Display for collections (i.e. list, set, tuple and dict)."""
     is_dict = isinstance(value, dict)
     is_set = isinstance(value, set)
@@ -289,15 +340,24 @@ def collections_display(value, level):
         elements = islice(elements, 5) if is_dict or is_set else value[:5]
         truncate = True
 
-    # Get display of each element
+    # Get display of each element until the budget is exhausted
     if level <= 2:
-        if is_dict:
-            displays = [value_to_display(k, level=level) + ':' +
-                        value_to_display(v, level=level)
-                        for (k, v) in list(elements)]
-        else:
-            displays = [value_to_display(e, level=level)
-                        for e in elements]
+        displays = []
+        length = 0
+        for element in elements:
+            if budget is not None and budget.is_exhausted(length):
+                truncate = True
+                break
+            if is_dict:
+                k, v = element
+                display = (value_to_display(k, level=level, budget=budget) +
+                           ':' +
+                           value_to_display(v, level=level, budget=budget))
+            else:
+                display = value_to_display(element, level=level,
+                                           budget=budget)
+            displays.append(display)
+            length += len(display) + 2
         if truncate:
             displays.append('...')
         display = ', '.join(displays)
@@ -317,8 +377,21 @@ def collections_display(value, level):
     return display
 
 
-def value_to_display(value, minmax=False, level=0):
-    """Convert value for display purpose"""
+# Max number of elements of arrays displayed without being summarized
+DISPLAY_ARRAY_THRESHOLD = 10
+
+
+def value_to_display(value, minmax=False, level=0, budget=None):
+    """
+    Convert value for display purpose.
+
+    The display is truncated to `DISPLAY_MAX_CHARS` and, for collections
+    and DataFrames, it stops being computed when `budget` is exhausted. A
+    new budget is used if none is given.
+    """
+    if budget is None:
+        budget = DisplayBudget()
+
     # To save current Numpy printoptions
     np_printoptions = FakeObject
     numeric_numpy_types = get_numeric_numpy_types()
@@ -329,7 +402,7 @@ def value_to_display(value, minmax=False, level=0):
             np_printoptions = np.get_printoptions()
             # Set max number of elements to show for Numpy arrays
             # in our display
-            np.set_printoptions(threshold=10)
+            np.set_printoptions(threshold=DISPLAY_ARRAY_THRESHOLD)
         if isinstance(value, np.recarray):
             if level == 0:
                 fields = value.names
@@ -354,8 +427,13 @@ def value_to_display(value, minmax=False, level=0):
                     display = default_display(value)
             else:
                 display = 'Numpy array'
+        elif is_lazy_array(value):
+            if level == 0:
+                display = repr(value)
+            else:
+                display = 'Lazy array'
         elif any([type(value) == t for t in [list, set, tuple, dict]]):
-            display = collections_display(value, level+1)
+            display = collections_display(value, level+1, budget=budget)
         elif isinstance(value, PIL.Image.Image):
             if level == 0:
                 display = '%s  Mode: %s' % (address(value), value.mode)
@@ -363,9 +441,15 @@ def value_to_display(value, minmax=False, level=0):
                 display = 'Image'
         elif isinstance(value, pd.DataFrame):
             if level == 0:
-                cols = value.columns
-                cols = [str(c) for c in cols]
-                display = 'Column names: ' + ', '.join(list(cols))
+                cols = []
+                length = 0
+                for c in value.columns:
+                    if budget.is_exhausted(length):
+                        cols.append('...')
+                        break
+                    cols.append(str(c))
+                    length += len(cols[-1]) + 2
+                display = 'Column names: ' + ', '.join(cols)
             else:
                 display = 'Dataframe'
         elif isinstance(value, bs4.element.NavigableString):
@@ -386,11 +470,16 @@ def value_to_display(value, minmax=False, level=0):
             # See issue 5636
             if type(value) in [str, bytes]:
                 try:
-                    display = str(value, 'utf8')
+                    # Only decode the part that can be shown. An
+                    # incremental decoder is used to not fail if a
+                    # multibyte character is cut at its end.
+                    decoder = codecs.getincrementaldecoder('utf8')()
+                    display = decoder.decode(
+                        value[:4 * (DISPLAY_MAX_CHARS + 1)])
                     if level > 0:
                         display = "'" + display + "'"
                 except:
-                    display = value
+                    display = value[:DISPLAY_MAX_CHARS + 1]
                     if level > 0:
                         display = b"'" + display + b"'"
             else:
@@ -399,7 +488,7 @@ def value_to_display(value, minmax=False, level=0):
             # We don't apply this to classes that extend string types
             # See issue 5636
             if type(value) in [str, bytes]:
-                display = value
+                display = value[:DISPLAY_MAX_CHARS + 1]
                 if level > 0:
                     display = "'" + display + "'"
             else:
@@ -420,14 +509,14 @@ def value_to_display(value, minmax=False, level=0):
     except Exception:
         display = default_display(value)
 
-    # Truncate display at 70 chars to avoid freezing Spyder
+    # Truncate display at DISPLAY_MAX_CHARS to avoid freezing Spyder
     # because of large displays
-    if len(display) > 70:
+    if len(display) > DISPLAY_MAX_CHARS:
         if isinstance(display, bytes):
             ellipses = b' ...'
         else:
             ellipses = ' ...'
-        display = display[:70].rstrip() + ellipses
+        display = display[:DISPLAY_MAX_CHARS].rstrip() + ellipses
 
     # Restore Numpy printoptions
     if np_printoptions is not FakeObject:
@@ -531,7 +620,10 @@ def get_human_readable_type(item):
     """Return human-readable type string of an item"""
     # The try/except is necessary to fix spyder-ide/spyder#19516.
     try:
-        if isinstance(item, (np.ndarray, np.ma.MaskedArray)):
+        if (
+            isinstance(item, (np.ndarray, np.ma.MaskedArray))
+            or is_lazy_array(item)
+        ):
             return u'Array of ' + item.dtype.name
         elif isinstance(item, PIL.Image.Image):
             return "Image"
@@ -663,9 +755,9 @@ def get_remote_data(data, settings, mode, more_excluded_names=None):
     """
     supported_types = get_supported_types()
     assert mode in list(supported_types.keys())
-    excluded_names = list(settings['excluded_names'])
+    excluded_names = set(settings['excluded_names'])
     if more_excluded_names is not None:
-        excluded_names += more_excluded_names
+        excluded_names.update(more_excluded_names)
     return globalsfilter(
         data,
         check_all=settings['check_all'],
@@ -678,22 +770,451 @@ def get_remote_data(data, settings, mode, more_excluded_names=None):
         excluded_names=excluded_names, filter_on=settings['filter_on'])
 
 
-def make_remote_view(data, settings, more_excluded_names=None):
+def make_view_entry(value, minmax=False):
+    """Make the remote view entry of a single value."""
+    return {
+        'type':  get_human_readable_type(value),
+        'size':  get_size(value),
+        'view':  value_to_display(value, minmax=minmax),
+        'python_type': get_type_string(value),
+        'numpy_type': get_numpy_type_string(value)
+    }
+
+
+def get_filter_regex(text):
+    """
+    Return the regex used to filter names and types with *text*.
+
+    Like the finder of the Variable Explorer, its characters have to be
+    found in order, but not necessarily next to each other.
+    """
+    chars = [re.escape(char) for char in text if char != ' ']
+    return re.compile('.*'.join(chars), re.IGNORECASE)
+
+
+_DIGITS_REGEX = re.compile(r'(\d+)')
+
+
+# Names are cached because the same ones are sorted on every refresh
+@functools.lru_cache(maxsize=2 ** 16)
+def _natural_key(name):
+    """Key to sort names with the numbers they contain in numeric order."""
+    return tuple(
+        int(part) if part.isdigit() else part.lower()
+        for part in _DIGITS_REGEX.split(str(name))
+    )
+
+
+def apply_view_spec(data, spec, sort_values=None):
+    """
+    Filter, sort and slice dictionary *data* according to a view spec.
+
+    Parameters
+    ----------
+    data: dict
+        Variables to show, by name.
+    spec: dict
+        View spec, with the following optional keys:
+
+        * 'filter': Text that the names or types of the variables have to
+          match, as with `get_filter_regex`.
+        * 'sort': Key to sort the variables by, which can be 'name', 'type'
+          or 'value' to use the numbers in *sort_values*. Variables are not
+          sorted if this is None.
+        * 'ascending': Whether to sort in ascending order.
+        * 'offset' and 'limit': First variable to return and max number of
+          variables to return, after sorting.
+    sort_values: dict
+        Numbers to sort the variables by when 'sort' is 'value', by name.
+        Variables without a number come first.
+
+    Returns
+    -------
+    tuple
+        A dictionary with the variables in the requested page and the
+        number of variables that matched the filter.
+    """
+    if not spec:
+        return data, len(data)
+
+    names = list(data)
+    text = spec.get('filter')
+    if text:
+        regex = get_filter_regex(text)
+        names = [
+            name for name in names
+            if regex.search(str(name))
+            or regex.search(get_human_readable_type(data[name]))
+        ]
+    total = len(names)
+
+    sort = spec.get('sort', 'name')
+    if sort is not None:
+        if sort == 'type':
+            def key(name):
+                return (get_human_readable_type(data[name]),
+                        _natural_key(name))
+        elif sort == 'value':
+            sort_values = sort_values or {}
+
+            def key(name):
+                return (sort_values.get(name, -1), _natural_key(name))
+        else:
+            key = _natural_key
+        try:
+            names.sort(key=key, reverse=not spec.get('ascending', True))
+        except TypeError:
+            pass
+
+    offset = spec.get('offset') or 0
+    limit = spec.get('limit')
+    if limit is not None:
+        names = names[offset:offset + limit]
+    elif offset:
+        names = names[offset:]
+
+    return {name: data[name] for name in names}, total
+
+
+def make_remote_view(data, settings, more_excluded_names=None, spec=None,
+                     sort_values=None):
     """
     Make a remote view of dictionary *data*
     -> globals explorer
+
+    If a view *spec* is given, only the variables it selects are included
+    (see `apply_view_spec`).
     """
     data = get_remote_data(data, settings, mode='editable',
                            more_excluded_names=more_excluded_names)
+    data, __ = apply_view_spec(data, spec, sort_values)
     remote = {}
     for key, value in list(data.items()):
-        view = value_to_display(value, minmax=settings['minmax'])
-        remote[key] = {
-            'type':  get_human_readable_type(value),
-            'size':  get_size(value),
-            'view':  view,
-            'python_type': get_type_string(value),
-            'numpy_type': get_numpy_type_string(value)
-        }
+        remote[key] = make_view_entry(value, minmax=settings['minmax'])
 
     return remote
+
+
+#==============================================================================
+# Incremental remote view
+#==============================================================================
+IMMUTABLE_DISPLAY_TYPES = (
+    type(None), bool, int, float, complex, str, bytes, range,
+    datetime.date, datetime.time, datetime.timedelta
+)
+
+
+def is_display_immutable(value):
+    """
+    Return True if the view of *value* can only change by rebinding it.
+
+    That's the case for immutable scalars and strings, and also for
+    routines, classes and modules because their view only depends on
+    their type.
+    """
+    # The try/except is necessary to fix spyder-ide/spyder#19516.
+    try:
+        return (
+            isinstance(value, IMMUTABLE_DISPLAY_TYPES) or
+            isinstance(value, np.generic) or
+            inspect.isroutine(value) or
+            inspect.isclass(value) or
+            inspect.ismodule(value)
+        )
+    except Exception:
+        return False
+
+
+def _get_reference(value):
+    """
+    Return a callable that gives back *value*.
+
+    A weak reference is used when possible to not keep alive objects
+    removed from the namespace.
+    """
+    try:
+        return weakref.ref(value)
+    except TypeError:
+        return lambda: value
+
+
+# Max size in bytes of arrays whose whole data is part of their fingerprint
+FINGERPRINT_MAX_BYTES = 64 * 1024
+
+
+def _get_collection_fingerprint(value, level, references):
+    """
+    Return the fingerprint of the elements of a collection shown in its view.
+
+    This follows the number of elements and nesting levels displayed by
+    `collections_display`.
+    """
+    if level > 2:
+        return ()
+
+    nelements = 10 if level == 1 else 5
+    if type(value) is dict:
+        elements = []
+        for k, v in islice(value.items(), nelements):
+            elements += [k, v]
+    elif type(value) is set:
+        elements = list(islice(value, nelements))
+    else:
+        elements = value[:nelements]
+
+    fingerprint = [len(value)]
+    for element in elements:
+        if type(element) in (list, set, tuple, dict):
+            fingerprint.append(
+                _get_collection_fingerprint(element, level + 1, references))
+        else:
+            # Other elements are displayed by their value if they are
+            # immutable or by their type otherwise.
+            fingerprint.append(id(element))
+            references.append(element)
+    return tuple(fingerprint)
+
+
+def _get_displayed_elements(value):
+    """
+    Return the elements of array *value* shown by `value_to_display`.
+
+    Numpy summarizes arrays with more than `DISPLAY_ARRAY_THRESHOLD`
+    elements by only printing the `edgeitems` first and last elements of
+    each axis.
+    """
+    if value.size <= DISPLAY_ARRAY_THRESHOLD:
+        return value
+    edgeitems = np.get_printoptions()['edgeitems']
+    indexes = []
+    for length in value.shape:
+        if length > 2 * edgeitems:
+            indexes.append(np.r_[0:edgeitems, length - edgeitems:length])
+        else:
+            indexes.append(np.arange(length))
+    return value[np.ix_(*indexes)]
+
+
+def get_display_fingerprint(value, references=None, minmax=False):
+    """
+    Return a cheap fingerprint of the parts of *value* its view depends on.
+
+    This is used to detect if a value was mutated since its view was
+    computed, without computing it again. It's made of the type and size of
+    *value* and, depending on its type:
+
+    * The identity of the elements of collections shown in their view.
+    * The dtype, strides and data address of arrays, plus a checksum of
+      their data, or of the elements shown in their view for large arrays.
+    * The identity of the columns of DataFrames.
+
+    Parameters
+    ----------
+    value: object
+        Value to compute the fingerprint of.
+    references: list
+        If given, the objects whose identity is part of the fingerprint are
+        added to it. Keeping them alive prevents their ids from being
+        reused by other objects.
+    minmax: bool
+        Whether the view of arrays shows their minimum and maximum, which
+        depend on all their elements.
+
+    Returns
+    -------
+    tuple or None
+        The fingerprint, or None if it can't be computed, in which case the
+        view of *value* always needs to be computed.
+    """
+    if references is None:
+        references = []
+    if is_display_immutable(value):
+        return ()
+
+    try:
+        fingerprint = (type(value), get_size(value))
+        if type(value) in (list, set, tuple, dict):
+            fingerprint += _get_collection_fingerprint(value, 1, references)
+        elif isinstance(value, np.ndarray):
+            fingerprint += (
+                value.dtype.str,
+                value.strides,
+                value.__array_interface__['data'][0]
+            )
+            if value.nbytes <= FINGERPRINT_MAX_BYTES:
+                fingerprint += (zlib.crc32(value.tobytes()),)
+            elif minmax:
+                # Checking all elements would cost as much as the view
+                return None
+            else:
+                fingerprint += (
+                    zlib.crc32(_get_displayed_elements(value).tobytes()),)
+        elif isinstance(value, pd.DataFrame):
+            fingerprint += (id(value.columns),)
+            references.append(value.columns)
+        elif isinstance(value, PIL.Image.Image):
+            fingerprint += (value.mode,)
+        return fingerprint
+    except Exception:
+        return None
+
+
+class NamespaceViewTracker:
+    """
+    Track the remote view of a namespace between refreshes.
+
+    This allows to only compute and send to the frontend the entries that
+    were added, removed or changed since the last refresh. Each delta
+    carries the version it applies to, so the frontend can detect when it
+    missed one and request a full view instead.
+
+    Entries are memoized by object identity plus the fingerprint given by
+    `get_display_fingerprint`, so unchanged objects are not displayed again.
+
+    When a view spec is given, only the entries of the page of variables it
+    selects are computed and sent.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._lock = threading.Lock()
+        # Name -> (reference, view entry, properties, fingerprint,
+        # references kept alive by the fingerprint)
+        self._entries = {}
+        # Name -> reference of all variables that can be shown, including
+        # the ones outside of the page
+        self._references = {}
+        self._total = None
+        self._full_pending = True
+        self.hits = 0
+        self.misses = 0
+
+    def reset(self):
+        """Forget the tracked entries, so they are all computed again."""
+        with self._lock:
+            self._entries = {}
+            self._references = {}
+            self._total = None
+            self._full_pending = True
+
+    def get_values(self):
+        """
+        Return the variables that can be shown in the view, by name.
+
+        This includes the ones that are filtered out by the view spec or
+        are outside of its page.
+        """
+        with self._lock:
+            values = {
+                name: reference()
+                for name, reference in self._references.items()
+            }
+        return {
+            name: value for name, value in values.items()
+            if value is not None
+        }
+
+    def get_delta(self, data, settings, get_properties,
+                  more_excluded_names=None, full=False, spec=None,
+                  sort_values=None):
+        """
+        Get the changes in the remote view of dictionary *data*.
+
+        Parameters
+        ----------
+        data: dict
+            Namespace to compute the view of.
+        settings: dict
+            Variable Explorer settings (see `REMOTE_SETTINGS`).
+        get_properties: callable
+            Function that returns the properties of a value.
+        more_excluded_names: list
+            Additional excluded names.
+        full: bool
+            If True, return all entries instead of only the changed ones.
+            The entries of mutable objects are computed again in that case.
+        spec: dict
+            View spec selecting the variables to show (see
+            `apply_view_spec`).
+        sort_values: dict
+            Numbers to sort the variables by, if requested by *spec*.
+
+        Returns
+        -------
+        dict or None
+            A dictionary with the keys 'version', 'base_version' (None for
+            full views), 'view', 'var_properties', 'removed' and 'total',
+            the number of variables that matched the filter of *spec*, or
+            None if nothing changed since the last call.
+        """
+        data = get_remote_data(data, settings, mode='editable',
+                               more_excluded_names=more_excluded_names)
+        references = {
+            name: _get_reference(value) for name, value in data.items()
+        }
+        data, total = apply_view_spec(data, spec, sort_values)
+
+        with self._lock:
+            self._references = references
+            full = full or self._full_pending
+            previous = self._entries
+            entries = {}
+            view = {}
+            properties = {}
+            changed = False
+
+            for name, value in list(data.items()):
+                cached = previous.get(name)
+                references = []
+                fingerprint = get_display_fingerprint(
+                    value, references, minmax=settings['minmax'])
+                if (
+                    cached is not None and
+                    fingerprint is not None and
+                    cached[0]() is value and
+                    cached[3] == fingerprint and
+                    (not full or fingerprint == ())
+                ):
+                    entries[name] = cached
+                    self.hits += 1
+                else:
+                    entry = make_view_entry(value, minmax=settings['minmax'])
+                    props = get_properties(value)
+                    entries[name] = (
+                        _get_reference(value), entry, props, fingerprint,
+                        references
+                    )
+                    self.misses += 1
+                    if (
+                        cached is None or
+                        cached[1] != entry or
+                        cached[2] != props
+                    ):
+                        view[name] = entry
+                        properties[name] = props
+                        changed = True
+
+            removed = [name for name in previous if name not in entries]
+            self._entries = entries
+            self._full_pending = False
+            total_changed = total != self._total
+            self._total = total
+
+            if removed or changed or total_changed:
+                self.version += 1
+            elif not full:
+                return None
+
+            if full:
+                view = {name: entries[name][1] for name in entries}
+                properties = {name: entries[name][2] for name in entries}
+                removed = []
+
+            return {
+                'version': self.version,
+                'base_version': None if full else self.version - 1,
+                'view': view,
+                'var_properties': properties,
+                'removed': removed,
+                'total': total,
+            }
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Preloading of modules in the background.
+
+Modules users import in most sessions are imported in a thread right after
+the kernel starts, so that their first cell doesn't wait for them. The
+thread waits while code is being executed, so it only imports modules when
+the kernel is idle. Code that imports a module while it is being preloaded
+waits for it to finish instead of importing it again.
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+import time
+
+
+def parse_module_list(text):
+    """Get the module names of a comma separated list."""
+    if not text:
+        return []
+    return [name.strip() for name in text.split(',') if name.strip()]
+
+
+class ModulePreloader:
+    """Import a list of modules in a background thread."""
+
+    def __init__(self, callback=None):
+        """
+        Parameters
+        ----------
+        callback: callable
+            Function called from the background thread with the result of
+            `get_timings` when all modules are preloaded.
+        """
+        self.callback = callback
+        # Module name -> import time in seconds, or None if it couldn't be
+        # imported
+        self.timings = {}
+        self.finished = False
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = None
+
+    def start(self, modules):
+        """Start preloading modules, if not started already."""
+        if self._thread is not None or not modules:
+            return
+        self._thread = threading.Thread(
+            target=self._run, args=(list(modules),),
+            name='Spyder module preloader', daemon=True)
+        self._thread.start()
+
+    def set_busy(self, busy):
+        """Pause preloading while code is being executed."""
+        if busy:
+            self._idle.clear()
+        else:
+            self._idle.set()
+
+    def get_timings(self):
+        """
+        Get the import time of the modules preloaded so far.
+
+        Returns
+        -------
+        dict
+            A dictionary with keys 'modules', mapping module names to their
+            import time in seconds, or None if they couldn't be imported,
+            and 'finished', which is True when all modules were preloaded.
+        """
+        return {'modules': dict(self.timings), 'finished': self.finished}
+
+    # ---- Private API
+    def _run(self, modules):
+        for name in modules:
+            self._idle.wait()
+            self.timings[name] = self._import(name)
+        self.finished = True
+        if self.callback is not None:
+            self.callback(self.get_timings())
+
+    def _import(self, name):
+        """Import a module and return the time it took."""
+        if name in sys.modules:
+            return 0.
+        try:
+            if importlib.util.find_spec(name) is None:
+                return None
+            t0 = time.perf_counter()
+            importlib.import_module(name)
+            return time.perf_counter() - t0
+        except Exception:
+            # Modules can fail to be imported due to a lot of issues
+            return None
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Sampling profiler.
+
+Instead of tracing every call as cProfile does, the stack of the profiled
+thread is recorded at regular intervals from a helper thread, using
+`sys._current_frames`. Each sample is weighted by the time elapsed since the
+previous one, and samples are aggregated into inclusive and exclusive times
+per function and per line.
+
+The results can be saved in the format of the `pstats` module, so that they
+can be shown like the ones of cProfile, and as folded stacks, which is the
+format used by flame graph tools.
+
+This module can also be run as a script to profile another one, like
+cProfile::
+
+    python -m spyder_kernels.utils.sampling [-i interval] [-o outfile]
+        [--folded folded_outfile] script [args]
+"""
+
+from collections import defaultdict
+import marshal
+import os
+import sys
+import threading
+import time
+
+
+# Default time between samples, in seconds. Python threads only switch every
+# `sys.getswitchinterval()` seconds while running pure Python code, so a
+# shorter interval only helps with code that releases the GIL.
+SAMPLING_INTERVAL = 0.005
+
+
+def get_function_key(code):
+    """Get the key used by the pstats module for the function of code."""
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+
+class SamplingProfiler:
+    """
+    Record the stack of a thread at regular intervals.
+
+    The profiler can be used as a context manager, in which case it samples
+    the code run in the `with` block.
+    """
+
+    def __init__(self, interval=SAMPLING_INTERVAL):
+        """
+        Parameters
+        ----------
+        interval: float
+            Time between samples, in seconds.
+        """
+        self.interval = interval
+        self.stats = {}
+        # Stack -> [number of samples, sampled time]. Stacks are tuples of
+        # (code, line number), from the innermost frame out.
+        self._samples = defaultdict(lambda: [0, 0.])
+        self._thread_id = None
+        self._root_frame = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def __enter__(self):
+        self._start(sys._getframe(1))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Start sampling the code run by the calling thread."""
+        self._start(sys._getframe(1))
+
+    def stop(self):
+        """Stop sampling."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def runctx(self, code, globals, locals):
+        """Sample the execution of code, like `cProfile.Profile.runctx`."""
+        with self:
+            exec(code, globals, locals)
+        return self
+
+    def create_stats(self):
+        """
+        Aggregate the samples into `self.stats`, in the format of the pstats
+        module.
+
+        The number of calls of each function is its number of samples, its
+        total time is the time sampled while it was running (exclusive time)
+        and its cumulative time the time sampled while it was on the stack
+        (inclusive time).
+        """
+        # Function -> [calls, calls, total time, cumulative time, callers]
+        stats = {}
+        for stack, (count, weight) in self._samples.items():
+            functions = [get_function_key(code) for code, __ in stack]
+            seen = set()
+            for i, function in enumerate(functions):
+                caller = functions[i + 1] if i + 1 < len(functions) else None
+                # Recursive calls are only counted once per sample
+                if (function, caller) in seen:
+                    continue
+                first = function not in seen
+                seen.add(function)
+                seen.add((function, caller))
+
+                entry = stats.setdefault(function, [0, 0, 0., 0., {}])
+                exclusive = weight if i == 0 else 0.
+                if first:
+                    entry[0] += count
+                    entry[1] += count
+                    entry[2] += exclusive
+                    entry[3] += weight
+                if caller is not None:
+                    callers = entry[4]
+                    nc, cc, tt, ct = callers.get(caller, (0, 0, 0., 0.))
+                    callers[caller] = (
+                        nc + count, cc + count, tt + exclusive, ct + weight)
+
+        self.stats = {
+            function: tuple(entry) for function, entry in stats.items()
+        }
+        return self.stats
+
+    def get_line_stats(self):
+        """
+        Aggregate the samples per line.
+
+        Returns
+        -------
+        dict
+            Maps (filename, line number, function name) to a tuple with the
+            time sampled while the line was running (exclusive time) and
+            while it was on the stack (inclusive time).
+        """
+        line_stats = defaultdict(lambda: [0., 0.])
+        for stack, (__, weight) in self._samples.items():
+            seen = set()
+            for i, (code, line) in enumerate(stack):
+                key = (code.co_filename, line, code.co_name)
+                if i == 0:
+                    line_stats[key][0] += weight
+                if key not in seen:
+                    seen.add(key)
+                    line_stats[key][1] += weight
+        return {key: tuple(value) for key, value in line_stats.items()}
+
+    def get_folded_stacks(self):
+        """
+        Get the samples as folded stacks.
+
+        Each line has the frames of a stack, from the outermost one in,
+        separated by semicolons and followed by the time sampled in that
+        stack, in microseconds. Frames are written as
+        `function (filename:line)`.
+        """
+        lines = []
+        for stack, (__, weight) in self._samples.items():
+            frames = ';'.join(
+                '{} ({}:{})'.format(code.co_name, code.co_filename, line)
+                for code, line in reversed(stack)
+            )
+            lines.append('{} {}'.format(frames, int(weight * 1e6)))
+        return '\n'.join(sorted(lines))
+
+    def dump_stats(self, filename):
+        """Save the stats in a file that can be loaded by pstats."""
+        self.create_stats()
+        with open(filename, 'wb') as f:
+            marshal.dump(self.stats, f)
+
+    def dump_folded_stacks(self, filename):
+        """Save the folded stacks in a file."""
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(self.get_folded_stacks())
+
+    # ---- Private API
+    def _start(self, root_frame):
+        if self._thread is not None:
+            return
+        self._thread_id = threading.get_ident()
+        self._root_frame = root_frame
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='Spyder sampling profiler', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        last_time = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            now = time.perf_counter()
+            if frame is None or self._stopped.is_set():
+                # The thread finished or is stopping the profiler
+                break
+
+            stack = []
+            while frame is not None and frame is not self._root_frame:
+                stack.append((frame.f_code, frame.f_lineno))
+                frame = frame.f_back
+            # Don't keep a reference to the frames of the profiled thread
+            del frame
+
+            if stack:
+                sample = self._samples[tuple(stack)]
+                sample[0] += 1
+                sample[1] += now - last_time
+            last_time = now
+
+
+def main():
+    """Profile a script, like `python -m cProfile`."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Sample the execution of a Python script.")
+    parser.add_argument(
+        '-i', '--interval', type=float, default=SAMPLING_INTERVAL * 1000,
+        help="Time between samples, in milliseconds")
+    parser.add_argument(
+        '-o', '--outfile',
+        help="Save the stats to outfile, in the format of pstats")
+    parser.add_argument(
+        '--folded', help="Save the folded stacks to this file")
+    parser.add_argument('script', help="Script to profile")
+    parser.add_argument('args', nargs=argparse.REMAINDER)
+    options = parser.parse_args()
+
+    sys.argv = [options.script] + options.args
+    sys.path.insert(0, os.path.dirname(options.script))
+    with open(options.script, 'rb') as f:
+        code = compile(f.read(), options.script, 'exec')
+    globs = {
+        '__file__': options.script,
+        '__name__': '__main__',
+        '__package__': None,
+        '__cached__': None,
+    }
+
+    profiler = SamplingProfiler(interval=options.interval / 1000)
+    try:
+        profiler.runctx(code, globs, None)
+    except SystemExit:
+        pass
+    finally:
+        if options.outfile:
+            profiler.dump_stats(options.outfile)
+        else:
+            import pstats
+            profiler.create_stats()
+            pstats.Stats(profiler).sort_stats('cumulative').print_stats(20)
+        if options.folded:
+            profiler.dump_folded_stacks(options.folded)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for dfview.py
+"""
+
+# Third party imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local imports
+from spyder_kernels.utils.dfview import DataFrameView
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {'name': ['b', 'a', 'c', 'ab'], 'value': [3, 1, 2, 1]},
+        index=[10, 40, 30, 20])
+
+
+def test_get_block(df):
+    """Test getting blocks of a view."""
+    view = DataFrameView(df)
+    info = view.get_info()
+    assert info['shape'] == (4, 2)
+    assert info['type'] == 'DataFrame'
+    assert not info['is_series']
+    assert (info['column_levels'], info['index_levels']) == (1, 1)
+
+    block = view.get_block((1, 10), (1, 2))
+    assert block['data'].equals(df.iloc[1:, 1:])
+    assert np.array_equal(block['rows'], [1, 2, 3])
+
+
+def test_sort_and_filter(df):
+    """Test that views are sorted and filtered without changing the data."""
+    original = df.copy()
+    view = DataFrameView(df)
+
+    # Sort by column
+    view.sort(1, ascending=True)
+    block = view.get_block((0, 4), (0, 2))
+    assert block['data']['name'].tolist() == ['a', 'ab', 'c', 'b']
+    assert np.array_equal(block['rows'], [1, 3, 2, 0])
+
+    # Filter keeps the sort order
+    view.filter(0, 'A')
+    assert view.shape == (2, 2)
+    block = view.get_block((0, 4), (0, 2))
+    assert block['data']['name'].tolist() == ['a', 'ab']
+
+    # Sort by index
+    view.sort(-1, ascending=False)
+    block = view.get_block((0, 4), (0, 2))
+    assert block['data'].index.tolist() == [40, 20]
+
+    # Remove filter
+    view.filter(0, '')
+    assert view.shape == (4, 2)
+    assert view.get_filters() == {}
+
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_set_values(df):
+    """Test setting values through a view."""
+    view = DataFrameView(df)
+    view.sort(0)
+    view.set_values({(2, 1): 10})
+    assert df.iloc[2, 1] == 10
+
+    series = pd.Series([1, 2, 3], name='s')
+    view = DataFrameView(series)
+    assert view.get_info()['is_series']
+    view.set_values({(1, 0): 5})
+    assert series.tolist() == [1, 5, 3]
+    assert view.get_block((0, 3), (0, 1))['data']['s'].tolist() == [1, 5, 3]
+
+    view = DataFrameView(pd.Index([1, 2]))
+    assert view.get_info()['readonly']
+    with pytest.raises(TypeError):
+        view.set_values({(0, 0): 3})
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -11,15 +11,17 @@
 """
 
 # Standard library imports
+import gc
 import os
 import sys
+import weakref
 
 # Test library imports
 import pytest
 
 # Local imports
-from spyder_kernels.utils.dochelpers import (getargtxt, getdoc, getobj,
-                                             isdefined)
+from spyder_kernels.utils.dochelpers import (
+    DocCache, getargtxt, getdoc, getobj, getobjstatic, getsource, isdefined)
 
 
 class Test(object):
@@ -58,5 +60,78 @@ def test_dochelpers():
     assert getobj('4.') == '4'
 
 
+def test_doc_cache(tmpdir, monkeypatch):
+    """Test that the documentation cache is invalidated by module changes."""
+    monkeypatch.syspath_prepend(str(tmpdir))
+    module_file = tmpdir.join('doc_cache_module.py')
+    module_file.write('def func(x):\n    """Old doc."""\n')
+    import doc_cache_module
+
+    cache = DocCache()
+    assert cache.get(getdoc, doc_cache_module.func)['docstring'] == 'Old doc.'
+    assert cache.get(getdoc, doc_cache_module.func)['docstring'] == 'Old doc.'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Each kind of result is cached separately
+    assert 'def func' in cache.get(getsource, doc_cache_module.func)
+    assert cache.misses == 2
+
+    # Bound methods are new objects every time, but they're identified by
+    # their function and instance
+    instance = Test()
+    cache.get(getargtxt, instance.method)
+    cache.get(getargtxt, instance.method)
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    # Results are computed again if the module file changes
+    module_file.write('def func(x):\n    """New doc."""\n')
+    stat = os.stat(str(module_file))
+    os.utime(str(module_file), ns=(stat.st_atime_ns,
+                                   stat.st_mtime_ns + 10**9))
+    doc_cache_module.func.__doc__ = 'New doc.'
+    assert cache.get(getdoc, doc_cache_module.func)['docstring'] == 'New doc.'
+    assert cache.misses == 4
+
+    cache.clear()
+    assert cache.get_stats()['size'] == 0
+
+
+def test_doc_cache_references():
+    """Test that the documentation cache doesn't keep objects alive."""
+    cache = DocCache()
+    instance = Test()
+    cache.get(getdoc, instance)
+    cache.get(getargtxt, instance.method)
+    reference = weakref.ref(instance)
+    del instance
+    gc.collect()
+    assert reference() is None
+
+    # Objects that can't be weakly referenced are not cached
+    cache.clear()
+    misses = cache.misses
+    assert cache.get(getdoc, 1) is not None
+    assert cache.get(getdoc, 1) is not None
+    assert cache.get_stats()['size'] == 0
+    assert cache.misses == misses + 2
+
+
+def test_getobjstatic():
+    """Test getting objects from their names without running code."""
+    class WithProperty:
+        @property
+        def prop(self):
+            raise AssertionError("Code was run")
+
+    namespace = {'os': os, 'WithProperty': WithProperty, 'x': WithProperty()}
+    assert getobjstatic('os.path.join', namespace) is os.path.join
+    assert getobjstatic('sorted', namespace) is sorted
+    assert getobjstatic('os.sep', namespace) is None
+    assert getobjstatic('WithProperty.prop', namespace) is None
+    assert getobjstatic('x.prop', namespace) is None
+    assert getobjstatic('os.path.join()', namespace) is None
+    assert getobjstatic('undefined', namespace) is None
+
+
 if __name__ == "__main__":
     pytest.main()
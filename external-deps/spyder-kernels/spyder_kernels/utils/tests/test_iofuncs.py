@@ -13,7 +13,10 @@
 # Standard library imports
 import io
 import os
+import pickle
+import sys
 import copy
+import tarfile
 
 # Third party imports
 from PIL import ImageFile
@@ -245,6 +248,88 @@ def test_spydata_import(spydata_file_name, spydata_values):
     assert are_namespaces_equal(data, spydata_values)
 
 
+@pytest.mark.parametrize('spydata_file_name', ['export_data.spydata',
+                                               'export_data_renamed.spydata'])
+def test_spydata_lazy_import(spydata_file_name, spydata_values):
+    """Test that arrays of spydata files are memory-mapped in lazy mode."""
+    path = os.path.join(LOCATION, spydata_file_name)
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    data, error = iofuncs.load_dictionary(path, lazy=True)
+    assert error is None
+    assert are_namespaces_equal(data, spydata_values)
+    assert isinstance(data['C'], np.memmap)
+    assert isinstance(data['E'][0], np.memmap)
+
+    # Object arrays can't be mapped
+    assert not isinstance(data['E'][3], np.memmap)
+
+    # Changes are not written to the file
+    data['C'][0, 0] = 10
+    del data
+    with open(path, 'rb') as f:
+        assert f.read() == content
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_spydata_lazy_import_streamed(tmp_path, monkeypatch, compress):
+    """
+    Test lazy loading of spydata files, which are extracted to a cache when
+    compressed.
+    """
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr(
+        iofuncs, '_get_spydata_cache_dir', lambda: str(cache_dir))
+    monkeypatch.setattr(iofuncs, 'SPYDATA_CACHE_SIZE', 1)
+    path = str(tmp_path / 'data.spydata')
+    data = {
+        'array': np.arange(12.).reshape(3, 4),
+        'fortran_array': np.asfortranarray(np.arange(12).reshape(3, 4)),
+        'list': [1, np.ones(3)],
+    }
+    assert iofuncs.save_dictionary(data, path, compress=compress) is None
+
+    for __ in range(2):
+        loaded, error = iofuncs.load_dictionary(path, lazy=True)
+        assert error is None
+        assert isinstance(loaded['array'], np.memmap)
+        assert np.array_equal(loaded['array'], data['array'])
+        assert np.array_equal(loaded['fortran_array'], data['fortran_array'])
+        assert np.array_equal(loaded['list'][1], np.ones(3))
+        assert loaded['list'][0] == 1
+        loaded['array'][0, 0] = 10
+        del loaded
+
+    if compress:
+        # Extracted once
+        assert len(os.listdir(str(cache_dir))) == 1
+
+        # Only the last file used is kept
+        other_path = str(tmp_path / 'other.spydata')
+        iofuncs.save_dictionary({'a': np.ones(2)}, other_path, compress=True)
+        loaded, error = iofuncs.load_dictionary(other_path, lazy=True)
+        assert np.array_equal(loaded['a'], np.ones(2))
+        assert len(os.listdir(str(cache_dir))) == 1
+    else:
+        assert not cache_dir.exists()
+
+    loaded, error = iofuncs.load_dictionary(path)
+    assert loaded['array'][0, 0] == 0
+
+
+def test_npy_lazy_import(tmp_path):
+    """Test that npy files are memory-mapped in lazy mode."""
+    path = str(tmp_path / 'data.npy')
+    np.save(path, np.arange(10))
+    data, error = iofuncs.load_array(path, lazy=True)
+    assert error is None
+    assert isinstance(data['data'], np.memmap)
+    assert np.array_equal(data['data'], np.arange(10))
+    data['data'][0] = 10
+    assert np.load(path)[0] == 0
+
+
 def test_spydata_import_witherror():
     """
     Test that import fails gracefully with a fn not present in the namespace.
@@ -340,6 +425,55 @@ def test_spydata_export(input_namespace, expected_namespace,
                 pass
 
 
+@pytest.mark.parametrize('compress', [False, True])
+def test_spydata_export_streamed(tmp_path, compress):
+    """
+    Test that spydata files are written without modifying the saved objects
+    and can be read back, compressed or not.
+    """
+    path = str(tmp_path / 'streamed.spydata')
+    array = np.arange(3 * iofuncs.SPYDATA_CHUNK_SIZE // 8, dtype=np.float64)
+    fortran_array = np.asfortranarray(np.arange(12.).reshape(3, 4))
+    data = {
+        'array': array,
+        'fortran_array': fortran_array,
+        'strided_array': array[::3],
+        'text': 'ham' * iofuncs.SPYDATA_CHUNK_SIZE,
+        'list': [1, np.eye(2), 'spam', np.eye(3, dtype=object)],
+        'dict': {'a': np.ones(3), 'b': 2},
+    }
+
+    # Existing files are replaced
+    with open(path, 'w') as f:
+        f.write('old')
+
+    assert iofuncs.save_dictionary(
+        data, path, compress=compress, workers=2) is None
+    assert os.listdir(str(tmp_path)) == ['streamed.spydata']
+
+    # The saved objects are untouched
+    assert len(data['list']) == 4
+    assert list(data['dict']) == ['a', 'b']
+
+    with tarfile.open(path, 'r') as tar:
+        names = tar.getnames()
+        assert (tar.fileobj.__class__.__name__ == 'GzipFile') == compress
+    assert 'streamed.pickle' in names
+    assert len([name for name in names if name.endswith('.npy')]) == 5
+
+    loaded, error = iofuncs.load_dictionary(path)
+    assert error is None
+    assert np.array_equal(loaded['array'], array)
+    assert np.array_equal(loaded['fortran_array'], fortran_array)
+    assert np.array_equal(loaded['strided_array'], array[::3])
+    assert loaded['text'] == data['text']
+    assert np.array_equal(loaded['list'][1], np.eye(2))
+    assert loaded['list'][2] == 'spam'
+    assert np.array_equal(loaded['list'][3], np.eye(3))
+    assert np.array_equal(loaded['dict']['a'], np.ones(3))
+    assert loaded['dict']['b'] == 2
+
+
 def test_save_load_hdf5_files():
     """Simple test to check that we can save and load HDF5 files."""
     data = {'a' : [1, 2, 3, 4], 'b' : 4.5}
@@ -349,6 +483,62 @@ def test_save_load_hdf5_files():
     assert repr(iofuncs.load_hdf5("test.h5")) == repr(expected)
 
 
+@pytest.mark.parametrize('use_dask', [True, False])
+def test_load_hdf5_lazy(tmpdir, monkeypatch, use_dask):
+    """
+    Check that HDF5 datasets loaded lazily are only read when sliced, and
+    that they're loaded as Dask arrays if Dask is available.
+    """
+    h5py = pytest.importorskip('h5py')
+    if use_dask:
+        dask_array = pytest.importorskip('dask.array')
+    else:
+        monkeypatch.setitem(sys.modules, 'dask.array', None)
+
+    array = np.arange(60.).reshape(6, 10)
+    filename = str(tmpdir.join('lazy.h5'))
+    with h5py.File(filename, 'w') as f:
+        f['array'] = array
+        f['scalar'] = 4.5
+        f['group/vector'] = np.arange(5)
+
+    data, error = iofuncs.load_hdf5(filename, lazy=True)
+    assert error is None
+
+    # Scalars are read
+    assert data['scalar'] == 4.5
+
+    lazy_array = data['array']
+    vector = data['group']['vector']
+    if use_dask:
+        assert isinstance(lazy_array, dask_array.Array)
+    else:
+        assert isinstance(lazy_array, iofuncs.LazyHDF5Dataset)
+        assert isinstance(lazy_array[1:3, 2:4], np.ndarray)
+    assert lazy_array.shape == (6, 10)
+    assert lazy_array.dtype == np.float64
+    assert np.array_equal(np.asarray(lazy_array[1:3, 2:4]), array[1:3, 2:4])
+    assert np.array_equal(np.asarray(lazy_array), array)
+    assert np.array_equal(np.asarray(vector), np.arange(5))
+
+
+def test_lazy_hdf5_dataset_pickle(tmpdir):
+    """Check that HDF5 proxies are pickled as references to their dataset."""
+    h5py = pytest.importorskip('h5py')
+    filename = str(tmpdir.join('lazy.h5'))
+    with h5py.File(filename, 'w') as f:
+        f['group/array'] = np.arange(1000.)
+
+    proxy = iofuncs.LazyHDF5Dataset.open(filename, '/group/array')
+    pickled = pickle.dumps(proxy)
+    assert len(pickled) < 1000
+
+    restored = pickle.loads(pickled)
+    assert isinstance(restored, iofuncs.LazyHDF5Dataset)
+    assert restored.name == '/group/array'
+    assert np.array_equal(restored[10:20], np.arange(10., 20.))
+
+
 def test_load_dicom_files():
     """Check that we can load DICOM files."""
     # This test pass locally but we need to set the variable below for it to
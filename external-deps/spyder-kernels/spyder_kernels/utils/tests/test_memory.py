@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for memory.py
+"""
+
+# Standard library imports
+import sys
+
+# Test library imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local imports
+from spyder_kernels.utils.memory import (
+    format_bytes, get_deep_size, MemoryAccountant)
+
+
+class Obj:
+    pass
+
+
+def test_get_deep_size():
+    """Test the deep size of different types of objects."""
+    # Arrays and their views
+    a = np.zeros(1000)
+    assert get_deep_size(a) == sys.getsizeof(a)
+    assert get_deep_size(a) >= a.nbytes
+    assert get_deep_size(a[:500]) >= 500 * 8
+    view = a[:500]
+    assert get_deep_size([a, view]) == (
+        sys.getsizeof([a, view]) + sys.getsizeof(a) + sys.getsizeof(view))
+
+    # DataFrames count the contents of their object columns
+    df = pd.DataFrame({'a': range(100), 'b': ['x' * 100] * 100})
+    assert get_deep_size(df) == df.memory_usage(deep=True).sum()
+
+    # Containers count their elements once
+    s = 'x' * 1000
+    assert get_deep_size([s, s]) == sys.getsizeof([s, s]) + sys.getsizeof(s)
+    assert get_deep_size({'a': a}) > a.nbytes
+
+    # Instances count their attributes
+    obj = Obj()
+    obj.data = a
+    assert get_deep_size(obj) > a.nbytes
+
+    # Large containers are extrapolated from their first elements
+    li = ['{:05d}'.format(i) * 10 for i in range(10000)]
+    exact = get_deep_size(li, max_items=len(li))
+    assert get_deep_size(li, max_items=100) == pytest.approx(exact, rel=0.1)
+
+    # Nesting is bounded
+    nested = [[[[s]]]]
+    assert get_deep_size(nested, max_depth=2) < sys.getsizeof(s)
+
+
+def test_get_deep_size_memmap(tmpdir):
+    """Test that the data of memory mapped arrays is not counted."""
+    filename = str(tmpdir.join('data.npy'))
+    np.save(filename, np.zeros(100000))
+    mapped = np.load(filename, mmap_mode='r')
+    assert isinstance(mapped, np.memmap)
+    assert get_deep_size(mapped) == sys.getsizeof(mapped)
+    assert get_deep_size(mapped) < mapped.nbytes
+
+    # Nor the one of their views
+    view = mapped[::2]
+    assert get_deep_size(view) == sys.getsizeof(view)
+    assert get_deep_size(np.asarray(mapped)) < mapped.nbytes
+
+
+def test_format_bytes():
+    """Test formatting sizes."""
+    assert format_bytes(10) == '10 B'
+    assert format_bytes(2048) == '2.0 KB'
+    assert format_bytes(3 * 1024 ** 3) == '3.0 GB'
+
+
+def test_memory_accountant():
+    """Test that sizes are only computed again for changed variables."""
+    accountant = MemoryAccountant()
+    a = np.zeros(1000)
+    b = [1, 2, 3]
+    accountant._variables = {'a': lambda: a, 'b': lambda: b}
+    assert accountant.compute()
+    usage = accountant.get_usage()
+    assert usage['sizes']['a'] == sys.getsizeof(a)
+    assert usage['total'] == sum(usage['sizes'].values())
+
+    # Nothing changed
+    assert not accountant.compute()
+
+    # Mutation
+    b.append(4)
+    assert accountant.compute()
+    assert accountant.get_usage()['sizes']['b'] == get_deep_size(b)
+
+    # Removal
+    accountant._variables = {'a': accountant._variables['a']}
+    assert accountant.compute()
+    assert list(accountant.get_usage()['sizes']) == ['a']
+
+
+def test_memory_accountant_thread():
+    """Test that sizes are computed in the background."""
+    results = []
+    accountant = MemoryAccountant(callback=results.append)
+    a = np.zeros(1000)
+    accountant.update({'a': a})
+    accountant._thread.join(0.5)
+    assert results[-1]['sizes'] == {'a': sys.getsizeof(a)}
+
+
+if __name__ == "__main__":
+    pytest.main()
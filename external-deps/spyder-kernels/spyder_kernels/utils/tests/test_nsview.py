@@ -26,7 +26,9 @@
 from spyder_kernels.utils.nsview import (
     sort_against, is_supported, value_to_display, get_size,
     get_supported_types, get_type_string, get_numpy_type_string,
-    is_editable_type)
+    is_editable_type, is_display_immutable, NamespaceViewTracker,
+    get_display_fingerprint, DisplayBudget, DISPLAY_MAX_CHARS,
+    apply_view_spec)
 
 
 def generate_complex_object():
@@ -444,5 +446,235 @@ def test_get_numpy_type():
     assert get_numpy_type_string(df) == 'Unknown'
 
 
+def test_is_display_immutable():
+    """Test for is_display_immutable."""
+    for value in [1, 1.5, 'a', b'a', None, np.int32(1), len, sys, int,
+                  datetime.date(2000, 1, 1)]:
+        assert is_display_immutable(value)
+
+    for value in [[1], {1: 2}, {1}, np.array([1]), DF]:
+        assert not is_display_immutable(value)
+
+
+def test_display_budget():
+    """Test that displays stop being computed when the budget is exhausted."""
+    # Character budget
+    df = pd.DataFrame(columns=['column_%d' % i for i in range(100000)])
+    display = value_to_display(df)
+    assert display.startswith('Column names: column_0, column_1')
+    assert len(display) == DISPLAY_MAX_CHARS + len(' ...')
+
+    # Time budget
+    budget = DisplayBudget(seconds=0)
+    assert value_to_display([1, 2], budget=budget) == '[...]'
+    assert value_to_display({'a': [1, 2]}, budget=budget) == '{...}'
+
+    # Large strings and bytes
+    assert value_to_display('a' * 10**7) == 'a' * DISPLAY_MAX_CHARS + ' ...'
+    value = 'é'.encode('utf8') * 10**7
+    assert value_to_display(value) == 'é' * DISPLAY_MAX_CHARS + ' ...'
+
+
+def test_display_fingerprint():
+    """Test that fingerprints change with the mutations shown in views."""
+    # Collections
+    value = [1, [2, 3], {'a': 4}]
+    fingerprint = get_display_fingerprint(value)
+    assert get_display_fingerprint(value) == fingerprint
+    value[1].append(5)
+    assert get_display_fingerprint(value) != fingerprint
+    fingerprint = get_display_fingerprint(value)
+    value[2]['a'] = 6
+    assert get_display_fingerprint(value) != fingerprint
+
+    # Elements not shown in the view are not part of the fingerprint
+    value = list(range(20))
+    fingerprint = get_display_fingerprint(value)
+    value[15] = -1
+    assert get_display_fingerprint(value) == fingerprint
+
+    # Small arrays
+    arr = np.zeros(10)
+    fingerprint = get_display_fingerprint(arr)
+    arr[5] = 1
+    assert get_display_fingerprint(arr) != fingerprint
+
+    # Large arrays
+    arr = np.zeros(10**6)
+    fingerprint = get_display_fingerprint(arr)
+    arr[-1] = 1
+    assert get_display_fingerprint(arr) != fingerprint
+    fingerprint = get_display_fingerprint(arr)
+    arr[500000] = 1
+    assert get_display_fingerprint(arr) == fingerprint
+    fingerprint = get_display_fingerprint(arr[::2])
+    arr[2] = 1
+    assert get_display_fingerprint(arr[::2]) != fingerprint
+
+    # The elements shown at the edges of each axis of large arrays
+    arr = np.zeros((1000, 1000))
+    fingerprint = get_display_fingerprint(arr)
+    display = value_to_display(arr)
+    arr[0, -1] = 7
+    assert value_to_display(arr) != display
+    assert get_display_fingerprint(arr) != fingerprint
+
+    # Large arrays are not memoized when their min and max are shown
+    assert get_display_fingerprint(arr, minmax=True) is None
+    assert get_display_fingerprint(np.zeros(10), minmax=True) is not None
+
+    # DataFrames
+    df = pd.DataFrame({'a': [1, 2]})
+    fingerprint = get_display_fingerprint(df)
+    df['b'] = 3
+    assert get_display_fingerprint(df) != fingerprint
+
+    # Immutable values
+    assert get_display_fingerprint(1) == ()
+
+
+def test_namespace_view_tracker():
+    """Test that the tracker only computes the entries that changed."""
+    settings = {
+        'check_all': False,
+        'exclude_private': True,
+        'exclude_uppercase': False,
+        'exclude_capitalized': False,
+        'exclude_unsupported': False,
+        'exclude_callables_and_modules': False,
+        'excluded_names': [],
+        'minmax': False,
+        'filter_on': True
+    }
+    computed = []
+
+    def get_properties(value):
+        computed.append(value)
+        return {'len': get_size(value)}
+
+    tracker = NamespaceViewTracker()
+    data = {'a': 1, 'b': [1, 2], 'c': get_size}
+    delta = tracker.get_delta(data, settings, get_properties)
+    assert delta['base_version'] is None
+    assert set(delta['view']) == {'a', 'b', 'c'}
+    assert len(computed) == 3
+
+    # Nothing is computed again when values didn't change
+    computed.clear()
+    assert tracker.get_delta(data, settings, get_properties) is None
+    assert computed == []
+    assert tracker.hits == 3
+
+    # Except for mutable values in full views
+    delta = tracker.get_delta(data, settings, get_properties, full=True)
+    assert set(delta['view']) == {'a', 'b', 'c'}
+    assert computed == [[1, 2]]
+
+    # Mutations are detected
+    data['b'].append(3)
+    data['a'] = 2
+    del data['c']
+    delta = tracker.get_delta(data, settings, get_properties)
+    assert delta['base_version'] == delta['version'] - 1
+    assert delta['view']['a']['view'] == '2'
+    assert delta['view']['b']['view'] == '[1, 2, 3]'
+    assert delta['removed'] == ['c']
+
+    # Resetting the tracker gives a full delta
+    tracker.reset()
+    delta = tracker.get_delta(data, settings, get_properties)
+    assert delta['base_version'] is None
+    assert set(delta['view']) == {'a', 'b'}
+
+
+def test_namespace_view_tracker_minmax():
+    """Test that min and max of large arrays are refreshed after edits."""
+    settings = {
+        'check_all': False,
+        'exclude_private': True,
+        'exclude_uppercase': False,
+        'exclude_capitalized': False,
+        'exclude_unsupported': False,
+        'exclude_callables_and_modules': False,
+        'excluded_names': [],
+        'minmax': True,
+        'filter_on': True
+    }
+    tracker = NamespaceViewTracker()
+    data = {'a': np.zeros(10**6)}
+    delta = tracker.get_delta(data, settings, lambda value: {})
+    assert delta['view']['a']['view'] == 'Min: 0.0\nMax: 0.0'
+
+    data['a'][500000] = 1e9
+    delta = tracker.get_delta(data, settings, lambda value: {})
+    assert delta['view']['a']['view'] == 'Min: 0.0\nMax: 1000000000.0'
+
+
+def test_apply_view_spec():
+    """Test filtering, sorting and paging namespaces."""
+    data = {'x{}'.format(i): i for i in range(20)}
+    data.update({'y': 'text', 'xs': [1]})
+
+    # No spec
+    assert apply_view_spec(data, {}) == (data, 22)
+
+    # Names are sorted naturally
+    page, total = apply_view_spec(data, {'offset': 1, 'limit': 3})
+    assert list(page) == ['x1', 'x2', 'x3']
+    assert total == 22
+
+    # The filter matches names and types
+    page, total = apply_view_spec(data, {'filter': 'x1', 'limit': 5})
+    assert list(page) == ['x1', 'x10', 'x11', 'x12', 'x13']
+    assert total == 11
+    page, total = apply_view_spec(data, {'filter': 'str'})
+    assert list(page) == ['y']
+
+    # Sort by type or by other values
+    page, __ = apply_view_spec(data, {'sort': 'type', 'limit': 2})
+    assert list(page) == ['x0', 'x1']
+    page, __ = apply_view_spec(
+        data, {'sort': 'value', 'ascending': False, 'limit': 2},
+        sort_values={'y': 10, 'x5': 20})
+    assert list(page) == ['x5', 'y']
+
+
+def test_namespace_view_tracker_spec():
+    """Test that the tracker only sends the page selected by a view spec."""
+    settings = {
+        'check_all': False,
+        'exclude_private': True,
+        'exclude_uppercase': False,
+        'exclude_capitalized': False,
+        'exclude_unsupported': False,
+        'exclude_callables_and_modules': False,
+        'excluded_names': [],
+        'minmax': False,
+        'filter_on': True
+    }
+    computed = []
+
+    def get_properties(value):
+        computed.append(value)
+        return {}
+
+    tracker = NamespaceViewTracker()
+    data = {'v{}'.format(i): i for i in range(1000)}
+    spec = {'limit': 10}
+    delta = tracker.get_delta(data, settings, get_properties, spec=spec)
+    assert len(delta['view']) == 10
+    assert delta['total'] == 1000
+    assert len(computed) == 10
+
+    # Adding variables outside of the page changes the total
+    data['v1000'] = 1000
+    delta = tracker.get_delta(data, settings, get_properties, spec=spec)
+    assert delta['view'] == {}
+    assert delta['total'] == 1001
+
+    # All variables are available to the memory accountant
+    assert len(tracker.get_values()) == 1001
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for preload.py
+"""
+
+# Standard library imports
+import sys
+
+# Test library imports
+import pytest
+
+# Local imports
+from spyder_kernels.utils.preload import ModulePreloader, parse_module_list
+
+
+def test_parse_module_list():
+    """Test parsing comma separated lists of modules."""
+    assert parse_module_list(None) == []
+    assert parse_module_list('') == []
+    assert parse_module_list(' numpy, pandas ,,') == ['numpy', 'pandas']
+
+
+def test_module_preloader(tmp_path, monkeypatch):
+    """Test that modules are imported in the background when idle."""
+    (tmp_path / 'spyder_slow_module.py').write_text(
+        'import time\ntime.sleep(0.05)\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    results = []
+    preloader = ModulePreloader(callback=results.append)
+    preloader.set_busy(True)
+    preloader.start(['sys', 'spyder_slow_module', 'spyder_missing_module'])
+
+    # Nothing is imported while busy
+    preloader._thread.join(0.2)
+    assert 'spyder_slow_module' not in sys.modules
+    assert not preloader.get_timings()['finished']
+
+    preloader.set_busy(False)
+    preloader._thread.join(5)
+    assert 'spyder_slow_module' in sys.modules
+
+    timings = results[-1]
+    assert timings['finished']
+    assert timings['modules']['sys'] == 0
+    assert timings['modules']['spyder_slow_module'] >= 0.05
+    assert timings['modules']['spyder_missing_module'] is None
+
+    sys.modules.pop('spyder_slow_module')
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for sampling.py
+"""
+
+# Standard library imports
+import pstats
+import time
+
+# Test library imports
+import pytest
+
+# Local imports
+from spyder_kernels.utils.sampling import SamplingProfiler
+
+
+def outer():
+    inner()
+    time.sleep(0.1)
+
+
+def inner():
+    time.sleep(0.1)
+
+
+def test_sampling_profiler():
+    """Test the aggregation of samples per function."""
+    profiler = SamplingProfiler(interval=0.001)
+    with profiler:
+        outer()
+    stats = profiler.create_stats()
+    by_name = {func[2]: value for func, value in stats.items()}
+
+    # Inclusive and exclusive times. Time spent in builtins is counted in
+    # their caller.
+    cc, nc, tt, ct, callers = by_name['outer']
+    assert ct == pytest.approx(0.2, abs=0.05)
+    assert tt == pytest.approx(0.1, abs=0.05)
+    cc, nc, tt, ct, callers = by_name['inner']
+    assert tt == ct == pytest.approx(0.1, abs=0.05)
+    assert [func[2] for func in callers] == ['outer']
+
+    # The profiler itself is not sampled
+    assert 'stop' not in by_name
+    assert 'test_sampling_profiler' not in by_name
+
+    # The stats can be loaded by pstats
+    assert pstats.Stats(profiler).total_tt == pytest.approx(0.2, abs=0.05)
+
+
+def test_sampling_profiler_lines():
+    """Test the aggregation of samples per line and the folded stacks."""
+    profiler = SamplingProfiler(interval=0.001)
+    with profiler:
+        outer()
+
+    line_stats = profiler.get_line_stats()
+    first_line = outer.__code__.co_firstlineno
+    exclusive, inclusive = line_stats[(__file__, first_line + 1, 'outer')]
+    assert exclusive == 0
+    assert inclusive == pytest.approx(0.1, abs=0.05)
+    exclusive, inclusive = line_stats[(__file__, first_line + 2, 'outer')]
+    assert exclusive == inclusive == pytest.approx(0.1, abs=0.05)
+
+    folded = profiler.get_folded_stacks().splitlines()
+    stacks = [line.rsplit(' ', 1)[0].split(';') for line in folded]
+    assert ['outer ({}:{})'.format(__file__, first_line + 1),
+            'inner ({}:{})'.format(
+                __file__, inner.__code__.co_firstlineno + 1)] in stacks
+    total = sum(int(line.rsplit(' ', 1)[1]) for line in folded)
+    assert total == pytest.approx(2e5, abs=5e4)
+
+
+def test_sampling_profiler_recursion():
+    """Test that recursive calls are only counted once per sample."""
+    def recurse(n):
+        if n:
+            return recurse(n - 1)
+        time.sleep(0.1)
+
+    profiler = SamplingProfiler(interval=0.001)
+    with profiler:
+        recurse(5)
+    stats = profiler.create_stats()
+    cc, nc, tt, ct, callers = stats[
+        (__file__, recurse.__code__.co_firstlineno, 'recurse')]
+    assert ct == pytest.approx(0.1, abs=0.05)
+    assert tt == ct
+    assert callers[next(iter(callers))][3] <= ct
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -141,6 +141,10 @@
               'ask_before_closing': False,
               'show_reset_namespace_warning': True,
               'buffer_size': 500,
+              'max_output_rate': 0,
+              'kernel_pool_size': 1,
+              'preload_modules': True,
+              'preload_modules/list': '',
               'pylab': True,
               'pylab/autoload': False,
               'pylab/backend': 0,
@@ -180,7 +184,8 @@
               'minmax': False,
               'show_callable_attributes': True,
               'show_special_attributes': False,
-              'filter_on': True
+              'filter_on': True,
+              'lazy_load': False
              }),
             ('debugger',
              {
@@ -190,6 +195,7 @@
               'pdb_execute_events': True,
               'pdb_use_exclamation_mark': True,
               'pdb_stop_first_line': True,
+              'pdb_use_monitoring': False,
               'editor_debugger_panel': True,
               'breakpoints_table_visible': False,
              }),
@@ -342,6 +348,9 @@
             ('profiler',
              {
               'enable': True,
+              'sampling': False,
+              'sampling_interval': 5,
+              'show_flame_graph': False,
               }),
             ('pylint',
              {
@@ -493,6 +502,7 @@
               'pylint/run file in pylint': "F8",
               # -- Profiler --
               'profiler/run file in profiler': "F10",
+              'profiler/run cell in profiler': '',
               # -- Switcher --
               'switcher/file switcher': 'Ctrl+P',
               'switcher/symbol finder': 'Ctrl+Alt+P',
@@ -903,6 +903,15 @@ def is_defined(self, objtxt, force_import=False):
         """Return True if object is defined"""
         raise NotImplementedError
 
+    def get_help_data(self, objtxt):
+        """
+        Return if object is defined, its documentation dictionary and its
+        source.
+        """
+        if not self.is_defined(objtxt):
+            return False, None, None
+        return True, self.get_doc(objtxt), self.get_source(objtxt)
+
     def show_completion_widget(self, textlist):
         """Show completion widget"""
         self.completion_widget.show_list(
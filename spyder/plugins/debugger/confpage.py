@@ -78,6 +78,16 @@ def setup_page(self):
                   "separating Pdb commands from Python code."))
         debug_layout.addWidget(exclamation_mark_box)
 
+        monitoring_box = newcb(
+            _("Use low-overhead tracing (Python 3.12+)"),
+            'pdb_use_monitoring',
+            tip=_("This option makes the debugger use <tt>sys.monitoring</tt> "
+                  "instead of <tt>sys.settrace</tt>, so that code without "
+                  "breakpoints runs almost at full speed while debugging. "
+                  "It has no effect in environments with older Python "
+                  "versions."))
+        debug_layout.addWidget(monitoring_box)
+
         debug_group.setLayout(debug_layout)
 
         filter_group = QGroupBox(_("Execution Inspector"))
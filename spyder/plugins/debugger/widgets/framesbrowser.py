@@ -270,6 +270,7 @@ def on_config_kernel(self):
             'pdb_use_exclamation_mark': self.get_conf(
                 'pdb_use_exclamation_mark'),
             'pdb_stop_first_line': self.get_conf('pdb_stop_first_line'),
+            'pdb_use_monitoring': self.get_conf('pdb_use_monitoring'),
             'pdb_publish_stack': True,
         })
 
@@ -312,6 +313,12 @@ def change_pdb_stop_first_line(self, value):
             'pdb_stop_first_line': value
         })
 
+    @on_conf_change(option='pdb_use_monitoring')
+    def change_pdb_use_monitoring(self, value):
+        self.set_pdb_configuration({
+            'pdb_use_monitoring': value
+        })
+
     def set_breakpoints(self):
         """Set current breakpoints."""
         self.set_pdb_configuration({
@@ -661,8 +661,9 @@ def capture_frames(self):
         if widget.shellwidget.is_waiting_pdb_input():
             # Disabled while waiting pdb input as the pdb stack is shown
             return
-        widget.shellwidget.call_kernel(
-            interrupt=True, callback=widget.show_captured_frames
+        widget.shellwidget.call_kernel_async(
+            interrupt=True, callback=widget.show_captured_frames,
+            supersede='capture_frames'
             ).get_current_frames(
                 ignore_internal_threads=self.get_conf("exclude_internal")
             )
@@ -1049,20 +1049,17 @@ def show_help(self, obj_text, ignore_unknown=False):
 
         obj_text = to_text_string(obj_text)
 
-        if not shell.is_defined(obj_text):
+        is_defined, doc, source_text = shell.get_help_data(obj_text)
+        if not is_defined:
             if (self.get_conf('automatic_import')
                     and self.internal_shell.is_defined(obj_text,
                                                        force_import=True)):
-                shell = self.internal_shell
+                __, doc, source_text = self.internal_shell.get_help_data(
+                    obj_text)
             else:
-                shell = None
                 doc = None
                 source_text = None
 
-        if shell is not None:
-            doc = shell.get_doc(obj_text)
-            source_text = shell.get_source(obj_text)
-
         is_code = False
 
         if self.get_conf('rich_mode'):
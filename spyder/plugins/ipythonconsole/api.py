@@ -8,7 +8,7 @@
 
 # Standard library imports
 from __future__ import annotations
-from typing import TypedDict
+from typing import List, TypedDict
 
 # Third-party imports
 from typing_extensions import NotRequired  # Available from Python 3.11
@@ -39,5 +39,8 @@ class IPythonConsolePyConfiguration(TypedDict):
     console_namespace: bool
 
     # If not None, then the console will use an alternative run method
-    # (e.g. `runfile`, `debugfile` or `debugcell`).
+    # (e.g. `runfile`, `debugfile`, `debugcell` or `profilecell`).
     run_method: NotRequired[str]
+
+    # Extra arguments to pass to the run method of cells.
+    run_method_args: NotRequired[List[str]]
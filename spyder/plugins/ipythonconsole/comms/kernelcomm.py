@@ -7,6 +7,7 @@
 """
 In addition to the remote_call mechanism implemented in CommBase:
  - Send a message to a debugging kernel
+ - Multiplex non-blocking calls with `call_multiplexer`
 """
 from contextlib import contextmanager
 import logging
@@ -14,7 +15,9 @@
 
 from qtpy.QtCore import QEventLoop, QObject, QTimer, Signal
 
-from spyder_kernels.comms.commbase import CommBase
+from spyder_kernels.comms.commbase import CommBase, TIMEOUT
+from spyder_kernels.comms.compression import get_compressors
+from spyder_kernels.comms.multiplexer import CallMultiplexer
 
 from spyder.config.base import (
     get_debug_level, running_under_pytest)
@@ -33,9 +36,26 @@ class KernelComm(CommBase, QObject):
     sig_exception_occurred = Signal(dict)
     sig_comm_ready = Signal()
 
+    sig_stream_progress = Signal(str, str, object, object)
+    """
+    This signal is emitted when a frame of a streamed reply is received.
+
+    Parameters
+    ----------
+    call_id: str
+        Id of the call that is being replied to.
+    call_name: str
+        Name of the call that is being replied to.
+    received: int
+        Number of bytes received so far.
+    total: int
+        Total number of bytes of the reply.
+    """
+
     def __init__(self):
         super(KernelComm, self).__init__()
         self.kernel_client = None
+        self.call_multiplexer = CallMultiplexer(self)
 
         # Register handlers
         self.register_call_handler('_async_error', self._async_error)
@@ -100,14 +120,23 @@ def close(self, comm_id=None):
                 'comm_close', {}, None, None, None)
             self._comms[comm_id]['status'] = 'closing'
 
-    def open_comm(self, kernel_client):
-        """Open comm through the kernel client."""
+    def open_comm(self, kernel_client, compress=False):
+        """
+        Open comm through the kernel client.
+
+        If `compress` is True, the kernel is asked to compress large
+        messages, which is worth it when it is reached through a slow
+        connection.
+        """
         self.kernel_client = kernel_client
+        data = {'pickle_highest_protocol': pickle.HIGHEST_PROTOCOL}
+        if compress:
+            data['compressors'] = get_compressors()
         try:
             self._register_comm(
                 # Create new comm and send the highest protocol
-                kernel_client.comm_manager.new_comm(self._comm_name, data={
-                    'pickle_highest_protocol': pickle.HIGHEST_PROTOCOL}))
+                kernel_client.comm_manager.new_comm(
+                    self._comm_name, data=data))
         except AttributeError:
             logger.info(
                 "Unable to open comm due to unexistent comm manager: " +
@@ -115,11 +144,18 @@ def open_comm(self, kernel_client):
             )
 
     def remote_call(self, interrupt=False, blocking=False, callback=None,
-                    comm_id=None, timeout=None, display_error=False):
+                    comm_id=None, timeout=None, display_error=False,
+                    stream=False, future=False):
         """Get a handler for remote calls."""
         return super(KernelComm, self).remote_call(
             interrupt=interrupt, blocking=blocking, callback=callback,
-            comm_id=comm_id, timeout=timeout, display_error=display_error)
+            comm_id=comm_id, timeout=timeout, display_error=display_error,
+            stream=stream, future=future)
+
+    def on_stream_progress(self, call_dict, received, total):
+        """A frame of a streamed reply was received."""
+        self.sig_stream_progress.emit(
+            call_dict['call_id'], call_dict['call_name'], received, total)
 
     def on_incoming_call(self, call_dict):
         """A call was received"""
@@ -139,7 +175,10 @@ def _send_call(self, call_dict, call_data, comm_id):
         settings = call_dict['settings']
         blocking = 'blocking' in settings and settings['blocking']
         interrupt = 'interrupt' in settings and settings['interrupt']
-        queue_message = not interrupt and not blocking
+        future = 'future' in settings and settings['future']
+        # Futures are waited for like blocking calls, so they can't wait
+        # for the kernel to be idle either
+        queue_message = not (interrupt or blocking or future)
 
         if not self.kernel_client.is_alive():
             if blocking:
@@ -150,6 +189,7 @@ def _send_call(self, call_dict, call_data, comm_id):
                     "Dropping message because kernel is dead: %s",
                     str(call_dict)
                 )
+                self._drop_call(call_dict, RuntimeError("Kernel is dead"))
                 return
 
         with self.comm_channel_manager(
@@ -188,6 +228,21 @@ def got_reply():
             self._reply_waitlist)
         self._wait(got_reply, self._sig_got_reply, timeout_msg, timeout)
 
+    def _wait_future(self, future, timeout):
+        """Wait for the reply of a non-blocking call."""
+        if timeout is None:
+            timeout = TIMEOUT
+        timeout_msg = "Timeout while waiting for {}".format(future.call_name)
+        self._wait(future.done, self._sig_got_reply, timeout_msg, timeout)
+
+    def _drop_call(self, call_dict, error):
+        """Fail the future of a call that couldn't be sent."""
+        call_id = call_dict['call_id']
+        __, __, future = self._reply_waitlist.get(call_id, (None, None, None))
+        self._unregister_call(call_id)
+        if future is not None:
+            future.set_exception(error)
+
     def _wait(self, condition, signal, timeout_msg, timeout):
         """
         Wait until condition() is True by running an event loop.
@@ -13,11 +13,13 @@
 import os
 
 # Test imports
+import numpy as np
 import pytest
 from tornado import ioloop
 
 
 # Local imports
+from spyder_kernels.comms.commbase import CommCancelled
 from spyder_kernels.utils.test_utils import get_kernel
 from spyder_kernels.comms.frontendcomm import FrontendComm
 from spyder.plugins.ipythonconsole.comms.kernelcomm import KernelComm
@@ -112,6 +114,7 @@ class DummyKernelClient():
         shell_channel = 0
         control_channel = 0
 
+        @staticmethod
         def is_alive():
             return True
 
@@ -179,5 +182,91 @@ def handler(a, b):
     assert res == 'ab'
 
 
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_out_of_band_buffers(comms):
+    """Test that large arrays are sent out-of-band with pickle protocol 5."""
+    kernel_comm, frontend_comm = comms
+    array = np.arange(100000)
+    sent_buffers = []
+
+    def handler():
+        return array
+
+    kernel_comm.register_call_handler('test_request', handler)
+
+    # Record the buffers sent by the kernel comm
+    comm = kernel_comm._comms[1]['comm']
+    send = comm.send
+
+    def recording_send(msg_dict, buffers=None):
+        sent_buffers.append(buffers)
+        send(msg_dict, buffers=buffers)
+
+    comm.send = recording_send
+
+    res = frontend_comm.remote_call(blocking=True).test_request()
+
+    assert np.array_equal(res, array)
+    assert res.flags.writeable
+    if kernel_comm._comms[1]['pickle_protocol'] >= 5:
+        assert len(sent_buffers[-1]) == 2
+    else:
+        assert len(sent_buffers[-1]) == 1
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_streamed_reply(comms):
+    """Test that large replies are streamed and can be cancelled."""
+    kernel_comm, frontend_comm = comms
+    array = np.arange(1000000)
+    progress = []
+
+    def handler():
+        return array
+
+    frontend_comm.register_call_handler('test_request', handler)
+    kernel_comm.sig_stream_progress.connect(
+        lambda call_id, call_name, received, total: progress.append(
+            (call_name, received, total)))
+
+    res = kernel_comm.remote_call(
+        blocking=True, stream=True).test_request()
+
+    assert np.array_equal(res, array)
+    assert len(progress) > 1
+    assert progress[-1][0] == 'test_request'
+    assert progress[-1][1] == progress[-1][2]
+
+    # Cancel the transfer after the first frame
+    kernel_comm.sig_stream_progress.connect(
+        lambda call_id, call_name, received, total:
+            kernel_comm.cancel_call(call_id))
+
+    with pytest.raises(CommCancelled):
+        kernel_comm.remote_call(blocking=True, stream=True).test_request()
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_future_request(comms):
+    """Test that non-blocking calls get futures resolved by the replies."""
+    kernel_comm, frontend_comm = comms
+    results = []
+
+    def handler(a, b):
+        return a + b
+
+    frontend_comm.register_call_handler('test_request', handler)
+
+    future = kernel_comm.remote_call(future=True).test_request('a', b='b')
+    assert future.result() == 'ab'
+
+    future = kernel_comm.call_multiplexer.remote_call(
+        callback=results.append).test_request('c', b='d')
+    assert future.done()
+    assert results == ['cd']
+    assert kernel_comm.get_latency_stats()['calls']['test_request'][
+        'count'] == 2
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -78,8 +78,17 @@ def setup_page(self):
                 tip=_("Set the maximum number of lines of text shown in the\n"
                       "console before truncation. Specifying -1 disables it\n"
                       "(not recommended!)"))
+        output_rate_spin = self.create_spinbox(
+                _("Output rate:  "), _(" lines per second"),
+                'max_output_rate', min_=0, max_=100000, step=500,
+                tip=_("Set the maximum number of lines per second shown\n"
+                      "while code runs. Lines above it are not shown and\n"
+                      "are replaced by a '[... N lines suppressed ...]'\n"
+                      "message. Specifying 0 disables it and shows all\n"
+                      "output (default)"))
         source_code_layout = QVBoxLayout()
         source_code_layout.addWidget(buffer_spin)
+        source_code_layout.addWidget(output_rate_spin)
         source_code_group.setLayout(source_code_layout)
 
         # --- Graphics ---
@@ -223,6 +232,29 @@ def setup_page(self):
         run_file_layout.addWidget(run_file_browser)
         run_file_group.setLayout(run_file_layout)
 
+        # Preload modules Group
+        preload_group = QGroupBox(_("Preload modules"))
+        preload_label = QLabel(_("Modules can be imported in the background "
+                                 "when a console is started, so that the "
+                                 "first time you import them is faster. "
+                                 "Please introduce them separated by commas. "
+                                 "If no module is given, the ones imported "
+                                 "most often in your history are used."))
+        preload_label.setWordWrap(True)
+        preload_box = newcb(_("Preload modules in new consoles"),
+                            'preload_modules')
+        preload_edit = self.create_lineedit(
+            _("Modules:"), 'preload_modules/list', '',
+            alignment=Qt.Horizontal)
+        preload_edit.setEnabled(self.get_option('preload_modules'))
+        preload_box.checkbox.toggled.connect(preload_edit.setEnabled)
+
+        preload_layout = QVBoxLayout()
+        preload_layout.addWidget(preload_label)
+        preload_layout.addWidget(preload_box)
+        preload_layout.addWidget(preload_edit)
+        preload_group.setLayout(preload_layout)
+
         # ---- Advanced settings ----
         # Enable Jedi completion
         jedi_group = QGroupBox(_("Jedi completion"))
@@ -355,6 +387,22 @@ def setup_page(self):
         windows_layout.addWidget(hide_cmd_windows)
         windows_group.setLayout(windows_layout)
 
+        # Standby kernels
+        pool_group = QGroupBox(_("Standby kernels"))
+        pool_label = QLabel(_("Kernels started in the background so that new "
+                              "consoles and restarts don't have to wait for "
+                              "one to start. Each of them uses memory."))
+        pool_label.setWordWrap(True)
+        pool_spin = self.create_spinbox(
+                _("Standby kernels:  "), "",
+                'kernel_pool_size', min_=0, max_=8, step=1,
+                tip=_("Set the number of kernels kept ready for new\n"
+                      "consoles. Specifying 0 disables it."))
+        pool_layout = QVBoxLayout()
+        pool_layout.addWidget(pool_label)
+        pool_layout.addWidget(pool_spin)
+        pool_group.setLayout(pool_layout)
+
         # --- Tabs organization ---
         self.tabs = QTabWidget()
         self.tabs.addTab(self.create_tab(interface_group, comp_group,
@@ -362,10 +410,10 @@ def setup_page(self):
         self.tabs.addTab(self.create_tab(
             pylab_group, backend_group, inline_group), _("Graphics"))
         self.tabs.addTab(self.create_tab(
-            run_lines_group, run_file_group), _("Startup"))
+            run_lines_group, run_file_group, preload_group), _("Startup"))
         self.tabs.addTab(self.create_tab(
             jedi_group, greedy_group, autocall_group,
-            sympy_group, prompts_group,
+            sympy_group, prompts_group, pool_group,
             windows_group), _("Advanced settings"))
 
         vlayout = QVBoxLayout()
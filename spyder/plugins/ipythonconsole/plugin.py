@@ -725,7 +725,8 @@ def exec_cell(
         params: IPythonConsolePyConfiguration = exec_params['executor_params']
         run_method = params.get('run_method', 'runcell')
         self.run_cell(cell_text, cell_name, filename,
-                      method=run_method)
+                      method=run_method,
+                      method_args=params.get('run_method_args'))
 
     # ---- For execution and debugging
     def run_script(self, filename, wdir, args='',
@@ -774,7 +775,8 @@ def run_script(self, filename, wdir, args='',
             method
         )
 
-    def run_cell(self, code, cell_name, filename, method='runcell'):
+    def run_cell(self, code, cell_name, filename, method='runcell',
+                 method_args=None):
         """
         Run cell in current or dedicated client.
 
@@ -789,13 +791,16 @@ def run_cell(self, code, cell_name, filename, method='runcell'):
         method : str, optional
             Name handler of the kernel function to be used to execute the cell.
             The default is 'runcell'.
+        method_args : list of str, optional
+            Extra arguments to pass to the method. The default is None.
 
         Returns
         -------
         None.
         """
         self.sig_unmaximize_plugin_requested.emit()
-        self.get_widget().run_cell(code, cell_name, filename, method=method)
+        self.get_widget().run_cell(code, cell_name, filename, method=method,
+                                   method_args=method_args)
 
     def execute_code(self, lines, current_client=True, clear_variables=False):
         """
@@ -1032,7 +1032,7 @@ def test_kernel_crash(ipyconsole, qtbot):
 
         # Wait until the error has been received by the cached kernel_handler
         qtbot.waitUntil(lambda: bool(
-            ipyconsole.get_widget()._cached_kernel_properties[-1]._init_stderr
+            ipyconsole.get_widget().get_next_cached_kernel()._init_stderr
         ))
         # Create a new client
         ipyconsole.create_new_client()
@@ -2017,7 +2017,7 @@ def test_old_kernel_version(ipyconsole, qtbot):
     # Set a false _spyder_kernels_version in the cached kernel
     w = ipyconsole.get_widget()
 
-    kernel_handler = w._cached_kernel_properties[-1]
+    kernel_handler = w.get_next_cached_kernel()
 
     # Wait until it is launched
     qtbot.waitUntil(
@@ -2041,6 +2041,38 @@ def test_old_kernel_version(ipyconsole, qtbot):
     assert "pip install spyder" in control.toPlainText()
 
 
+def test_kernel_pool(ipyconsole, qtbot):
+    """
+    Check that new consoles use standby kernels, that they are refilled and
+    that they are replaced when the PYTHONPATH changes.
+    """
+    w = ipyconsole.get_widget()
+    w.set_kernel_pool_size(2)
+    pool = w._kernel_pools[-1]
+    assert len(pool.kernel_handlers) == 2
+
+    # New consoles use the standby kernels
+    kernel_handler = w.get_next_cached_kernel()
+    w.create_new_client()
+    client = w.get_current_client()
+    assert client.kernel_handler is kernel_handler
+    assert len(pool.kernel_handlers) == 2
+    qtbot.waitUntil(
+        lambda: client.shellwidget._prompt_html is not None,
+        timeout=SHELL_TIMEOUT)
+
+    # Standby kernels are replaced when the PYTHONPATH changes
+    kernel_handlers = list(pool.kernel_handlers)
+    w.update_path({}, {})
+    assert len(pool.kernel_handlers) == 2
+    assert not set(kernel_handlers) & set(pool.kernel_handlers)
+
+    # And closed when disabled
+    w.set_kernel_pool_size(0)
+    assert w.get_next_cached_kernel() is None
+    w.set_kernel_pool_size(1)
+
+
 def test_run_script(ipyconsole, qtbot, tmp_path):
     """
     Test running multiple scripts at the same time.
@@ -282,7 +282,8 @@ def check_spyder_kernel_info(self, spyder_kernel_info):
         self.known_spyder_kernel = True
 
         # Open comm and wait for comm ready reply
-        self.kernel_comm.open_comm(self.kernel_client)
+        self.kernel_comm.open_comm(
+            self.kernel_client, compress=self.hostname is not None)
 
     def handle_comm_ready(self):
         """The kernel comm is ready"""
@@ -614,4 +615,5 @@ def reopen_comm(self):
         """Reopen comm (following a crash)"""
         self.kernel_comm.remove()
         self.connection_state = KernelConnectionState.Connecting
-        self.kernel_comm.open_comm(self.kernel_client)
+        self.kernel_comm.open_comm(
+            self.kernel_client, compress=self.hostname is not None)
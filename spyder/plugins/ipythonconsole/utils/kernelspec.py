@@ -9,9 +9,12 @@
 """
 
 # Standard library imports
+from collections import Counter
+import functools
 import logging
 import os
 import os.path as osp
+import re
 import sys
 
 # Third party imports
@@ -20,8 +23,8 @@
 # Local imports
 from spyder.api.config.mixins import SpyderConfigurationAccessor
 from spyder.api.translations import _
-from spyder.config.base import (get_safe_mode, is_conda_based_app,
-                                running_under_pytest)
+from spyder.config.base import (get_conf_path, get_safe_mode,
+                                is_conda_based_app, running_under_pytest)
 from spyder.plugins.ipythonconsole import (
     SPYDER_KERNELS_CONDA, SPYDER_KERNELS_PIP, SPYDER_KERNELS_VERSION,
     SpyderKernelError)
@@ -34,6 +37,14 @@
 # Constants
 HERE = os.path.abspath(os.path.dirname(__file__))
 logger = logging.getLogger(__name__)
+
+# Max number of modules preloaded when they are detected from the history
+MAX_PRELOAD_MODULES = 5
+
+# Number of lines read at the end of the history to detect them
+PRELOAD_HISTORY_LINES = 2000
+
+IMPORT_REGEX = re.compile(r'^\s*(?:import|from)\s+([A-Za-z_]\w*)')
 ERROR_SPYDER_KERNEL_INSTALLED = _(
     "The Python environment or installation whose interpreter is located at"
     "<pre>"
@@ -53,6 +64,34 @@
     "</pre>")
 
 
+@functools.lru_cache(maxsize=1)
+def get_preload_modules_from_history(filename):
+    """
+    Get the modules imported most often at the end of the console history.
+
+    Only third-party modules imported at least twice are returned, because
+    the standard library ones are fast to import. The result is cached for
+    the session so that the environment of kernels doesn't change.
+    """
+    try:
+        with open(filename, encoding='utf-8', errors='replace') as f:
+            lines = f.readlines()[-PRELOAD_HISTORY_LINES:]
+    except OSError:
+        return []
+
+    stdlib = getattr(sys, 'stdlib_module_names', sys.builtin_module_names)
+    counts = Counter()
+    for line in lines:
+        match = IMPORT_REGEX.match(line)
+        if match and match.group(1) not in stdlib:
+            counts[match.group(1)] += 1
+
+    return [
+        name for name, count in counts.most_common(MAX_PRELOAD_MODULES)
+        if count > 1
+    ]
+
+
 def is_different_interpreter(pyexec):
     """Check that pyexec is a different interpreter from sys.executable."""
     # Paths may be symlinks
@@ -174,6 +213,18 @@ def env(self):
         umr_namelist = self.get_conf(
             'umr/namelist', section='main_interpreter')
 
+        # List of modules to import in the background once kernels start
+        preload_modules = []
+        if self.get_conf('preload_modules'):
+            preload_modules = [
+                name.strip() for name in
+                self.get_conf('preload_modules/list').split(',')
+                if name.strip()
+            ]
+            if not preload_modules:
+                preload_modules = get_preload_modules_from_history(
+                    get_conf_path('history.py'))
+
         # Environment variables that we need to pass to the kernel
         env_vars.update({
             'SPY_EXTERNAL_INTERPRETER': (not default_interpreter
@@ -195,11 +246,13 @@ def env(self):
             'SPY_USE_FILE_O': self.get_conf('startup/use_run_file'),
             'SPY_RUN_FILE_O': self.get_conf('startup/run_file'),
             'SPY_AUTOCALL_O': self.get_conf('autocall'),
+            'SPY_MAX_OUTPUT_RATE_O': self.get_conf('max_output_rate'),
             'SPY_GREEDY_O': self.get_conf('greedy_completer'),
             'SPY_JEDI_O': self.get_conf('jedi_completer'),
             'SPY_SYMPY_O': self.get_conf('symbolic_math'),
             'SPY_TESTING': running_under_pytest() or get_safe_mode(),
             'SPY_HIDE_CMD': self.get_conf('hide_cmd_windows'),
+            'SPY_PRELOAD_MODULES_O': ','.join(preload_modules),
             'SPY_PYTHONPATH': pypath
         })
 
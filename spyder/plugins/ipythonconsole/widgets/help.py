@@ -151,6 +151,29 @@ def get_source(self, objtxt):
         except (TimeoutError, UnpicklingError, RuntimeError, CommError):
             return None
 
+    def get_help_data(self, objtxt):
+        """
+        Return if object is defined, its documentation dictionary and its
+        source.
+
+        The three calls are sent together, so the kernel is only waited for
+        once.
+        """
+        if not self.spyder_kernel_ready:
+            return False, None, None
+        futures = [
+            self.call_kernel_async().is_defined(objtxt),
+            self.call_kernel_async().get_doc(objtxt),
+            self.call_kernel_async().get_source(objtxt),
+        ]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except (TimeoutError, UnpicklingError, RuntimeError, CommError):
+                results.append(None)
+        return tuple(results)
+
     #---- Private methods (overrode by us) ---------------------------------
     def _handle_inspect_reply(self, rep):
         """
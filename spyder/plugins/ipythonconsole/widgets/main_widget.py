@@ -285,6 +285,7 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.registered_spyder_kernel_handlers = {}
         self.envs = {}
         self.default_interpreter = sys.executable
+        self.kernel_pool_size = self.get_conf('kernel_pool_size')
 
         # Disable infowidget if requested by the user
         self.enable_infowidget = True
@@ -860,6 +861,27 @@ def change_clients_autocall(self, value):
                 client.shellwidget.set_autocall,
                 value)
 
+    @on_conf_change(option='max_output_rate')
+    def change_clients_max_output_rate(self, value):
+        for idx, client in enumerate(self.clients):
+            self._change_client_conf(
+                client,
+                client.shellwidget.set_max_output_rate,
+                value)
+
+    @on_conf_change(option='kernel_pool_size')
+    def change_kernel_pool_size(self, value):
+        self.set_kernel_pool_size(value)
+
+    @on_conf_change(
+        section='main_interpreter',
+        option=['default', 'executable', 'umr/enabled', 'umr/verbose',
+                'umr/namelist'])
+    def change_main_interpreter(self, option, value):
+        # Standby kernels were started with the previous interpreter or
+        # environment
+        self.refresh_cached_kernels()
+
     @on_conf_change(option=[
         'symbolic_math', 'hide_cmd_windows',
         'startup/run_lines', 'startup/use_run_file', 'startup/run_file',
@@ -1944,7 +1966,8 @@ def interrupt_kernel(self):
             client.stop_button_click_handler()
 
     # ---- For cells
-    def run_cell(self, code, cell_name, filename, method='runcell'):
+    def run_cell(self, code, cell_name, filename, method='runcell',
+                 method_args=None):
         """Run cell in current or dedicated client."""
 
         def norm(text):
@@ -1961,7 +1984,7 @@ def norm(text):
             is_spyder_kernel = client.shellwidget.is_spyder_kernel
 
             if is_spyder_kernel:
-                magic_arguments = []
+                magic_arguments = list(method_args or [])
                 if isinstance(cell_name, int):
                     magic_arguments.append("-i")
                 else:
@@ -2142,6 +2165,9 @@ def update_path(self, path_dict, new_path_dict):
             if shell is not None:
                 shell.update_syspath(path_dict, new_path_dict)
 
+        # Standby kernels were started with the previous PYTHONPATH
+        self.refresh_cached_kernels()
+
     def get_active_project_path(self):
         """Get the active project path."""
         return self.active_project_path
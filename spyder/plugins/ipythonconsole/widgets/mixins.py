@@ -12,31 +12,90 @@
 from spyder.plugins.ipythonconsole.utils.kernel_handler import KernelHandler
 
 
+# Maximum number of kernel specs for which standby kernels are kept
+MAX_KERNEL_POOLS = 2
+
+
+class KernelPool:
+    """Standby kernels started from the same kernel spec."""
+
+    def __init__(self, kernel_spec):
+        self.kernel_spec = kernel_spec
+        self.kernel_handlers = []
+        self.update_properties()
+
+    def update_properties(self):
+        """Save the environment and arguments kernels are started with."""
+        self.env = self.kernel_spec.env
+        self.argv = self.kernel_spec.argv
+
+    def fill(self, size):
+        """Start kernels until there are `size` of them."""
+        while len(self.kernel_handlers) < size:
+            self.kernel_handlers.append(
+                KernelHandler.new_from_spec(self.kernel_spec))
+
+    def shrink(self, size):
+        """Close kernels until there are at most `size` of them."""
+        while len(self.kernel_handlers) > size:
+            self.kernel_handlers.pop().close(now=True)
+
+    def close(self):
+        """Close all kernels."""
+        self.shrink(0)
+
+
 class CachedKernelMixin:
-    """Cached kernel mixin."""
+    """
+    Cached kernel mixin.
+
+    A pool of `kernel_pool_size` kernels is started in the background for
+    the kernel specs used last, so that new consoles and restarts don't wait
+    for kernels to start. Pools are refilled after each checkout.
+    """
 
     def __init__(self):
         super().__init__()
-        self._cached_kernel_properties = None
+        self.kernel_pool_size = 1
+        # Most recently used last
+        self._kernel_pools = []
 
     def close_cached_kernel(self):
-        """Close the cached kernel."""
-        if self._cached_kernel_properties is None:
+        """Close the cached kernels."""
+        for pool in self._kernel_pools:
+            pool.close()
+        self._kernel_pools = []
+
+    def refresh_cached_kernels(self):
+        """
+        Replace the cached kernels by new ones, which is needed when the
+        interpreter, environment or PYTHONPATH used to start them change.
+        """
+        for pool in self._kernel_pools:
+            pool.close()
+            pool.update_properties()
+            pool.fill(self.kernel_pool_size)
+
+    def set_kernel_pool_size(self, size):
+        """Set the number of standby kernels kept for each kernel spec."""
+        self.kernel_pool_size = size
+        if size < 1:
+            self.close_cached_kernel()
             return
-        kernel = self._cached_kernel_properties[-1]
-        kernel.close(now=True)
-        self._cached_kernel_properties = None
-
-    def check_cached_kernel_spec(self, kernel_spec):
-        """Test if kernel_spec corresponds to the cached kernel_spec."""
-        if self._cached_kernel_properties is None:
-            return False
-        (
-            cached_spec,
-            cached_env,
-            cached_argv,
-            _,
-        ) = self._cached_kernel_properties
+        for pool in self._kernel_pools:
+            pool.shrink(size)
+            pool.fill(size)
+
+    def get_next_cached_kernel(self):
+        """Get the kernel that will be used next, if any."""
+        if self._kernel_pools and self._kernel_pools[-1].kernel_handlers:
+            return self._kernel_pools[-1].kernel_handlers[0]
+        return None
+
+    def check_cached_kernel_spec(self, pool, kernel_spec):
+        """Test if kernel_spec corresponds to the kernel spec of pool."""
+        cached_spec = pool.kernel_spec
+        cached_env = pool.env
 
         # Call interrupt_mode so the dict will be the same
         kernel_spec.interrupt_mode
@@ -49,38 +108,44 @@ def check_cached_kernel_spec(self, kernel_spec):
                 kernel_spec.env["PYTEST_CURRENT_TEST"])
         return (
             cached_spec.__dict__ == kernel_spec.__dict__
-            and kernel_spec.argv == cached_argv
+            and kernel_spec.argv == pool.argv
             and kernel_spec.env == cached_env
         )
 
     def get_cached_kernel(self, kernel_spec, cache=True):
-        """Get a new kernel, and cache one for next time."""
-        # Cache another kernel for next time.
-        new_kernel_handler = KernelHandler.new_from_spec(kernel_spec)
-
-        if not cache:
+        """Get a new kernel, and start another one for next time."""
+        if not cache or self.kernel_pool_size < 1:
             # remove/don't use cache if requested
-            self.close_cached_kernel()
-            return new_kernel_handler
-
-        # Check cached kernel has the same configuration as is being asked
-        cached_kernel_handler = None
-        if self._cached_kernel_properties is not None:
-            cached_kernel_handler = self._cached_kernel_properties[-1]
-            if not self.check_cached_kernel_spec(kernel_spec):
-                # Close the kernel
+            if not cache:
                 self.close_cached_kernel()
-                cached_kernel_handler = None
-
-        # Cache the new kernel
-        self._cached_kernel_properties = (
-            kernel_spec,
-            kernel_spec.env,
-            kernel_spec.argv,
-            new_kernel_handler,
-        )
-
-        if cached_kernel_handler is None:
             return KernelHandler.new_from_spec(kernel_spec)
 
-        return cached_kernel_handler
+        # Find the pool of kernels started from the same spec. Kernels
+        # started with a different environment or arguments can't be used.
+        pool = None
+        for cached_pool in self._kernel_pools:
+            if self.check_cached_kernel_spec(cached_pool, kernel_spec):
+                pool = cached_pool
+                break
+            if cached_pool.kernel_spec.__dict__ == kernel_spec.__dict__:
+                cached_pool.close()
+                self._kernel_pools.remove(cached_pool)
+                break
+
+        if pool is None:
+            pool = KernelPool(kernel_spec)
+        else:
+            self._kernel_pools.remove(pool)
+        self._kernel_pools.append(pool)
+        for old_pool in self._kernel_pools[:-MAX_KERNEL_POOLS]:
+            old_pool.close()
+            self._kernel_pools.remove(old_pool)
+
+        if pool.kernel_handlers:
+            kernel_handler = pool.kernel_handlers.pop(0)
+        else:
+            kernel_handler = KernelHandler.new_from_spec(kernel_spec)
+
+        # Refill the pool for next time
+        pool.fill(self.kernel_pool_size)
+        return kernel_handler
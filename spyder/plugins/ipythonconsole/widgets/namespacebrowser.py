@@ -15,7 +15,7 @@
 
 # Third-party imports
 from qtconsole.rich_jupyter_widget import RichJupyterWidget
-from spyder_kernels.comms.commbase import CommError
+from spyder_kernels.comms.commbase import CommCancelled, CommError
 
 # Local imports
 from spyder.config.base import _
@@ -48,7 +48,11 @@ def get_value(self, name):
             return self.call_kernel(
                 blocking=True,
                 display_error=True,
-                timeout=CALL_KERNEL_TIMEOUT).get_value(name)
+                timeout=CALL_KERNEL_TIMEOUT,
+                stream=True).get_value(name)
+        except CommCancelled:
+            # The user cancelled the transfer
+            return None
         except TimeoutError:
             raise ValueError(msg % reason_big)
         except (PicklingError, UnpicklingError, TypeError):
@@ -62,6 +66,72 @@ def get_value(self, name):
         except Exception:
             raise ValueError(msg % reason_other)
 
+    def get_array_info(self, name):
+        """Ask kernel for the information needed to show an array"""
+        return self.call_kernel(
+            blocking=True,
+            display_error=True,
+            timeout=CALL_KERNEL_TIMEOUT).get_array_info(name)
+
+    def get_array_block(self, name, rows, cols):
+        """Ask kernel for a block of an array"""
+        return self.call_kernel(
+            blocking=True,
+            display_error=True,
+            timeout=CALL_KERNEL_TIMEOUT).get_array_block(name, rows, cols)
+
+    def set_array_values(self, name, changes):
+        """Set individual values of an array"""
+        self.call_kernel(
+            interrupt=True,
+            blocking=False,
+            display_error=True,
+            ).set_array_values(name, changes)
+
+    def open_dataframe_view(self, name):
+        """Ask kernel to open a view to show a DataFrame by blocks"""
+        return self.call_kernel(
+            blocking=True,
+            display_error=True,
+            timeout=CALL_KERNEL_TIMEOUT).open_dataframe_view(name)
+
+    def get_dataframe_block(self, view_id, rows, cols):
+        """Ask kernel for a block of a DataFrame view"""
+        return self.call_kernel(
+            blocking=True,
+            display_error=True,
+            timeout=CALL_KERNEL_TIMEOUT).get_dataframe_block(
+                view_id, rows, cols)
+
+    def sort_dataframe_view(self, view_id, column, ascending):
+        """Ask kernel to sort a DataFrame view"""
+        return self.call_kernel(
+            blocking=True,
+            timeout=CALL_KERNEL_TIMEOUT).sort_dataframe_view(
+                view_id, column, ascending)
+
+    def filter_dataframe_view(self, view_id, column, text):
+        """Ask kernel to filter the rows of a DataFrame view"""
+        return self.call_kernel(
+            blocking=True,
+            timeout=CALL_KERNEL_TIMEOUT).filter_dataframe_view(
+                view_id, column, text)
+
+    def set_dataframe_values(self, view_id, changes):
+        """Set values of the object shown in a DataFrame view"""
+        self.call_kernel(
+            interrupt=True,
+            blocking=False,
+            display_error=True,
+            ).set_dataframe_values(view_id, changes)
+
+    def close_dataframe_view(self, view_id):
+        """Close a DataFrame view in the kernel"""
+        self.call_kernel(
+            interrupt=True,
+            blocking=False,
+            ).close_dataframe_view(view_id)
+
     def set_value(self, name, value):
         """Set value for a variable"""
         self.call_kernel(
@@ -9,6 +9,7 @@
 """
 
 # Standard library imports
+import logging
 import os
 import os.path as osp
 import time
@@ -37,6 +38,8 @@
     NamepaceBrowserWidget, PageControlWidget)
 
 
+logger = logging.getLogger(__name__)
+
 MODULES_FAQ_URL = (
     "https://docs.spyder-ide.org/5/faq.html#using-packages-installer")
 
@@ -149,6 +152,8 @@ def __init__(self, ipyclient, additional_options, interpreter_versions,
         self.interpreter_versions = interpreter_versions
         self.kernel_handler = None
         self._cwd = ''
+        # Import time of the modules preloaded by the kernel
+        self.preload_timings = {}
 
         # Keyboard shortcuts
         # Registered here to use shellwidget as the parent
@@ -308,7 +313,7 @@ def print_restart_message(self):
         self.insert_horizontal_ruler()
 
     def call_kernel(self, interrupt=False, blocking=False, callback=None,
-                    timeout=None, display_error=False):
+                    timeout=None, display_error=False, stream=False):
         """
         Send message to Spyder kernel connected to this console.
 
@@ -330,13 +335,58 @@ def call_kernel(self, interrupt=False, blocking=False, callback=None,
             used.
         display_error: bool
             If an error occurs, should it be printed to the console.
+        stream: bool
+            Receive a large reply to a blocking call in frames, so its
+            progress can be followed and it can be cancelled. The timeout
+            applies to each frame.
         """
         return self.kernel_handler.kernel_comm.remote_call(
             interrupt=interrupt,
             blocking=blocking,
             callback=callback,
             timeout=timeout,
-            display_error=display_error
+            display_error=display_error,
+            stream=stream
+        )
+
+    def call_kernel_async(self, interrupt=False, callback=None, timeout=None,
+                          display_error=False, supersede=None, coalesce=True):
+        """
+        Send a non-blocking message to Spyder kernel connected to this
+        console and get a future for its reply.
+
+        Calls are sent without waiting for the replies of the previous ones,
+        so several of them can be made before waiting for any result with
+        `future.result()`.
+
+        Parameters
+        ----------
+        interrupt: bool
+            Interrupt the kernel while running or in Pdb to perform
+            the call.
+        callback: callable
+            Callable to process the response sent from the kernel
+            on the Spyder side.
+        timeout: int or None
+            Maximum time (in seconds) to wait for the response in
+            `future.result()`. If None, a default timeout (defined in
+            commbase.py, present in spyder-kernels) is used.
+        display_error: bool
+            If an error occurs, should it be printed to the console.
+        supersede: str or None
+            Cancel the previous call made with this key if it's still
+            waiting for its response, so only the latest one is processed.
+        coalesce: bool
+            Share the response of an identical call that is still waiting
+            for it instead of sending a new one.
+        """
+        return self.kernel_handler.kernel_comm.call_multiplexer.remote_call(
+            interrupt=interrupt,
+            callback=callback,
+            timeout=timeout,
+            display_error=display_error,
+            supersede=supersede,
+            coalesce=coalesce
         )
 
     @property
@@ -377,6 +427,12 @@ def setup_spyder_kernel(self):
             callback=self.ipyclient._show_special_console_error
             ).is_special_kernel_valid()
 
+        # Get the modules preloaded so far, in case the kernel was started
+        # before the console
+        self.call_kernel(
+            callback=self._handle_preload_timings
+            ).get_preload_timings()
+
         self.send_spyder_kernel_configuration()
 
     def send_spyder_kernel_configuration(self):
@@ -504,9 +560,26 @@ def update_state(self, state):
             self._cwd = cwd
             self.sig_working_directory_changed.emit(self._cwd)
 
+        preload_timings = state.pop("preload_timings", None)
+        if preload_timings is not None:
+            self._handle_preload_timings(preload_timings)
+
         if state:
             self.sig_kernel_state_arrived.emit(state)
 
+    def _handle_preload_timings(self, timings):
+        """Save the import time of the modules preloaded by the kernel."""
+        if not timings:
+            return
+        self.preload_timings = timings['modules']
+        if timings['finished']:
+            logger.debug(
+                "Modules preloaded by the kernel: " + ", ".join(
+                    "{} ({})".format(
+                        name,
+                        "failed" if t is None else "{:.3f} s".format(t))
+                    for name, t in self.preload_timings.items()))
+
     def set_bracket_matcher_color_scheme(self, color_scheme):
         """Set color scheme for matched parentheses."""
         bsh = sh.BaseSH(parent=self, color_scheme=color_scheme)
@@ -541,12 +614,12 @@ def update_syspath(self, path_dict, new_path_dict):
 
     def request_syspath(self):
         """Ask the kernel for sys.path contents."""
-        self.call_kernel(
+        self.call_kernel_async(
             interrupt=True, callback=self.sig_show_syspath.emit).get_syspath()
 
     def request_env(self):
         """Ask the kernel for environment variables."""
-        self.call_kernel(
+        self.call_kernel_async(
             interrupt=True, callback=self.sig_show_env.emit).get_env()
 
     def set_show_calltips(self, show_calltips):
@@ -621,6 +694,10 @@ def set_autocall(self, autocall):
         cmd = "get_ipython().kernel.set_autocall({})"
         self.execute(cmd.format(autocall), hidden=True)
 
+    def set_max_output_rate(self, max_output_rate):
+        """Set the maximum number of lines per second sent by the kernel."""
+        self.call_kernel().set_max_output_rate(max_output_rate)
+
     # --- To handle the banner
     def long_banner(self):
         """Banner for clients with additional content."""
@@ -16,6 +16,32 @@
 
 class ProfilerConfigPage(PluginConfigPage):
     def setup_page(self):
+        mode_group = QGroupBox(_("Profiling mode"))
+        mode_label = QLabel(_("The sampling profiler records the call stacks "
+                              "at regular intervals instead of tracing "
+                              "every call, which slows down the code much "
+                              "less. Its results are approximate and can "
+                              "also be shown as a flame graph."))
+        mode_label.setWordWrap(True)
+        sampling_box = self.create_checkbox(
+            _("Use the sampling profiler"), 'sampling')
+        interval_spin = self.create_spinbox(
+            _("Sampling interval: "),
+            _(" ms"),
+            'sampling_interval',
+            min_=1,
+            max_=1000,
+            step=1,
+        )
+        sampling_box.checkbox.toggled.connect(interval_spin.setEnabled)
+        interval_spin.setEnabled(self.get_option('sampling'))
+
+        mode_layout = QVBoxLayout()
+        mode_layout.addWidget(mode_label)
+        mode_layout.addWidget(sampling_box)
+        mode_layout.addWidget(interval_spin)
+        mode_group.setLayout(mode_layout)
+
         results_group = QGroupBox(_("Results"))
         results_label1 = QLabel(_("Profiler plugin results "
                                   "(the output of python's profile/cProfile)\n"
@@ -36,6 +62,7 @@ def setup_page(self):
         results_group.setLayout(results_layout)
 
         vlayout = QVBoxLayout()
+        vlayout.addWidget(mode_group)
         vlayout.addWidget(results_group)
         vlayout.addStretch(1)
         self.setLayout(vlayout)
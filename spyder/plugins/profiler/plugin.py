@@ -19,7 +19,8 @@
 from spyder.api.plugin_registration.decorators import (
     on_plugin_available, on_plugin_teardown)
 from spyder.api.translations import _
-from spyder.plugins.editor.api.run import FileRun
+from spyder.plugins.editor.api.run import CellRun, FileRun
+from spyder.plugins.ipythonconsole.api import IPythonConsolePyConfiguration
 from spyder.plugins.mainmenu.api import ApplicationMenus, RunMenuSections
 from spyder.plugins.profiler.api import ProfilerPyConfiguration
 from spyder.plugins.profiler.confpage import ProfilerConfigPage
@@ -29,7 +30,7 @@
     ProfilerPyConfigurationGroup)
 from spyder.plugins.run.api import (
     RunExecutor, run_execute, RunContext, RunConfiguration,
-    ExtendedRunExecutionParameters, PossibleRunResult)
+    ExtendedRunExecutionParameters, PossibleRunResult, RunResult)
 
 
 class Profiler(SpyderDockablePlugin, RunExecutor):
@@ -39,7 +40,7 @@ class Profiler(SpyderDockablePlugin, RunExecutor):
 
     NAME = 'profiler'
     REQUIRES = [Plugins.Preferences, Plugins.Editor, Plugins.Run]
-    OPTIONAL = []
+    OPTIONAL = [Plugins.IPythonConsole]
     TABIFY = [Plugins.Help]
     WIDGET_CLASS = ProfilerWidget
     CONF_SECTION = NAME
@@ -84,6 +85,16 @@ def on_initialize(self):
                 'requires_cwd': True,
                 'priority': 3
             },
+            {
+                'input_extension': ['py', 'ipy'],
+                'context': {
+                    'name': 'Cell'
+                },
+                'output_formats': [],
+                'configuration_widget': None,
+                'requires_cwd': True,
+                'priority': 3
+            },
         ]
 
     @on_plugin_available(plugin=Plugins.Editor)
@@ -92,6 +103,12 @@ def on_editor_available(self):
         editor = self.get_plugin(Plugins.Editor)
         widget.sig_edit_goto_requested.connect(editor.load)
 
+    @on_plugin_available(plugin=Plugins.IPythonConsole)
+    def on_ipython_console_available(self):
+        ipyconsole = self.get_plugin(Plugins.IPythonConsole)
+        ipyconsole.register_spyder_kernel_call_handler(
+            'show_profile_file', self.show_profile_buffer)
+
     @on_plugin_available(plugin=Plugins.Preferences)
     def on_preferences_available(self):
         preferences = self.get_plugin(Plugins.Preferences)
@@ -117,12 +134,31 @@ def on_run_available(self):
                 }
             )
 
+            run.create_run_in_executor_button(
+                RunContext.Cell,
+                self.NAME,
+                text=_("Profile cell"),
+                tip=_("Profile cell in the current console"),
+                icon=self.create_icon('profiler'),
+                shortcut_context='profiler',
+                register_shortcut=True,
+                add_to_menu={
+                    "menu": ApplicationMenus.Run,
+                    "section": RunMenuSections.RunInExecutors
+                }
+            )
+
     @on_plugin_teardown(plugin=Plugins.Editor)
     def on_editor_teardown(self):
         widget = self.get_widget()
         editor = self.get_plugin(Plugins.Editor)
         widget.sig_edit_goto_requested.disconnect(editor.load)
 
+    @on_plugin_teardown(plugin=Plugins.IPythonConsole)
+    def on_ipython_console_teardown(self):
+        ipyconsole = self.get_plugin(Plugins.IPythonConsole)
+        ipyconsole.unregister_spyder_kernel_call_handler('show_profile_file')
+
     @on_plugin_teardown(plugin=Plugins.Preferences)
     def on_preferences_teardown(self):
         preferences = self.get_plugin(Plugins.Preferences)
@@ -135,6 +171,8 @@ def on_run_teardown(self):
             self, self.executor_configuration)
         run.destroy_run_in_executor_button(
             RunContext.File, self.NAME)
+        run.destroy_run_in_executor_button(
+            RunContext.Cell, self.NAME)
 
     # ---- Public API
     # -------------------------------------------------------------------------
@@ -157,6 +195,22 @@ def stop_profiler(self):
         """
         self.get_widget().stop()
 
+    def show_profile_buffer(self, prof_buffer, name, stacks=None):
+        """
+        Show profiling data sent by a console.
+
+        Parameters
+        ----------
+        prof_buffer: bytes
+            Profiling data, in the format saved by the cProfile module.
+        name: str
+            Name of the code that was profiled.
+        stacks: str, optional
+            Stacks recorded by the sampling profiler, in the folded format.
+        """
+        self.switch_to_plugin()
+        self.get_widget().show_profile_buffer(prof_buffer, name, stacks)
+
     @run_execute(context=RunContext.File)
     def run_file(
         self,
@@ -180,3 +234,38 @@ def run_file(
             wdir=wdir,
             args=args
         )
+
+    @run_execute(context=RunContext.Cell)
+    def profile_cell(
+        self,
+        input: RunConfiguration,
+        conf: ExtendedRunExecutionParameters
+    ) -> List[RunResult]:
+
+        console = self.get_plugin(Plugins.IPythonConsole)
+        if console is None:
+            return
+
+        magic_args = []
+        if self.get_conf('sampling'):
+            magic_args = [
+                '--sampling',
+                '--interval', str(self.get_conf('sampling_interval'))
+            ]
+
+        run_input: CellRun = input['run_input']
+        if run_input['copy']:
+            code = run_input['cell']
+            if not code.strip():
+                # Empty cell
+                return
+            console.run_selection(
+                " ".join(["%%profile"] + magic_args) + "\n" + code)
+            return
+
+        exec_params = conf['params']
+        params: IPythonConsolePyConfiguration = exec_params['executor_params']
+        params["run_method"] = "profilecell"
+        params["run_method_args"] = magic_args
+
+        console.exec_cell(input, conf)
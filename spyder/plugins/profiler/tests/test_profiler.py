@@ -14,6 +14,7 @@
 import pytest
 
 # Local imports
+from spyder.plugins.profiler.widgets.flamegraph import FlameGraphWidget
 from spyder.plugins.profiler.widgets.main_widget import ProfilerDataTree
 from spyder.utils.palette import SpyderPalette
 
@@ -101,5 +102,30 @@ class Stats:
                                   ['2.00 s', ['-400.00 ms', SUCESS]]]
 
 
+def test_flame_graph(qtbot):
+    """Test building the flame graph from folded stacks."""
+    widget = FlameGraphWidget(None)
+    qtbot.addWidget(widget)
+
+    widget.set_folded_stacks(
+        "<module> (test.py:10);f (test.py:2) 300\n"
+        "<module> (test.py:10);f (test.py:2);g (test.py:5) 200\n"
+        "<module> (test.py:11) 500\n"
+        "invalid line\n"
+    )
+    root = widget.root
+    assert root.value == 1000
+    assert root.get_depth() == 4
+
+    module = root.children['<module> (test.py:10)']
+    assert module.value == 500
+    f = module.children['f (test.py:2)']
+    assert (f.name, f.filename, f.line, f.value) == ('f', 'test.py', 2, 500)
+    assert f.children['g (test.py:5)'].value == 200
+
+    widget.set_folded_stacks('')
+    assert widget.is_empty()
+
+
 if __name__ == "__main__":
     pytest.main()
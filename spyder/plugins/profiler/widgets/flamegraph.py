@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Flame graph of the stacks recorded by a sampling profiler.
+"""
+
+# Standard library imports
+import re
+import zlib
+
+# Third party imports
+from qtpy.QtCore import QRectF, Qt, Signal
+from qtpy.QtGui import QColor, QFontMetrics, QPainter
+from qtpy.QtWidgets import QToolTip, QWidget
+
+# Local imports
+from spyder.api.translations import _
+
+
+# Format of the frames of folded stacks: function (filename:line)
+FRAME_REGEX = re.compile(r'^(?P<name>.*) \((?P<filename>.*):(?P<line>\d+)\)$')
+
+
+class FlameNode:
+    """A frame of the flame graph, with the time sampled in it."""
+
+    def __init__(self, label, parent=None):
+        self.label = label
+        self.parent = parent
+        self.value = 0
+        self.children = {}
+
+        match = FRAME_REGEX.match(label)
+        if match:
+            self.name = match.group('name')
+            self.filename = match.group('filename')
+            self.line = int(match.group('line'))
+        else:
+            self.name = label
+            self.filename = None
+            self.line = None
+
+    def get_child(self, label):
+        child = self.children.get(label)
+        if child is None:
+            child = self.children[label] = FlameNode(label, parent=self)
+        return child
+
+    def get_depth(self):
+        return 1 + max(
+            (child.get_depth() for child in self.children.values()),
+            default=0
+        )
+
+
+class FlameGraphWidget(QWidget):
+    """
+    Widget showing folded stacks as a flame graph.
+
+    Frames are drawn from the outermost one, at the top, in. Clicking on a
+    frame zooms on it and clicking on the top one zooms out. Double clicking
+    on a frame opens its line in the editor.
+    """
+
+    FRAME_HEIGHT = 20
+
+    sig_edit_goto_requested = Signal(str, int, str)
+    """
+    This signal will request to open a file in a given row and column
+    using a code editor.
+
+    Parameters
+    ----------
+    path: str
+        Path to file.
+    row: int
+        Cursor starting row position.
+    word: str
+        Word to select on given row.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.root = None
+        self.zoomed = None
+        # (rectangle, node) of the frames drawn
+        self._frames = []
+        self.setMouseTracking(True)
+
+    def load_data(self, filename):
+        """Load folded stacks from a file."""
+        try:
+            with open(filename, encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            text = ''
+        self.set_folded_stacks(text)
+
+    def set_folded_stacks(self, text):
+        """
+        Set the stacks to show.
+
+        Parameters
+        ----------
+        text: str
+            Folded stacks, one per line, with their frames separated by
+            semicolons and followed by the time sampled in them.
+        """
+        root = FlameNode(_('All'))
+        for line in text.splitlines():
+            stack, __, value = line.rpartition(' ')
+            try:
+                value = int(value)
+            except ValueError:
+                continue
+            node = root
+            node.value += value
+            for label in stack.split(';'):
+                node = node.get_child(label)
+                node.value += value
+
+        self.root = root if root.value else None
+        self.zoomed = self.root
+        depth = root.get_depth() if self.root else 0
+        self.setMinimumHeight(depth * self.FRAME_HEIGHT)
+        self.update()
+
+    def is_empty(self):
+        """Whether there are no stacks to show."""
+        return self.root is None
+
+    # ---- Qt methods
+    def paintEvent(self, event):
+        self._frames = []
+        if self.zoomed is None:
+            return
+
+        painter = QPainter(self)
+        metrics = QFontMetrics(self.font())
+
+        # The ancestors of the zoomed frame take the whole width
+        ancestors = []
+        node = self.zoomed.parent
+        while node is not None:
+            ancestors.insert(0, node)
+            node = node.parent
+
+        for depth, node in enumerate(ancestors):
+            self._draw_frame(painter, metrics, node, 0, depth, self.width())
+
+        scale = self.width() / self.zoomed.value
+        to_draw = [(self.zoomed, 0., len(ancestors))]
+        while to_draw:
+            node, x, depth = to_draw.pop()
+            width = node.value * scale
+            if width < 1:
+                continue
+            self._draw_frame(painter, metrics, node, x, depth, width)
+            for child in sorted(node.children.values(),
+                                key=lambda child: child.label):
+                to_draw.append((child, x, depth + 1))
+                x += child.value * scale
+
+        painter.end()
+
+    def mousePressEvent(self, event):
+        node = self._get_node_at(event.pos())
+        if event.button() != Qt.LeftButton or node is None:
+            return
+        if node is self.zoomed and node.parent is not None:
+            self.zoomed = node.parent
+        else:
+            self.zoomed = node
+        self.update()
+
+    def mouseDoubleClickEvent(self, event):
+        node = self._get_node_at(event.pos())
+        if node is not None and node.filename is not None:
+            self.sig_edit_goto_requested.emit(
+                node.filename, node.line, '')
+
+    def mouseMoveEvent(self, event):
+        node = self._get_node_at(event.pos())
+        if node is None:
+            QToolTip.hideText()
+            return
+
+        percent = 100 * node.value / self.root.value
+        text = '<b>{}</b><br>{:.3f} s ({:.1f}%)'.format(
+            node.name, node.value / 1e6, percent)
+        if node.filename is not None:
+            text += '<br>{}:{}'.format(node.filename, node.line)
+        QToolTip.showText(event.globalPos(), text, self)
+
+    # ---- Private API
+    def _draw_frame(self, painter, metrics, node, x, depth, width):
+        rect = QRectF(x, depth * self.FRAME_HEIGHT, width, self.FRAME_HEIGHT)
+        self._frames.append((rect, node))
+
+        # Stable warm colors, from the name of the function
+        hue = zlib.crc32(node.name.encode('utf-8')) % 50
+        painter.fillRect(rect.adjusted(0, 0, -1, -1),
+                         QColor.fromHsv(hue, 180, 235))
+
+        label = metrics.elidedText(node.name, Qt.ElideRight, int(width) - 6)
+        if label and label != '…':
+            painter.setPen(QColor(Qt.black))
+            painter.drawText(rect.adjusted(3, 0, -3, 0),
+                             Qt.AlignLeft | Qt.AlignVCenter, label)
+
+    def _get_node_at(self, pos):
+        for rect, node in reversed(self._frames):
+            if rect.contains(pos.x(), pos.y()):
+                return node
+        return None
@@ -18,6 +18,7 @@
 import os
 import os.path as osp
 import re
+import shutil
 import sys
 import time
 from itertools import islice
@@ -27,8 +28,9 @@
 from qtpy.compat import getopenfilename, getsavefilename
 from qtpy.QtCore import QByteArray, QProcess, QProcessEnvironment, Qt, Signal
 from qtpy.QtGui import QColor
-from qtpy.QtWidgets import (QApplication, QLabel, QMessageBox, QTreeWidget,
-                            QTreeWidgetItem, QStackedWidget, QVBoxLayout)
+from qtpy.QtWidgets import (QApplication, QLabel, QMessageBox, QScrollArea,
+                            QTreeWidget, QTreeWidgetItem, QStackedWidget,
+                            QVBoxLayout)
 
 # Local imports
 from spyder.api.config.decorators import on_conf_change
@@ -36,6 +38,7 @@
 from spyder.api.widgets.main_widget import PluginMainWidget
 from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.config.base import get_conf_path
+from spyder.plugins.profiler.widgets.flamegraph import FlameGraphWidget
 from spyder.plugins.variableexplorer.widgets.texteditor import TextEditor
 from spyder.py3compat import to_text_string
 from spyder.utils.misc import get_python_executable, getcwd_or_home
@@ -60,10 +63,12 @@ class ProfilerWidgetActions:
     Browse = 'browse_action'
     Clear = 'clear_action'
     Collapse = 'collapse_action'
+    ComparePrevious = 'compare_previous_action'
     Expand = 'expand_action'
     LoadData = 'load_data_action'
     Run = 'run_action'
     SaveData = 'save_data_action'
+    ShowFlameGraph = 'show_flame_graph_action'
     ShowOutput = 'show_output_action'
 
 
@@ -132,6 +137,8 @@ class ProfilerWidget(PluginMainWidget):
     """
     ENABLE_SPINNER = True
     DATAPATH = get_conf_path('profiler.results')
+    PREVIOUS_DATAPATH = get_conf_path('profiler.previous.results')
+    STACKSPATH = get_conf_path('profiler.stacks')
 
     # --- Signals
     # ------------------------------------------------------------------------
@@ -174,6 +181,10 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.filecombo = PythonModulesComboBox(
             self, id_=ProfilerWidgetMainToolbarItems.FileCombo)
         self.datatree = ProfilerDataTree(self)
+        self.flamegraph = FlameGraphWidget(self)
+        self.flamegraph_area = QScrollArea(self)
+        self.flamegraph_area.setWidget(self.flamegraph)
+        self.flamegraph_area.setWidgetResizable(True)
         self.pane_empty = PaneEmptyWidget(
             self,
             "code-profiler",
@@ -189,6 +200,7 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.stacked_widget = QStackedWidget(self)
         self.stacked_widget.addWidget(self.pane_empty)
         self.stacked_widget.addWidget(self.datatree)
+        self.stacked_widget.addWidget(self.flamegraph_area)
 
         layout = QVBoxLayout()
         layout.addWidget(self.stacked_widget)
@@ -197,6 +209,8 @@ def __init__(self, name=None, plugin=None, parent=None):
         # Signals
         self.datatree.sig_edit_goto_requested.connect(
             self.sig_edit_goto_requested)
+        self.flamegraph.sig_edit_goto_requested.connect(
+            self.sig_edit_goto_requested)
 
     # --- PluginMainWidget API
     # ------------------------------------------------------------------------
@@ -263,8 +277,26 @@ def setup(self):
             icon=self.create_icon('editdelete'),
             triggered=self.clear,
         )
+        self.compare_previous_action = self.create_action(
+            ProfilerWidgetActions.ComparePrevious,
+            text=_("Compare with previous result"),
+            tip=_("Compare with the previous profiling result"),
+            icon=self.create_icon('history'),
+            triggered=self.compare_previous,
+        )
+        self.flamegraph_action = self.create_action(
+            ProfilerWidgetActions.ShowFlameGraph,
+            text=_("Flame graph"),
+            tip=_("Show the stacks recorded by the sampling profiler as a "
+                  "flame graph"),
+            icon=self.create_icon('plot'),
+            toggled=True,
+            option='show_flame_graph',
+        )
         self.clear_action.setEnabled(False)
         self.save_action.setEnabled(False)
+        self.compare_previous_action.setEnabled(False)
+        self.flamegraph_action.setEnabled(False)
 
         # Main Toolbar
         toolbar = self.get_main_toolbar()
@@ -279,13 +311,15 @@ def setup(self):
         secondary_toolbar = self.create_toolbar(
             ProfilerWidgetToolbars.Information)
         for item in [self.collapse_action, self.expand_action,
+                     self.flamegraph_action,
                      self.create_stretcher(
                          id_=ProfilerWidgetInformationToolbarItems.Stretcher1),
                      self.datelabel,
                      self.create_stretcher(
                          id_=ProfilerWidgetInformationToolbarItems.Stretcher2),
                      self.log_action,
-                     self.save_action, self.load_action, self.clear_action]:
+                     self.save_action, self.load_action,
+                     self.compare_previous_action, self.clear_action]:
             self.add_item_to_toolbar(
                 item,
                 toolbar=secondary_toolbar,
@@ -313,6 +347,9 @@ def update_actions(self):
         self.start_action.setIcon(icon)
 
         self.load_action.setEnabled(not self.running)
+        self.compare_previous_action.setEnabled(
+            not self.running and osp.isfile(self.PREVIOUS_DATAPATH))
+        self.flamegraph_action.setEnabled(not self.flamegraph.is_empty())
         self.clear_action.setEnabled(not self.running)
         self.start_action.setEnabled(bool(self.filecombo.currentText()))
 
@@ -377,6 +414,52 @@ def _read_output(self, error=False):
     def _update_pythonpath(self, value):
         self.pythonpath = value
 
+    @on_conf_change(option='show_flame_graph')
+    def _show_flame_graph(self, value):
+        if self.stacked_widget.currentWidget() is not self.pane_empty:
+            self._show_current_view()
+
+    def _save_previous_data(self):
+        """
+        Keep the last result to be able to compare the next one to it, and
+        remove its stacks.
+        """
+        if osp.isfile(self.DATAPATH):
+            try:
+                shutil.copyfile(self.DATAPATH, self.PREVIOUS_DATAPATH)
+            except OSError:
+                pass
+        try:
+            os.remove(self.STACKSPATH)
+        except OSError:
+            pass
+
+    def _show_tree(self, name=None):
+        """Load the last result in the tree and show it."""
+        self.datelabel.setText(_('Sorting data, please wait...'))
+        QApplication.processEvents()
+
+        self.datatree.load_data(self.DATAPATH)
+        self.datatree.show_tree()
+        self.flamegraph.load_data(self.STACKSPATH)
+        self._show_current_view()
+
+        text_style = "<span style=\'color: %s\'><b>%s </b></span>"
+        date = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        if name:
+            date = "{} - {}".format(name, date)
+        date_text = text_style % (self.text_color, date)
+        self.datelabel.setText(date_text)
+
+    def _show_current_view(self):
+        """Show the flame graph if selected and available, or the tree."""
+        has_stacks = not self.flamegraph.is_empty()
+        self.flamegraph_action.setEnabled(has_stacks)
+        if self.get_conf('show_flame_graph') and has_stacks:
+            self.stacked_widget.setCurrentWidget(self.flamegraph_area)
+        else:
+            self.stacked_widget.setCurrentWidget(self.datatree)
+
     # --- Public API
     # ------------------------------------------------------------------------
     def save_data(self):
@@ -412,6 +495,13 @@ def compare(self):
             self.save_action.setEnabled(True)
             self.clear_action.setEnabled(True)
 
+    def compare_previous(self):
+        """Compare the last run with the one before it."""
+        if osp.isfile(self.PREVIOUS_DATAPATH):
+            self.datatree.compare(self.PREVIOUS_DATAPATH)
+            self._show_tree()
+            self.clear_action.setEnabled(True)
+
     def clear(self):
         """Clear data in tree."""
         self.datatree.compare(None)
@@ -554,12 +644,21 @@ def start(self, wdir=None, args=None):
 
         executable = self.get_conf('executable', section='main_interpreter')
 
+        self._save_previous_data()
         self.output = ''
         self.error_output = ''
         self.running = True
         self.start_spinner()
 
-        p_args = ['-m', 'cProfile', '-o', self.DATAPATH]
+        if self.get_conf('sampling'):
+            p_args = [
+                '-m', 'spyder_kernels.utils.sampling',
+                '-i', str(self.get_conf('sampling_interval')),
+                '-o', self.DATAPATH,
+                '--folded', self.STACKSPATH
+            ]
+        else:
+            p_args = ['-m', 'cProfile', '-o', self.DATAPATH]
         if os.name == 'nt':
             # On Windows, one has to replace backslashes by slashes to avoid
             # confusion with escape characters (otherwise, for example, '\t'
@@ -615,17 +714,34 @@ def show_data(self, justanalyzed=False):
         if not filename:
             return
 
-        self.datelabel.setText(_('Sorting data, please wait...'))
-        QApplication.processEvents()
+        self._show_tree()
 
-        self.datatree.load_data(self.DATAPATH)
-        self.datatree.show_tree()
+    def show_profile_buffer(self, prof_buffer, name, stacks=None):
+        """
+        Show profiling data computed in a console.
 
-        text_style = "<span style=\'color: %s\'><b>%s </b></span>"
-        date_text = text_style % (self.text_color,
-                                  time.strftime("%Y-%m-%d %H:%M:%S",
-                                                time.localtime()))
-        self.datelabel.setText(date_text)
+        Parameters
+        ----------
+        prof_buffer: bytes
+            Profiling data, in the format saved by the cProfile module.
+        name: str
+            Name of the code that was profiled.
+        stacks: str, optional
+            Stacks recorded by the sampling profiler, in the folded format.
+        """
+        self._kill_if_running()
+        self._save_previous_data()
+        with open(self.DATAPATH, 'wb') as f:
+            f.write(prof_buffer)
+        if stacks is not None:
+            with open(self.STACKSPATH, 'w', encoding='utf-8') as f:
+                f.write(stacks)
+
+        self.output = None
+        self.log_action.setEnabled(False)
+        self._show_tree(name)
+        self.save_action.setEnabled(True)
+        self.update_actions()
 
 
 class TreeWidgetItem(QTreeWidgetItem):
@@ -44,6 +44,15 @@ def setup_page(self):
         display_boxes = [self.create_checkbox(text, option, tip=tip)
                          for option, text, tip in display_data]
 
+        import_group = QGroupBox(_("Import"))
+        lazy_load_box = self.create_checkbox(
+            _("Load arrays of .spydata, .npy and HDF5 files lazily"),
+            'lazy_load',
+            tip=_("Arrays are read from disk when used instead of being "
+                  "loaded in memory.\nChanges to them are not saved to "
+                  "the files.")
+        )
+
         filter_layout = QVBoxLayout()
         for box in filter_boxes:
             filter_layout.addWidget(box)
@@ -54,8 +63,13 @@ def setup_page(self):
             display_layout.addWidget(box)
         display_group.setLayout(display_layout)
 
+        import_layout = QVBoxLayout()
+        import_layout.addWidget(lazy_load_box)
+        import_group.setLayout(import_layout)
+
         vlayout = QVBoxLayout()
         vlayout.addWidget(filter_group)
         vlayout.addWidget(display_group)
+        vlayout.addWidget(import_group)
         vlayout.addStretch(1)
         self.setLayout(vlayout)
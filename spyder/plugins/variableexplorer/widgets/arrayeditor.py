@@ -14,6 +14,7 @@
 # pylint: disable=R0201
 
 # Standard library imports
+from collections import OrderedDict
 import io
 
 # Third party imports
@@ -152,8 +153,7 @@ def __init__(self, data, format_spec=".6g", xlabels=None, ylabels=None,
 
         if not self._data.dtype.name == 'object':
             try:
-                self.vmin = np.nanmin(self.color_func(data))
-                self.vmax = np.nanmax(self.color_func(data))
+                self.vmin, self.vmax = self._get_value_range(data)
                 if self.vmax == self.vmin:
                     self.vmin -= 1
                 self.hue0 = huerange[0]
@@ -170,7 +170,7 @@ def __init__(self, data, format_spec=".6g", xlabels=None, ylabels=None,
         # crashes. See: spyder-ide/spyder#8093
         self.has_inf = False
         if data.dtype.kind in ['f', 'c']:
-            self.has_inf = np.any(np.isinf(data))
+            self.has_inf = self._get_has_inf(data)
 
         # Deactivate coloring for object arrays or arrays with inf values
         if self._data.dtype.name == 'object' or self.has_inf:
@@ -191,6 +191,15 @@ def __init__(self, data, format_spec=".6g", xlabels=None, ylabels=None,
             else:
                 self.cols_loaded = self.total_cols
 
+    def _get_value_range(self, data):
+        """Return the min and max values used to color cells."""
+        return (np.nanmin(self.color_func(data)),
+                np.nanmax(self.color_func(data)))
+
+    def _get_has_inf(self, data):
+        """Return True if data has infinite values."""
+        return np.any(np.isinf(data))
+
     def get_format_spec(self):
         """Return current format"""
         # Avoid accessing the private attribute _format_spec from outside
@@ -383,6 +392,152 @@ def reset(self):
         self.endResetModel()
 
 
+class RemoteArray:
+    """
+    Array that lives in a kernel and whose data is fetched by blocks.
+
+    It implements the part of the Numpy array interface used by the Array
+    Editor to show one and two dimensional arrays. Edited values are kept
+    until `commit` is called, which sends them back to the kernel.
+    """
+
+    BLOCK_ROWS = ArrayModel.ROWS_TO_LOAD
+    BLOCK_COLS = ArrayModel.COLS_TO_LOAD
+
+    # Max number of blocks kept in memory
+    MAX_BLOCKS = 50
+
+    def __init__(self, info, get_block, set_values):
+        """
+        Parameters
+        ----------
+        info: dict
+            Array information, as returned by the `get_array_info` method of
+            Spyder-kernels.
+        get_block: callable
+            Function that takes (start, stop) row and column indexes and
+            returns the corresponding block of the array.
+        set_values: callable
+            Function that takes a dictionary of (row, column) indexes to
+            values and sets them in the array.
+        """
+        self.shape = tuple(info['shape'])
+        self.ndim = len(self.shape)
+        self.dtype = info['dtype']
+        self.flags = _RemoteArrayFlags(info['writeable'])
+        self.vmin = info['vmin']
+        self.vmax = info['vmax']
+        self.has_inf = info['has_inf']
+        self.changes = {}
+
+        self._get_block = get_block
+        self._set_values = set_values
+        self._blocks = OrderedDict()
+
+    @staticmethod
+    def is_supported(info):
+        """Check if an array can be shown as a RemoteArray."""
+        return (
+            len(info['shape']) in (1, 2) and
+            not info['is_masked'] and
+            not info['is_record'] and
+            info['dtype'].name != 'object'
+        )
+
+    def __getitem__(self, key):
+        row, col = key
+        if isinstance(row, slice) or isinstance(col, slice):
+            return self._get_block(*self._get_range(row, col))
+
+        block_key = (row // self.BLOCK_ROWS, col // self.BLOCK_COLS)
+        try:
+            block = self._fetch_block(block_key)
+        except Exception:
+            # Show an empty cell if the block can't be retrieved
+            return np.ma.masked
+        return block[row % self.BLOCK_ROWS, col % self.BLOCK_COLS]
+
+    def __setitem__(self, key, value):
+        self.changes[key] = value
+
+    def prefetch(self, rows, cols):
+        """Retrieve the blocks that contain the given ranges of indexes."""
+        for block_row in range(rows[0] // self.BLOCK_ROWS,
+                               (rows[1] - 1) // self.BLOCK_ROWS + 1):
+            for block_col in range(cols[0] // self.BLOCK_COLS,
+                                   (cols[1] - 1) // self.BLOCK_COLS + 1):
+                try:
+                    self._fetch_block((block_row, block_col))
+                except Exception:
+                    return
+
+    def commit(self):
+        """Send the edited values to the kernel."""
+        if self.changes:
+            self._set_values(self.changes)
+            self.changes = {}
+
+    def _get_range(self, row, col):
+        """Get (start, stop) indexes from integers or slices."""
+        shape = self.shape if self.ndim == 2 else (self.shape[0], 1)
+        ranges = []
+        for index, length in zip((row, col), shape):
+            if isinstance(index, slice):
+                start, stop, __ = index.indices(length)
+            else:
+                start, stop = index, index + 1
+            ranges.append((start, stop))
+        return ranges
+
+    def _fetch_block(self, block_key):
+        """Get a block, retrieving it from the kernel if necessary."""
+        if block_key in self._blocks:
+            self._blocks.move_to_end(block_key)
+            return self._blocks[block_key]
+
+        block_row, block_col = block_key
+        block = self._get_block(
+            (block_row * self.BLOCK_ROWS, (block_row + 1) * self.BLOCK_ROWS),
+            (block_col * self.BLOCK_COLS, (block_col + 1) * self.BLOCK_COLS))
+        self._blocks[block_key] = block
+        if len(self._blocks) > self.MAX_BLOCKS:
+            self._blocks.popitem(last=False)
+        return block
+
+
+class _RemoteArrayFlags:
+    """Flags of a RemoteArray."""
+
+    def __init__(self, writeable):
+        self.writeable = writeable
+
+
+class RemoteArrayModel(ArrayModel):
+    """Array Editor Table Model for arrays that live in a kernel."""
+
+    def _get_value_range(self, data):
+        """Return the min and max values computed by the kernel."""
+        if data.vmin is None or data.vmax is None:
+            raise ValueError("Values range not available")
+        return data.vmin, data.vmax
+
+    def _get_has_inf(self, data):
+        """Return True if data has infinite values."""
+        return data.has_inf
+
+    def fetch_more(self, rows=False, columns=False):
+        """Load more rows or columns, retrieving their blocks at once."""
+        old_rows_loaded = self.rows_loaded
+        old_cols_loaded = self.cols_loaded
+        super().fetch_more(rows=rows, columns=columns)
+        if self.rows_loaded > old_rows_loaded:
+            self._data.prefetch((old_rows_loaded, self.rows_loaded),
+                                (0, self.cols_loaded))
+        if self.cols_loaded > old_cols_loaded:
+            self._data.prefetch((0, self.rows_loaded),
+                                (old_cols_loaded, self.cols_loaded))
+
+
 class ArrayDelegate(QItemDelegate, SpyderFontsMixin):
     """Array Editor Item Delegate"""
     def __init__(self, dtype, parent=None):
@@ -597,8 +752,13 @@ def __init__(self, parent, data, readonly=False,
             self.data.shape = (1, 1)
 
         format_spec = SUPPORTED_FORMATS.get(data.dtype.name, 's')
-        self.model = ArrayModel(self.data, format_spec=format_spec, xlabels=xlabels,
-                                ylabels=ylabels, readonly=readonly, parent=self)
+        if isinstance(data, RemoteArray):
+            model_class = RemoteArrayModel
+        else:
+            model_class = ArrayModel
+        self.model = model_class(self.data, format_spec=format_spec,
+                                 xlabels=xlabels, ylabels=ylabels,
+                                 readonly=readonly, parent=self)
         self.view = ArrayView(self, self.model, data.dtype, data.shape)
 
         layout = QVBoxLayout()
@@ -92,7 +92,8 @@ def createEditor(self, parent, option, index, object_explorer=False):
         """Overriding method createEditor"""
         val_type = index.sibling(index.row(), 1).data()
         self.sig_editor_creation_started.emit()
-        if index.column() < 3:
+        if index.column() != 3:
+            # Only values can be edited
             return None
         if self.show_warning(index):
             answer = QMessageBox.warning(
@@ -33,6 +33,7 @@
 """
 
 # Standard library imports
+from collections import OrderedDict
 import io
 from time import perf_counter
 
@@ -529,6 +530,223 @@ def reset(self):
         self.endResetModel()
 
 
+class RemoteDataFrame:
+    """
+    DataFrame that lives in a kernel and whose data is fetched by blocks.
+
+    Sorting and filtering are done by the kernel on the live object. Edited
+    values are kept until `commit` is called, which sends them back to the
+    kernel.
+    """
+
+    BLOCK_ROWS = ROWS_TO_LOAD
+    BLOCK_COLS = COLS_TO_LOAD
+
+    # Max number of blocks kept in memory
+    MAX_BLOCKS = 20
+
+    def __init__(self, info, shellwidget):
+        """
+        Parameters
+        ----------
+        info: dict
+            View information, as returned by the `open_dataframe_view`
+            method of Spyder-kernels.
+        shellwidget: ShellWidget
+            Console whose kernel has the DataFrame.
+        """
+        self.view_id = info['view_id']
+        self.shape = tuple(info['shape'])
+        self.type_name = info['type']
+        self.is_series = info['is_series']
+        self.levels = (info['column_levels'], info['index_levels'])
+        self.names = (info['column_names'], info['index_names'])
+        self.iloc = _RemoteDataFrameIndexer(self)
+        self.changes = {}
+
+        self._shellwidget = shellwidget
+        self._blocks = OrderedDict()
+        self._filters = {}
+
+    def get_value(self, row, column):
+        """Return the value shown in a cell."""
+        block = self._fetch_block(row, column)
+        position = block['rows'][row % self.BLOCK_ROWS]
+        if (position, column) in self.changes:
+            return self.changes[(position, column)]
+        return block['data'].iat[row % self.BLOCK_ROWS,
+                                 column % self.BLOCK_COLS]
+
+    def set_value(self, row, column, value):
+        """Set the value of a cell, which is sent to the kernel on commit."""
+        block = self._fetch_block(row, column)
+        position = block['rows'][row % self.BLOCK_ROWS]
+        self.changes[(position, column)] = value
+
+    def header(self, axis, x):
+        """Return the label of a column (axis 0) or row (axis 1)."""
+        if axis == 0:
+            labels = self._fetch_block(0, x)['columns']
+            return labels[x % self.BLOCK_COLS]
+        else:
+            labels = self._fetch_block(x, 0)['index']
+            return labels[x % self.BLOCK_ROWS]
+
+    def sort(self, column, ascending=True):
+        """Sort by a column, or by the index if `column` is -1."""
+        self._set_shape(
+            self._shellwidget.sort_dataframe_view(
+                self.view_id, column, ascending)
+        )
+
+    def get_filter(self, column):
+        """Return the text used to filter a column."""
+        return self._filters.get(column, '')
+
+    def set_filter(self, column, text):
+        """Show only the rows whose value in `column` contains `text`."""
+        self._set_shape(
+            self._shellwidget.filter_dataframe_view(self.view_id, column, text)
+        )
+        if text:
+            self._filters[column] = text
+        else:
+            self._filters.pop(column, None)
+
+    def commit(self):
+        """Send the edited values to the kernel."""
+        if self.changes:
+            self._shellwidget.set_dataframe_values(self.view_id, self.changes)
+            self.changes = {}
+
+    def close(self):
+        """Release the view in the kernel."""
+        self._shellwidget.close_dataframe_view(self.view_id)
+
+    def _set_shape(self, shape):
+        """Set a new shape, discarding the blocks retrieved so far."""
+        self.shape = tuple(shape)
+        self._blocks.clear()
+
+    def _get_block(self, rows, cols):
+        """Retrieve a block from the kernel."""
+        return self._shellwidget.get_dataframe_block(self.view_id, rows, cols)
+
+    def _fetch_block(self, row, column):
+        """Get the block that contains a cell, retrieving it if necessary."""
+        block_key = (row // self.BLOCK_ROWS, column // self.BLOCK_COLS)
+        if block_key in self._blocks:
+            self._blocks.move_to_end(block_key)
+            return self._blocks[block_key]
+
+        block_row, block_col = block_key
+        block = self._get_block(
+            (block_row * self.BLOCK_ROWS, (block_row + 1) * self.BLOCK_ROWS),
+            (block_col * self.BLOCK_COLS, (block_col + 1) * self.BLOCK_COLS))
+        block['columns'] = block['data'].columns.tolist()
+        block['index'] = block['data'].index.tolist()
+        self._blocks[block_key] = block
+        if len(self._blocks) > self.MAX_BLOCKS:
+            self._blocks.popitem(last=False)
+        return block
+
+
+class _RemoteDataFrameIndexer:
+    """
+    Positional indexer of a RemoteDataFrame.
+
+    It supports getting slices, which are retrieved from the kernel, and
+    setting single values.
+    """
+
+    def __init__(self, remote_df):
+        self._remote_df = remote_df
+
+    def __getitem__(self, key):
+        rows, cols = key
+        shape = self._remote_df.shape
+        return self._remote_df._get_block(
+            rows.indices(shape[0])[:2], cols.indices(shape[1])[:2])['data']
+
+    def __setitem__(self, key, value):
+        row, column = key
+        self._remote_df.set_value(row, column, value)
+
+
+class RemoteDataFrameModel(DataFrameModel):
+    """
+    DataFrame Table Model for DataFrames that live in a kernel.
+
+    Only the blocks of rows and columns shown in the view are retrieved.
+    """
+
+    def _axis_levels(self, axis):
+        """Return the number of levels of the columns (0) or rows (1)."""
+        return self.df.levels[axis]
+
+    def header(self, axis, x, level=0):
+        """Return the label of column or row x in the given level."""
+        label = self.df.header(axis, x)
+        if self.df.levels[axis] > 1:
+            return label[level]
+        return label
+
+    def name(self, axis, level):
+        """Return the labels of the levels if any."""
+        names = self.df.names[axis]
+        if len(names) > 1:
+            return names[level]
+        if names[0]:
+            return names[0]
+
+    def max_min_col_update(self):
+        """
+        Computing the range of columns would require going through the whole
+        DataFrame, so background colors are not available in this case.
+        """
+        pass
+
+    def get_value(self, row, column):
+        """Return the value of the DataFrame."""
+        try:
+            return self.df.get_value(row, column)
+        except Exception:
+            return None
+
+    def recalculate_index(self):
+        """Index labels are retrieved with each block."""
+        pass
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort the DataFrame in the kernel."""
+        ascending = order == Qt.AscendingOrder
+        try:
+            self.df.sort(column, ascending)
+        except Exception as e:
+            QMessageBox.critical(self.dialog, "Error",
+                                 "%s: %s" % (type(e).__name__, str(e)))
+            return False
+        self.reset()
+        return True
+
+    def get_filter(self, column):
+        """Return the text used to filter a column."""
+        return self.df.get_filter(column)
+
+    def set_filter(self, column, text):
+        """Filter the rows of the DataFrame in the kernel."""
+        try:
+            self.df.set_filter(column, text)
+        except Exception as e:
+            QMessageBox.critical(self.dialog, "Error",
+                                 "%s: %s" % (type(e).__name__, str(e)))
+            return False
+        self.total_rows = self.df.shape[0]
+        self.rows_loaded = min(self.total_rows, ROWS_TO_LOAD)
+        self.reset()
+        return True
+
+
 class DataFrameView(QTableView, SpyderConfigurationAccessor):
     """
     Data Frame view class.
@@ -932,11 +1150,17 @@ def setup_and_check(self, data, title=''):
         self.layout.setSpacing(0)
         self.layout.setContentsMargins(20, 20, 20, 0)
         self.setLayout(self.layout)
+        if isinstance(data, RemoteDataFrame):
+            type_name = data.type_name
+        else:
+            type_name = data.__class__.__name__
         if title:
-            title = to_text_string(title) + " - %s" % data.__class__.__name__
+            title = to_text_string(title) + " - %s" % type_name
         else:
-            title = _("%s editor") % data.__class__.__name__
-        if isinstance(data, pd.Series):
+            title = _("%s editor") % type_name
+        if isinstance(data, RemoteDataFrame):
+            self.is_series = data.is_series
+        elif isinstance(data, pd.Series):
             self.is_series = True
             data = data.to_frame()
         elif isinstance(data, pd.Index):
@@ -957,7 +1181,10 @@ def setup_and_check(self, data, title=''):
         self.create_table_index()
 
         # Create the model and view of the data
-        self.dataModel = DataFrameModel(data, parent=self)
+        if isinstance(data, RemoteDataFrame):
+            self.dataModel = RemoteDataFrameModel(data, parent=self)
+        else:
+            self.dataModel = DataFrameModel(data, parent=self)
         self.dataModel.dataChanged.connect(self.save_and_close_enable)
         self.create_data_table()
 
@@ -1003,6 +1230,11 @@ def setup_and_check(self, data, title=''):
         self.bgcolor_global.stateChanged.connect(self.dataModel.colum_avg)
         btn_layout.addWidget(self.bgcolor_global)
 
+        if isinstance(data, RemoteDataFrame):
+            btn_filter = QPushButton(_("Filter"))
+            btn_layout.addWidget(btn_filter)
+            btn_filter.clicked.connect(self.filter_column)
+
         btn_layout.addStretch()
 
         self.btn_save_and_close = QPushButton(_('Save and Close'))
@@ -1317,12 +1549,27 @@ def change_format(self):
             self.dataModel.set_format_spec(format_spec)
             self.set_conf('dataframe_format', format_spec)
 
+    @Slot()
+    def filter_column(self):
+        """
+        Ask user for a text to filter the rows by the current column.
+        """
+        column = max(self.dataTable.currentIndex().column(), 0)
+        text, valid = QInputDialog.getText(
+            self, _('Filter'),
+            _("Show rows whose value in this column contains"),
+            QLineEdit.Normal, self.dataModel.get_filter(column))
+        if valid and self.dataModel.set_filter(column, str(text)):
+            self._sort_update()
+
     def get_value(self):
         """Return modified Dataframe -- this is *not* a copy"""
         # It is import to avoid accessing Qt C++ object as it has probably
         # already been destroyed, due to the Qt.WA_DeleteOnClose attribute
         df = self.dataModel.get_data()
-        if self.is_series:
+        if isinstance(df, RemoteDataFrame):
+            return df
+        elif self.is_series:
             return df.iloc[:, 0]
         else:
             return df
@@ -19,7 +19,7 @@
 # Third library imports
 from qtpy import PYQT5
 from qtpy.compat import getopenfilenames, getsavefilename
-from qtpy.QtCore import Qt, Signal, Slot
+from qtpy.QtCore import Qt, QTimer, Signal, Slot
 from qtpy.QtGui import QCursor
 from qtpy.QtWidgets import (QApplication, QInputDialog, QMessageBox,
                             QVBoxLayout, QStackedLayout, QWidget)
@@ -32,7 +32,8 @@
 from spyder.api.translations import _
 from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.config.utils import IMPORT_EXT
-from spyder.widgets.collectionseditor import RemoteCollectionsEditorTableView
+from spyder.widgets.collectionseditor import (
+    MEMORY_COLUMN, RemoteCollectionsEditorTableView)
 from spyder.plugins.variableexplorer.widgets.importwizard import ImportWizard
 from spyder.utils import encoding
 from spyder.utils.misc import getcwd_or_home, remove_backslashes
@@ -45,6 +46,16 @@
 # Max time before giving up when making a blocking call to the kernel
 CALL_KERNEL_TIMEOUT = 30
 
+# Number of variables requested to the kernel at a time
+VIEW_PAGE_SIZE = 1000
+
+# Time to wait after the finder text changes before filtering the variables
+# in the kernel (ms)
+VIEW_FILTER_DELAY = 300
+
+# Kernel sort keys of the columns that can be sorted there
+VIEW_SORT_KEYS = {0: 'name', 1: 'type', MEMORY_COLUMN: 'memory'}
+
 
 class NamespaceBrowser(QWidget, SpyderWidgetMixin):
     """
@@ -69,6 +80,27 @@ def __init__(self, parent):
         # Attributes
         self.filename = None
 
+        # Version of the namespace view, used to apply the deltas sent by
+        # the kernel
+        self._namespace_view_version = None
+
+        # Filter, sort order and page of the variables sent by the kernel,
+        # which are only used when they don't fit in a single page. See
+        # `SpyderKernel.set_namespace_view_spec` in Spyder-kernels.
+        self._view_spec = {
+            'filter': '',
+            'sort': 'name',
+            'ascending': True,
+            'offset': 0,
+            'limit': VIEW_PAGE_SIZE,
+        }
+        self._view_total = 0
+        self._sent_view_filter = ''
+        self._view_spec_timer = QTimer(self)
+        self._view_spec_timer.setSingleShot(True)
+        self._view_spec_timer.setInterval(VIEW_FILTER_DELAY)
+        self._view_spec_timer.timeout.connect(self._update_view_spec)
+
         # Widgets
         self.editor = None
         self.shellwidget = None
@@ -92,6 +124,14 @@ def do_find(self, text):
         if self.editor is not None:
             self.editor.do_find(text)
 
+        # Filter in the kernel the variables that were not sent to us
+        text = text.replace(' ', '').lower()
+        if text != self._view_spec['filter']:
+            self._view_spec['filter'] = text
+            self._view_spec['limit'] = VIEW_PAGE_SIZE
+            if self._is_paged() or self._sent_view_filter:
+                self._view_spec_timer.start()
+
     def finder_is_visible(self):
         """Check if the finder is visible."""
         if self.finder is None:
@@ -134,6 +174,10 @@ def setup(self):
                 self.sig_start_spinner_requested)
             self.editor.sig_editor_shown.connect(
                 self.sig_stop_spinner_requested)
+            self.editor.source_model.sig_fetch_more_requested.connect(
+                self.fetch_more)
+            self.editor.horizontalHeader().sectionClicked.connect(
+                self._sort_in_kernel)
 
             self.finder.sig_find_text.connect(self.do_find)
             self.finder.sig_hide_finder_requested.connect(
@@ -193,24 +237,24 @@ def update_view(self, kernel_state):
             A new kernel state. The structure of this dictionary is defined in
             the `SpyderKernel.get_state` method of Spyder-kernels.
         """
-        if "namespace_view" in kernel_state:
-            self.process_remote_view(kernel_state.pop("namespace_view"))
-        if "var_properties" in kernel_state:
-            self.set_var_properties(kernel_state.pop("var_properties"))
+        if "namespace_view_delta" in kernel_state:
+            self.process_namespace_view_delta(
+                kernel_state.pop("namespace_view_delta"))
+        if "memory_usage" in kernel_state:
+            self.set_memory_usage(kernel_state.pop("memory_usage"))
 
-    def refresh_namespacebrowser(self, *, interrupt=True):
+    def refresh_namespacebrowser(self, *, interrupt=True, full=True):
         """Refresh namespace browser"""
         if not self.shellwidget.spyder_kernel_ready:
             return
         self.shellwidget.call_kernel(
             interrupt=interrupt,
-            callback=self.process_remote_view
-        ).get_namespace_view()
-
-        self.shellwidget.call_kernel(
+            callback=self.process_namespace_view_delta
+        ).get_namespace_view_delta(full=full)
+        self.shellwidget.call_kernel_async(
             interrupt=interrupt,
-            callback=self.set_var_properties
-        ).get_var_properties()
+            callback=self.set_memory_usage
+        ).get_memory_usage()
 
     def set_namespace_view_settings(self, interrupt=True):
         """Set the namespace view settings"""
@@ -221,8 +265,24 @@ def set_namespace_view_settings(self, interrupt=True):
             interrupt=interrupt
         ).set_namespace_view_settings(settings)
 
+    def set_namespace_view_spec(self, interrupt=True):
+        """Set the filter, sort order and page of the namespace view"""
+        if not self.shellwidget.spyder_kernel_ready:
+            return
+        self._sent_view_filter = self._view_spec['filter']
+        self.shellwidget.call_kernel(
+            interrupt=interrupt
+        ).set_namespace_view_spec(dict(self._view_spec))
+
+    def fetch_more(self):
+        """Request the next page of variables to the kernel."""
+        self._view_spec['limit'] += VIEW_PAGE_SIZE
+        self.set_namespace_view_spec()
+        self.refresh_namespacebrowser(full=False)
+
     def setup_kernel(self):
         self.set_namespace_view_settings(interrupt=False)
+        self.set_namespace_view_spec(interrupt=False)
         self.refresh_namespacebrowser(interrupt=False)
 
     def process_remote_view(self, remote_view):
@@ -230,6 +290,49 @@ def process_remote_view(self, remote_view):
         if remote_view is not None:
             self.set_data(remote_view)
 
+    def process_namespace_view_delta(self, delta):
+        """
+        Apply the changes in the namespace view sent by the kernel.
+
+        Parameters
+        ----------
+        delta: dict
+            The structure of this dictionary is defined in the
+            `SpyderKernel.get_namespace_view_delta` method of Spyder-kernels.
+        """
+        if delta is None:
+            return
+
+        if delta['base_version'] is None:
+            # Full view
+            view = {}
+            properties = {}
+        elif delta['base_version'] == self._namespace_view_version:
+            view = dict(self.editor.source_model.get_data() or {})
+            properties = dict(self.editor.var_properties or {})
+        else:
+            # A previous delta was missed, so ask for the full view
+            self._namespace_view_version = None
+            self.refresh_namespacebrowser()
+            return
+
+        for name in delta['removed']:
+            view.pop(name, None)
+            properties.pop(name, None)
+        view.update(delta['view'])
+        properties.update(delta['var_properties'])
+
+        self._namespace_view_version = delta['version']
+        self._view_total = delta.get('total', len(view))
+        self.editor.source_model.remote_total = self._view_total
+        self.process_remote_view(view)
+        self.set_var_properties(properties)
+
+    def set_memory_usage(self, usage):
+        """Set the memory used by the variables."""
+        if usage is not None:
+            self.editor.source_model.set_memory_usage(usage)
+
     def set_var_properties(self, properties):
         """Set properties of variables"""
         if properties is not None:
@@ -241,6 +344,45 @@ def set_data(self, data):
             self.editor.set_data(data)
             self.editor.adjust_columns()
 
+            # Keep the order used by the kernel to select the page
+            if self._is_paged() and self._view_spec['sort'] != 'name':
+                column = {
+                    key: column for column, key in VIEW_SORT_KEYS.items()
+                }[self._view_spec['sort']]
+                order = (
+                    Qt.AscendingOrder if self._view_spec['ascending']
+                    else Qt.DescendingOrder
+                )
+                self.editor.sortByColumn(column, order)
+
+    def _is_paged(self):
+        """Check if the kernel doesn't send all the variables at once."""
+        return self._view_total > self._view_spec['limit']
+
+    def _update_view_spec(self):
+        """Send the view spec to the kernel and get the variables again."""
+        self.set_namespace_view_spec()
+        self.refresh_namespacebrowser(full=False)
+
+    def _sort_in_kernel(self, column):
+        """Sort the variables in the kernel, if they're paged."""
+        sort = VIEW_SORT_KEYS.get(column)
+        if sort is None:
+            return
+        ascending = (
+            self.editor.horizontalHeader().sortIndicatorOrder()
+            == Qt.AscendingOrder
+        )
+        if (
+            sort == self._view_spec['sort']
+            and ascending == self._view_spec['ascending']
+        ):
+            return
+        self._view_spec['sort'] = sort
+        self._view_spec['ascending'] = ascending
+        if self._is_paged():
+            self._update_view_spec()
+
     @Slot(list)
     def import_data(self, filenames=None):
         """Import data from text file."""
@@ -349,7 +491,8 @@ def load_data(self, filename, ext):
                 blocking=True,
                 display_error=True,
                 timeout=CALL_KERNEL_TIMEOUT).load_data(
-                    filename, ext, overwrite=overwrite)
+                    filename, ext, overwrite=overwrite,
+                    lazy=self.get_conf('lazy_load'))
         except ImportError as msg:
             module = str(msg).split("'")[1]
             msg = _("Spyder is unable to open the file "
@@ -25,7 +25,7 @@
 
 # Local imports
 from spyder.plugins.variableexplorer.widgets.arrayeditor import (
-    ArrayEditor, ArrayModel)
+    ArrayEditor, ArrayModel, RemoteArray)
 
 
 # =============================================================================
@@ -268,6 +268,52 @@ def test_arrayeditor_edit_2d_array(qtbot):
     assert np.sum(diff_arr != dlg.get_value()) == 2
 
 
+@pytest.mark.skipif(sys.platform == 'darwin', reason="It fails on macOS")
+def test_arrayeditor_edit_remote_array(qtbot):
+    """
+    Test that arrays are retrieved by blocks and only edited values are sent
+    back when using a RemoteArray.
+    """
+    arr = np.arange(RemoteArray.BLOCK_ROWS * 3, dtype=float)
+    arr = arr.reshape(-1, 3)
+    info = {
+        'shape': arr.shape,
+        'dtype': arr.dtype,
+        'writeable': True,
+        'is_masked': False,
+        'is_record': False,
+        'vmin': arr.min(),
+        'vmax': arr.max(),
+        'has_inf': False
+    }
+    get_block = Mock(side_effect=lambda rows, cols: arr[slice(*rows),
+                                                        slice(*cols)])
+    set_values = Mock()
+
+    remote_array = RemoteArray(info, get_block, set_values)
+    dlg = ArrayEditor()
+    assert dlg.setup_and_check(remote_array, 'Remote array')
+    with qtbot.waitExposed(dlg):
+        dlg.show()
+    view = dlg.arraywidget.view
+
+    # Only the first block was retrieved to show the array
+    get_block.assert_called_once_with(
+        (0, RemoteArray.BLOCK_ROWS), (0, RemoteArray.BLOCK_COLS))
+    assert view.model().data(view.model().index(2, 1)) == '7'
+
+    qtbot.keyPress(view, Qt.Key_Down)
+    qtbot.keyPress(view, Qt.Key_Right)
+    qtbot.keyClicks(view, '100')
+    qtbot.keyPress(view, Qt.Key_Return)
+    dlg.accept()
+
+    # Only the edited value is sent back
+    value = dlg.get_value()
+    value.commit()
+    set_values.assert_called_once_with({(1, 1): 100})
+
+
 @pytest.mark.skipif(
     sys.platform.startswith('linux'),
     reason="Sometimes fails on Linux ")
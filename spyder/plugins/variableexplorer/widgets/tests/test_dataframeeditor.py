@@ -26,13 +26,14 @@
 import pytest
 from qtpy.QtGui import QColor
 from qtpy.QtCore import Qt, QTimer
+from spyder_kernels.utils.dfview import DataFrameView
 
 # Local imports
 from spyder.utils.programs import is_module_installed
 from spyder.utils.test import close_message_box
 from spyder.plugins.variableexplorer.widgets import dataframeeditor
 from spyder.plugins.variableexplorer.widgets.dataframeeditor import (
-    DataFrameEditor, DataFrameModel)
+    DataFrameEditor, DataFrameModel, RemoteDataFrame)
 
 
 # =============================================================================
@@ -63,6 +64,24 @@ def data_header(dfh, i, j, role=Qt.DisplayRole):
 def data_index(dfi, i, j, role=Qt.DisplayRole):
     return dfi.data(dfi.createIndex(i, j), role)
 
+def remote_dataframe(df):
+    """Create a RemoteDataFrame whose kernel is simulated with mocks."""
+    view = DataFrameView(df)
+    info = view.get_info()
+    info['view_id'] = 0
+    shellwidget = Mock()
+    shellwidget.get_dataframe_block = Mock(
+        side_effect=lambda view_id, rows, cols: view.get_block(rows, cols))
+    shellwidget.sort_dataframe_view = Mock(
+        side_effect=lambda view_id, column, ascending: (
+            view.sort(column, ascending), view.shape)[1])
+    shellwidget.filter_dataframe_view = Mock(
+        side_effect=lambda view_id, column, text: (
+            view.filter(column, text), view.shape)[1])
+    shellwidget.set_dataframe_values = Mock(
+        side_effect=lambda view_id, changes: view.set_values(changes))
+    return RemoteDataFrame(info, shellwidget)
+
 def generate_pandas_indexes():
     """Creates a dictionary of many possible pandas indexes."""
     # Float64Index was removed in Pandas 2.0
@@ -756,5 +775,48 @@ def test_no_convert_strings_to_unicode():
     assert data(dfm, 0, 0) != u'файла'
 
 
+def test_remote_dataframe(qtbot):
+    """
+    Test that DataFrames are retrieved by blocks, sorted and filtered in the
+    kernel, and that only edited values are sent back.
+    """
+    df = DataFrame({'a': numpy.arange(1000, 0, -1), 'b': ['x', 'y'] * 500})
+    remote_df = remote_dataframe(df)
+    shellwidget = remote_df._shellwidget
+
+    editor = DataFrameEditor(None)
+    assert editor.setup_and_check(remote_df, title='df')
+    qtbot.addWidget(editor)
+    dfm = editor.model()
+    index = editor.table_index.model()
+
+    # Only the first block was retrieved
+    assert dfm.rowCount() == dataframeeditor.ROWS_TO_LOAD
+    assert data(dfm, 1, 0) == '999'
+    assert data_index(index, 1, 0) == '1'
+    shellwidget.get_dataframe_block.assert_called_once_with(
+        0, (0, RemoteDataFrame.BLOCK_ROWS), (0, RemoteDataFrame.BLOCK_COLS))
+
+    # Sort in the kernel
+    assert dfm.sort(0)
+    editor._sort_update()
+    assert data(dfm, 0, 0) == '1'
+    assert data_index(editor.table_index.model(), 0, 0) == '999'
+
+    # Filter in the kernel
+    assert dfm.set_filter(1, 'y')
+    assert dfm.rowCount() == 500
+    assert data(dfm, 0, 1) == 'y'
+
+    # Edit values
+    dfm.setData(dfm.createIndex(0, 0), '10')
+    assert data(dfm, 0, 0) == '10'
+    assert df['a'].iloc[-1] == 1
+    editor.accept()
+    value = editor.get_value()
+    value.commit()
+    assert df['a'].iloc[-1] == 10
+
+
 if __name__ == "__main__":
     pytest.main()
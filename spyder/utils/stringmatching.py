@@ -32,10 +32,11 @@ def get_search_regex(query, ignore_case=True):
 
     Notes
     -----
-    This function adds '.*' between the query characters and compiles the
-    resulting regular expression.
+    This function escapes the query characters, adds '.*' between them and
+    compiles the resulting regular expression. Namespace views filtered by
+    the kernel use the same expression.
     """
-    regex_text = [char for char in query if char != ' ']
+    regex_text = [re.escape(char) for char in query if char != ' ']
     regex_text = '.*'.join(regex_text)
 
     regex = u'({0})'.format(regex_text)
@@ -15,7 +15,7 @@
 import pytest
 
 # Local imports
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import get_search_regex, get_search_scores
 
 TEST_FILE = os.path.join(os.path.dirname(__file__), 'data/example.py')
 
@@ -216,5 +216,13 @@ def test_stringmatching_order_filter():
                                      'use previous <b>lay</b>out', 400113)]
 
 
+def test_get_search_regex():
+    """Test that the characters of the query are matched literally."""
+    assert get_search_regex('a.b').search('xa_b.b')
+    assert not get_search_regex('a.b').search('axb')
+    assert get_search_regex('f(x').search('f(1, x)')
+    assert get_search_regex('[0]').search('values[0]')
+
+
 if __name__ == "__main__":
     pytest.main()
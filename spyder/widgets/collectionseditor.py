@@ -20,7 +20,9 @@
 
 # Standard library imports
 import datetime
+import functools
 import io
+import operator
 import re
 import sys
 import warnings
@@ -32,9 +34,11 @@
 from qtpy.QtGui import QColor, QKeySequence
 from qtpy.QtWidgets import (
     QApplication, QHBoxLayout, QHeaderView, QInputDialog, QLineEdit, QMenu,
-    QMessageBox, QPushButton, QTableView, QVBoxLayout, QWidget)
+    QMessageBox, QProgressDialog, QPushButton, QTableView, QVBoxLayout,
+    QWidget)
 from spyder_kernels.utils.lazymodules import (
     FakeObject, numpy as np, pandas as pd, PIL)
+from spyder_kernels.utils.memory import format_bytes
 from spyder_kernels.utils.misc import fix_reference_name
 from spyder_kernels.utils.nsview import (
     display_to_value, get_human_readable_type, get_numeric_numpy_types,
@@ -56,6 +60,10 @@
 from spyder.utils.stringmatching import get_search_scores, get_search_regex
 from spyder.plugins.variableexplorer.widgets.collectionsdelegate import (
     CollectionsDelegate)
+from spyder.plugins.variableexplorer.widgets.arrayeditor import (
+    ArrayEditor, LARGE_SIZE, RemoteArray)
+from spyder.plugins.variableexplorer.widgets.dataframeeditor import (
+    DataFrameEditor, RemoteDataFrame)
 from spyder.plugins.variableexplorer.widgets.importwizard import ImportWizard
 from spyder.widgets.helperwidgets import CustomSortFilterProxy
 from spyder.plugins.variableexplorer.widgets.basedialog import BaseDialog
@@ -70,6 +78,11 @@
 LARGE_NROWS = 100
 ROWS_TO_LOAD = 50
 
+# Column of the memory used by variables, which is only shown for remote
+# data. It comes after the hidden Score column, but is moved next to the
+# Size one in the view.
+MEMORY_COLUMN = 5
+
 # Numeric types
 NUMERIC_TYPES = (int, float) + get_numeric_numpy_types()
 
@@ -132,6 +145,12 @@ class ReadOnlyCollectionsModel(QAbstractTableModel, SpyderFontsMixin):
 
     sig_setting_data = Signal()
 
+    sig_fetch_more_requested = Signal()
+    """
+    This signal is emitted to request more remote data when all rows were
+    loaded but there are more variables in the kernel.
+    """
+
     def __init__(self, parent, data, title="", names=False,
                  minmax=False, remote=False):
         QAbstractTableModel.__init__(self, parent)
@@ -152,6 +171,11 @@ def __init__(self, parent, data, title="", names=False,
             self.title = self.title + ' - '
         self.sizes = []
         self.types = []
+        self.memory_usage = {}
+        self.memory_total = None
+        # Number of variables in the kernel, of which only a page is shown
+        self.remote_total = None
+        self._fetch_more_pending = False
         self.set_data(data)
 
     def get_data(self):
@@ -208,6 +232,7 @@ def set_data(self, data, coll_filter=None):
             self.title += data_type
 
         self.total_rows = len(self.keys)
+        self._fetch_more_pending = False
         if self.total_rows > LARGE_NROWS:
             self.rows_loaded = ROWS_TO_LOAD
         else:
@@ -257,6 +282,25 @@ def set_size_and_type(self, start=None, stop=None):
             self.sizes = sizes
             self.types = types
 
+    def set_memory_usage(self, usage):
+        """
+        Set the memory used by the variables.
+
+        Parameters
+        ----------
+        usage: dict
+            The structure of this dictionary is defined in the
+            `SpyderKernel.get_memory_usage` method of Spyder-kernels.
+        """
+        self.memory_usage = usage['sizes']
+        self.memory_total = usage['total']
+        if self.rowCount():
+            self.dataChanged.emit(
+                self.createIndex(0, MEMORY_COLUMN),
+                self.createIndex(self.rowCount() - 1, MEMORY_COLUMN))
+        self.headerDataChanged.emit(Qt.Horizontal, MEMORY_COLUMN,
+                                    MEMORY_COLUMN)
+
     def load_all(self):
         """Load all the data."""
         self.fetchMore(number_to_fetch=self.total_rows)
@@ -309,7 +353,9 @@ def all_string(listlike):
 
     def columnCount(self, qindex=QModelIndex()):
         """Array column number"""
-        if self._parent.proxy_model:
+        if self.remote:
+            return 6
+        elif self._parent.proxy_model:
             return 5
         else:
             return 4
@@ -324,6 +370,8 @@ def rowCount(self, index=QModelIndex()):
     def canFetchMore(self, index=QModelIndex()):
         if self.total_rows > self.rows_loaded:
             return True
+        elif self._can_fetch_more_remote():
+            return True
         else:
             return False
 
@@ -331,7 +379,11 @@ def fetchMore(self, index=QModelIndex(), number_to_fetch=None):
         # fetch more data
         reminder = self.total_rows - self.rows_loaded
         if reminder <= 0:
-            # Everything is loaded
+            # Everything is loaded, so ask for the next page of variables
+            # when scrolling
+            if number_to_fetch is None and self._can_fetch_more_remote():
+                self._fetch_more_pending = True
+                self.sig_fetch_more_requested.emit()
             return
         if number_to_fetch is not None:
             items_to_fetch = min(reminder, number_to_fetch)
@@ -344,6 +396,14 @@ def fetchMore(self, index=QModelIndex(), number_to_fetch=None):
         self.rows_loaded += items_to_fetch
         self.endInsertRows()
 
+    def _can_fetch_more_remote(self):
+        """Check if there are variables in the kernel that are not shown."""
+        return (
+            self.remote_total is not None
+            and self.remote_total > self.total_rows
+            and not self._fetch_more_pending
+        )
+
     def get_index_from_key(self, key):
         try:
             return self.createIndex(self.keys.index(key), 0)
@@ -362,6 +422,8 @@ def get_value(self, index):
             return self.types[index.row()]
         elif index.column() == 2:
             return self.sizes[index.row()]
+        elif index.column() == MEMORY_COLUMN:
+            return self.memory_usage.get(self.keys[index.row()])
         else:
             return self._data[self.keys[index.row()]]
 
@@ -370,7 +432,7 @@ def get_bgcolor(self, index):
         if index.column() == 0:
             color = QColor(Qt.lightGray)
             color.setAlphaF(.05)
-        elif index.column() < 3:
+        elif index.column() < 3 or index.column() == MEMORY_COLUMN:
             color = QColor(Qt.lightGray)
             color.setAlphaF(.2)
         else:
@@ -413,6 +475,17 @@ def data(self, index, role=Qt.DisplayRole):
             # has been defined. This column however should always remain
             # hidden.
             return to_qvariant(self.scores[index.row()])
+        if index.column() == MEMORY_COLUMN:
+            if role == Qt.UserRole:
+                # Variables whose size is not known yet are sorted first
+                return to_qvariant(-1 if value is None else value)
+            if role in (Qt.DisplayRole, Qt.ToolTipRole):
+                if value is None:
+                    return to_qvariant("")
+                return to_qvariant(format_bytes(value))
+            if role == Qt.TextAlignmentRole:
+                return to_qvariant(int(Qt.AlignRight | Qt.AlignVCenter))
+            value = ""
         if index.column() == 3 and self.remote:
             value = value['view']
         if index.column() == 3:
@@ -457,8 +530,18 @@ def headerData(self, section, orientation, role=Qt.DisplayRole):
             return to_qvariant()
         i_column = int(section)
         if orientation == Qt.Horizontal:
-            headers = (self.header0, _("Type"), _("Size"), _("Value"),
-                       _("Score"))
+            header0 = self.header0
+            if (
+                self.remote_total is not None
+                and self.remote_total > self.total_rows
+            ):
+                header0 += " ({}/{})".format(self.total_rows,
+                                             self.remote_total)
+            memory = _("Memory")
+            if self.memory_total is not None:
+                memory += " ({})".format(format_bytes(self.memory_total))
+            headers = (header0, _("Type"), _("Size"), _("Value"),
+                       _("Score"), memory)
             return to_qvariant(headers[i_column])
         else:
             return to_qvariant()
@@ -529,7 +612,7 @@ def type_to_color(self, python_type, numpy_type):
     def get_bgcolor(self, index):
         """Background color depending on value."""
         value = self.get_value(index)
-        if index.column() < 3:
+        if index.column() < 3 or index.column() == MEMORY_COLUMN:
             color = ReadOnlyCollectionsModel.get_bgcolor(self, index)
         else:
             if self.remote:
@@ -547,7 +630,7 @@ def setData(self, index, value, role=Qt.EditRole):
         """Cell content change"""
         if not index.isValid():
             return False
-        if index.column() < 3:
+        if index.column() < 3 or index.column() == MEMORY_COLUMN:
             return False
         value = display_to_value(value, self.get_value(index),
                                  ignore_errors=True)
@@ -893,6 +976,8 @@ def adjust_columns(self):
         if self.automatic_column_width:
             for col in range(3):
                 self.resizeColumnToContents(col)
+            if self.source_model.remote:
+                self.resizeColumnToContents(MEMORY_COLUMN)
 
     def set_data(self, data):
         """Set table data"""
@@ -1593,7 +1678,86 @@ def set_value(self, index, value):
         if index.isValid():
             source_index = index.model().mapToSource(index)
             name = source_index.model().keys[source_index.row()]
-            self.parent().new_value(name, value)
+            if isinstance(value, (RemoteArray, RemoteDataFrame)):
+                # Only send back the values edited in the Array and
+                # DataFrame editors
+                value.commit()
+                self.parent().namespacebrowser.refresh_namespacebrowser()
+            else:
+                self.parent().new_value(name, value)
+
+    def createEditor(self, parent, option, index, object_explorer=False):
+        """Overriding method createEditor"""
+        if index.column() == 3 and not object_explorer:
+            source_index = index.model().mapToSource(index)
+            name = source_index.model().keys[source_index.row()]
+            if self.parent().is_large_array(name):
+                try:
+                    info = self.parent().get_array_info(name)
+                except Exception:
+                    info = None
+                if info is not None and RemoteArray.is_supported(info):
+                    return self.create_remote_array_editor(
+                        parent, index, name, info)
+            elif self.parent().is_large_data_frame(name):
+                return self.create_remote_dataframe_editor(parent, index, name)
+
+        return super().createEditor(
+            parent, option, index, object_explorer=object_explorer)
+
+    def create_remote_array_editor(self, parent, index, name, info):
+        """
+        Show an array in the Array Editor without retrieving all its data.
+        """
+        self.sig_editor_creation_started.emit()
+        value = RemoteArray(
+            info,
+            get_block=functools.partial(self.parent().get_array_block, name),
+            set_values=functools.partial(self.parent().set_array_values, name)
+        )
+        readonly = self.parent().readonly
+        editor = ArrayEditor(parent=parent)
+        if not editor.setup_and_check(value, title=name, readonly=readonly):
+            self.sig_editor_shown.emit()
+            return
+        self.create_dialog(editor, dict(model=index.model(), editor=editor,
+                                        key=name, readonly=readonly))
+
+    def create_remote_dataframe_editor(self, parent, index, name):
+        """
+        Show a DataFrame or Series in the DataFrame Editor without retrieving
+        all its data.
+
+        Sorting, filtering and paging are done by the kernel.
+        """
+        self.sig_editor_creation_started.emit()
+        try:
+            info = self.parent().shellwidget.open_dataframe_view(name)
+        except Exception:
+            self.sig_editor_shown.emit()
+            return
+        value = RemoteDataFrame(info, self.parent().shellwidget)
+        readonly = self.parent().readonly
+        editor = DataFrameEditor(parent=parent)
+        if not editor.setup_and_check(value, title=name):
+            value.close()
+            self.sig_editor_shown.emit()
+            return
+        self.create_dialog(editor, dict(model=index.model(), editor=editor,
+                                        key=name, readonly=readonly,
+                                        remote_value=value))
+
+    def editor_accepted(self, editor_id):
+        remote_value = self._editors.get(editor_id, {}).get('remote_value')
+        super().editor_accepted(editor_id)
+        if remote_value is not None:
+            remote_value.close()
+
+    def editor_rejected(self, editor_id):
+        remote_value = self._editors.get(editor_id, {}).get('remote_value')
+        super().editor_rejected(editor_id)
+        if remote_value is not None:
+            remote_value.close()
 
 
 class RemoteCollectionsEditorTableView(BaseTableView):
@@ -1629,6 +1793,7 @@ def __init__(self, parent, data, shellwidget=None, remote_editing=False,
         self.setModel(self.proxy_model)
 
         self.hideColumn(4)  # Column 4 for Score
+        self.horizontalHeader().moveSection(MEMORY_COLUMN, 3)
 
         self.delegate = RemoteCollectionsDelegate(self)
         self.delegate.sig_free_memory_requested.connect(
@@ -1645,9 +1810,84 @@ def __init__(self, parent, data, shellwidget=None, remote_editing=False,
 
     # ------ Remote/local API -------------------------------------------------
     def get_value(self, name):
-        """Get the value of a variable"""
-        value = self.shellwidget.get_value(name)
-        return value
+        """
+        Get the value of a variable.
+
+        A progress dialog is shown while large values are being received,
+        from which the transfer can be cancelled.
+        """
+        kernel_handler = self.shellwidget.kernel_handler
+        if kernel_handler is None:
+            return self.shellwidget.get_value(name)
+        kernel_comm = kernel_handler.kernel_comm
+        progress_dialog = None
+
+        def update_progress(call_id, call_name, received, total):
+            nonlocal progress_dialog
+            if call_name != 'get_value':
+                return
+            if progress_dialog is None:
+                # Only values that are streamed show the dialog
+                progress_dialog = QProgressDialog(
+                    _("Retrieving <tt>{}</tt>...").format(name),
+                    _("Cancel"), 0, 100, self)
+                progress_dialog.setWindowTitle(_("Variable Explorer"))
+                progress_dialog.setWindowModality(Qt.WindowModal)
+                progress_dialog.setMinimumDuration(500)
+                progress_dialog.setAutoClose(False)
+                progress_dialog.canceled.connect(
+                    lambda: kernel_comm.cancel_call(call_id))
+            progress_dialog.setValue(int(100 * received / total))
+
+        kernel_comm.sig_stream_progress.connect(update_progress)
+        try:
+            return self.shellwidget.get_value(name)
+        finally:
+            kernel_comm.sig_stream_progress.disconnect(update_progress)
+            if progress_dialog is not None:
+                progress_dialog.close()
+                progress_dialog.deleteLater()
+
+    def get_array_info(self, name):
+        """Get the information needed to show an array"""
+        return self.shellwidget.get_array_info(name)
+
+    def get_array_block(self, name, rows, cols):
+        """Get a block of an array"""
+        return self.shellwidget.get_array_block(name, rows, cols)
+
+    def set_array_values(self, name, changes):
+        """Set individual values of an array"""
+        self.shellwidget.set_array_values(name, changes)
+
+    def is_large_array(self, name):
+        """
+        Return True if variable is an array too large to be retrieved at
+        once to show it.
+        """
+        if not self.var_properties.get(name, {}).get('is_array'):
+            return False
+        shape = self.get_array_shape(name)
+        if not shape:
+            return False
+        return functools.reduce(operator.mul, shape) > LARGE_SIZE
+
+    def is_large_data_frame(self, name):
+        """
+        Return True if variable is a DataFrame or Series too large to be
+        retrieved at once to show it.
+        """
+        properties = self.var_properties.get(name, {})
+        if not (properties.get('is_data_frame') or
+                properties.get('is_series')):
+            return False
+        try:
+            size = self.source_model.get_data()[name]['size']
+            if isinstance(size, tuple):
+                size = functools.reduce(operator.mul, size)
+            return size > LARGE_SIZE
+        except Exception:
+            return False
 
     def new_value(self, name, value):
         """Create new value in data"""
@@ -1823,6 +2063,12 @@ def lessThan(self, left, right):
         This functions enables sorting of the main variable editor table,
         which does not rely on 'self.sort()'.
         """
+        if left.column() == MEMORY_COLUMN:
+            # Sort by number of bytes instead of by their formatted string
+            leftData = self.sourceModel().data(left, Qt.UserRole)
+            rightData = self.sourceModel().data(right, Qt.UserRole)
+            return leftData < rightData
+
         leftData = self.sourceModel().data(left)
         rightData = self.sourceModel().data(right)
         try: